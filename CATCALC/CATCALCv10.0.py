@@ -4,8 +4,24 @@ import math
 import cmath
 import random
 import decimal
-from decimal import Decimal, getcontext
+from decimal import Decimal, getcontext, localcontext
 import sys
+import os
+import mmap
+import time
+
+# 几万位的常数要转成字符串，不限制整数位数喵~
+if hasattr(sys, 'set_int_max_str_digits'):
+    sys.set_int_max_str_digits(0)
+
+# ------------------ 可选的大整数加速 ------------------
+try:
+    import gmpy2
+    BIGINT = gmpy2.mpz
+    GMPY2_AVAILABLE = True
+except ImportError:
+    BIGINT = int
+    GMPY2_AVAILABLE = False
 
 # ------------------ 猫娘彩色工具 ------------------
 class T:
@@ -43,9 +59,329 @@ class CatgirlDialog:
     def encourage():
         return f"{random.choice(['发现了神奇的常数喵！', '数学真奇妙喵！', '猫娘又学到了新东西喵！'])} {CatgirlEmoji.HAPPY}"
 
+# ------------------ 猫娘高精度常数引擎 ------------------
+class PrecisionEngine:
+    """猫娘高精度常数引擎喵~
+
+    所有函数都按当前 decimal 上下文的精度计算并返回 Decimal。
+    decimal 的除法、开方、ln、exp 在几万位时非常慢，乘法却很快，
+    所以这里只用乘法做牛顿迭代，级数全部用大整数二分拆分喵~
+    """
+    GUARD = 12  # 保护位数，最后再四舍五入回去喵~
+    _cache = {}
+
+    @classmethod
+    def _remember(cls, name, compute):
+        """算过更高精度的常数直接四舍五入复用喵~"""
+        prec = getcontext().prec
+        cached = cls._cache.get(name)
+        if cached is None or cached[0] < prec:
+            cached = (prec, compute())
+            cls._cache[name] = cached
+        return +cached[1]
+
+    # ---- 二分拆分级数 ----
+    @classmethod
+    def binary_split(cls, p, q, a, lo, hi):
+        """二分拆分喵~ 返回 (P, Q, T)，使 Σ_{lo≤k<hi} a(k)·Π_{lo≤j≤k} p(j)/q(j) = T/Q"""
+        if hi - lo == 1:
+            P = BIGINT(p(lo))
+            return P, BIGINT(q(lo)), P * a(lo)
+        mid = (lo + hi) // 2
+        P1, Q1, T1 = cls.binary_split(p, q, a, lo, mid)
+        P2, Q2, T2 = cls.binary_split(p, q, a, mid, hi)
+        return P1 * P2, Q1 * Q2, T1 * Q2 + P1 * T2
+
+    @classmethod
+    def ratio(cls, num, den):
+        """大整数之比 num/den 喵~ 先砍掉用不到的低位再转成 Decimal"""
+        shift = max(int(den.bit_length()) - int(getcontext().prec * math.log2(10)) - 64, 0)
+        return Decimal(int(num >> shift)) * cls.recip(Decimal(int(den >> shift)))
+
+    @classmethod
+    def series(cls, p, q, a, terms):
+        """把二分拆分的结果变成当前精度的 Decimal 喵~"""
+        _, Q, T = cls.binary_split(p, q, a, 0, terms)
+        return cls.ratio(T, Q)
+
+    @staticmethod
+    def terms(bits_per_term):
+        """级数每项收敛 bits_per_term 个二进制位时需要的项数喵~"""
+        return int(getcontext().prec * math.log2(10) / bits_per_term) + 3
+
+    # ---- 只用乘法的牛顿迭代 ----
+    @staticmethod
+    def recip(x):
+        """牛顿迭代求 1/x 喵~ y ← y + y(1 − xy)，精度每轮翻倍"""
+        target = getcontext().prec + 5
+        with localcontext() as ctx:
+            ctx.prec = 20
+            y = 1 / x
+            prec = 20
+            while prec < target:
+                prec = min(2 * prec, target)
+                ctx.prec = prec + 5
+                y += y * (1 - (+x) * y)
+        return +y
+
+    @staticmethod
+    def rsqrt(x):
+        """牛顿迭代求 1/√x 喵~ y ← y + y(1 − xy²)/2"""
+        target = getcontext().prec + 5
+        with localcontext() as ctx:
+            ctx.prec = 20
+            y = 1 / x.sqrt()
+            prec = 20
+            while prec < target:
+                prec = min(2 * prec, target)
+                ctx.prec = prec + 5
+                y += y * (1 - (+x) * y * y) / 2
+        return +y
+
+    @classmethod
+    def sqrt(cls, x):
+        """√x = x·(1/√x) 喵~"""
+        x = Decimal(x)
+        if x == 0:
+            return x
+        with localcontext() as ctx:
+            ctx.prec += 5
+            result = x * cls.rsqrt(x)
+        return +result
+
+    @classmethod
+    def newton(cls, step, x0, digits0=15):
+        """精度翻倍的牛顿迭代喵~ step(x) 返回新的 x，x0 要有 digits0 位是对的"""
+        target = getcontext().prec + cls.GUARD
+        x, prec = Decimal(x0), digits0
+        while True:
+            prec = min(2 * prec, target)
+            with localcontext() as ctx:
+                ctx.prec = prec + 5
+                x = step(x)
+            if prec == target:
+                break
+        return +x
+
+    @classmethod
+    def poly_root(cls, coeffs, x0):
+        """牛顿迭代求整系数多项式的实根喵~ coeffs 从最高次排到常数项"""
+        def step(x):
+            f, df = Decimal(0), Decimal(0)
+            for c in coeffs:
+                df = df * x + f
+                f = f * x + c
+            return x - f * cls.recip(df)
+        return cls.newton(step, x0)
+
+    # ---- π、ln、exp ----
+    @classmethod
+    def pi(cls):
+        """Chudnovsky 级数喵~ 每项约14位十进制"""
+        def compute():
+            with localcontext() as ctx:
+                ctx.prec += cls.GUARD
+                c3 = 640320 ** 3 // 24
+                s = cls.series(
+                    lambda k: 1 if k == 0 else -(6 * k - 5) * (2 * k - 1) * (6 * k - 1),
+                    lambda k: 1 if k == 0 else k * k * k * c3,
+                    lambda k: 13591409 + 545140134 * k,
+                    cls.terms(47.11))
+                return 426880 * cls.sqrt(10005) * cls.recip(s)
+        return cls._remember('pi', compute)
+
+    @classmethod
+    def atanh_inv(cls, n):
+        """atanh(1/n) = Σ 1/((2k+1)·n^(2k+1)) 喵~ n是大于1的整数"""
+        with localcontext() as ctx:
+            ctx.prec += cls.GUARD
+            n2 = n * n
+            result = cls.series(
+                lambda k: 1 if k == 0 else 2 * k - 1,
+                lambda k: n if k == 0 else (2 * k + 1) * n2,
+                lambda k: 1,
+                cls.terms(math.log2(n2)))
+        return +result
+
+    @classmethod
+    def ln2(cls):
+        """ln 2 = 18·atanh(1/26) − 2·atanh(1/4801) + 8·atanh(1/8749) 喵~"""
+        def compute():
+            with localcontext() as ctx:
+                ctx.prec += cls.GUARD
+                return 18 * cls.atanh_inv(26) - 2 * cls.atanh_inv(4801) + 8 * cls.atanh_inv(8749)
+        return cls._remember('ln2', compute)
+
+    @classmethod
+    def agm(cls, a, b):
+        """算术几何平均喵~ 每轮有效位数翻倍
+
+        |a − b| 小到一半精度以后，再取一次算术平均的误差只有 (a − b)²/8a，
+        不用去比最后几位，免得开方的舍入误差让循环停不下来喵~
+        """
+        with localcontext() as ctx:
+            ctx.prec += cls.GUARD
+            a, b = Decimal(a), Decimal(b)
+            eps = Decimal(10) ** (-(ctx.prec // 2) - 1)
+            while abs(a - b) > eps * a:
+                a, b = (a + b) / 2, cls.sqrt(a * b)
+            result = (a + b) / 2
+        return +result
+
+    @classmethod
+    def ln(cls, x):
+        """AGM 对数喵~ ln x = π/(2·agm(1, 4/s)) − m·ln 2，s = x·2^m 要足够大"""
+        x = Decimal(x)
+        if x <= 0:
+            raise ValueError("对数的真数要大于0喵~")
+        if x == 1:
+            return Decimal(0)
+        with localcontext() as ctx:
+            ctx.prec += cls.GUARD
+            m = int(ctx.prec * math.log2(10) / 2) + 8 - int(x.adjusted() * math.log2(10))
+            s = x * Decimal(2) ** m
+            result = cls.pi() * cls.recip(2 * cls.agm(1, 4 * cls.recip(s))) - m * cls.ln2()
+        return +result
+
+    @classmethod
+    def exp(cls, x):
+        """牛顿迭代求 exp 喵~ y ← y·(1 + x − ln y)"""
+        x = Decimal(x)
+        return cls.newton(lambda y: y * (1 + x - cls.ln(y)), math.exp(float(x)))
+
+    # ---- 定点整数工具，ζ 相关的常数用 ----
+    @classmethod
+    def fixed_bits(cls):
+        """当前精度对应的定点二进制位数喵~"""
+        return int((getcontext().prec + cls.GUARD) * math.log2(10)) + 32
+
+    @staticmethod
+    def fixed_atanh_inv(n, bits):
+        """atanh(1/n)·2^bits 喵~"""
+        n2 = n * n
+        term = (1 << bits) // n
+        total, k = 0, 0
+        while term:
+            total += term // (2 * k + 1)
+            term //= n2
+            k += 1
+        return total
+
+    @staticmethod
+    def fixed_log1p(x, bits):
+        """ln(1 + x/2^bits)·2^bits 喵~ x 要很小"""
+        total, power, k = 0, x, 1
+        while power:
+            total += power // k if k % 2 else -(power // k)
+            power = (power * x) >> bits
+            k += 1
+        return total
+
+    @classmethod
+    def fixed_log_table(cls, n, bits):
+        """ln 1 … ln n 的定点表喵~ 素数用 ln p = ln(p−1) + 2·atanh(1/(2p−1))"""
+        table = [0, 0]
+        for m in range(2, n + 1):
+            for f in range(2, math.isqrt(m) + 1):
+                if m % f == 0:
+                    table.append(table[f] + table[m // f])
+                    break
+            else:
+                table.append(table[m - 1] + 2 * cls.fixed_atanh_inv(2 * m - 1, bits))
+        return table
+
+    @staticmethod
+    def borwein_terms(bits):
+        """Borwein ζ 算法需要的项数喵~ 误差约 (3+√8)^(−n)"""
+        return int(bits * math.log(2) / math.log(3 + math.sqrt(8))) + 4
+
+    @staticmethod
+    def borwein_coefficients(n):
+        """Borwein ζ 算法的 d_0 … d_n 喵~"""
+        d, t, total = [1], 1, 1
+        for i in range(1, n + 1):
+            t = t * 2 * (n + i - 1) * (n - i + 1) // (i * (2 * i - 1))
+            total += t
+            d.append(total)
+        return d
+
+    @classmethod
+    def fixed_zeta_values(cls, s_values, bits):
+        """一次算出一批 ζ(s)·2^bits 喵~ s 是大于1的整数
+
+        s 大时直接求和；s 小时用 Borwein 交错级数，按 s 从小到大扫描，
+        (k+1)^(−s) 每次只除一个小整数，不用每个 s 都做大数除法喵~
+        """
+        extra = 24  # 逐次截断误差的保护位
+        work = bits + extra
+        one = 1 << work
+        n = cls.borwein_terms(work)
+        d = cls.borwein_coefficients(n)
+        dn = d[n]
+        # W_k = (−1)^k·(d_k − d_n)/d_n 的定点形式，|W_k| ≤ 1
+        weights = [(dn - d[k] if k % 2 else d[k] - dn) * one // dn for k in range(n)]
+        powers, current = [one] * n, 0
+        values = {}
+        for s in sorted(set(s_values)):
+            if bits / (s - 1) <= math.log2(n):
+                total, k = 0, 1
+                while True:
+                    term = one // k ** s
+                    if not term:
+                        break
+                    total += term
+                    k += 1
+            else:
+                while current < s:
+                    powers = [x // (k + 1) for k, x in enumerate(powers) if x]
+                    current += 1
+                # (k+1)^(−s) 越来越短，权重只需截到同样长度喵~
+                total = 0
+                for w, x in zip(weights, powers):
+                    cut = max(work - x.bit_length() - 8, 0)
+                    total += (w >> cut) * x >> (work - cut)
+                half = 1 << (s - 1)
+                total = -total * half // (half - 1)
+            values[s] = total >> extra
+        return values
+
+    @classmethod
+    def fixed_log_zeta_tails(cls, s_values, primes, bits):
+        """一批 ln ζ_P(s)·2^bits 喵~ ζ_P 是去掉 primes 里所有素数欧拉因子的 ζ"""
+        one = 1 << bits
+        logs = {}
+        for s, value in cls.fixed_zeta_values(s_values, bits).items():
+            for p in primes:
+                ps = p ** s
+                value = value * (ps - 1) // ps
+            logs[s] = cls.fixed_log1p(value - one, bits)
+        return logs
+
+    @staticmethod
+    def mobius(n):
+        """默比乌斯函数 μ(n) 喵~"""
+        result, f = 1, 2
+        while f * f <= n:
+            if n % f == 0:
+                n //= f
+                if n % f == 0:
+                    return 0
+                result = -result
+            f += 1
+        return -result if n > 1 else result
+
 # ------------------ 数学常数百科全书 ------------------
 class MathConstants:
-    """数学常数百科全书喵~"""
+    """数学常数百科全书喵~ 每个常数都按当前 decimal 精度算出 Decimal"""
+    # 欧拉乘积里单独处理的小素数，剩下的交给 ζ_P 喵~
+    SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47)
+    NEXT_PRIME = 53
+    # 康威 look-and-say 多项式的系数，从 x^71 排到常数项喵~
+    CONWAY_POLYNOMIAL = (
+        1, 0, -1, -2, -1, 2, 2, 1, -1, -1, -1, -1, -1, 2, 5, 3, -2, -10, -3, -2, 6, 6, 1, 9,
+        -3, -7, -8, -8, 10, 6, 8, -5, -12, 7, -7, 7, 1, -3, 10, 1, -6, -2, -10, -3, 2, 9, -3, 14,
+        -8, 0, -7, 9, 3, -4, -10, -7, 12, 7, 2, -12, -4, -2, 5, 0, 1, -7, 7, -4, 12, -6, 3, -6,
+    )
     
     def __init__(self):
         # 设置高精度计算
@@ -53,128 +389,371 @@ class MathConstants:
         
     @staticmethod
     def pi():
-        """圆周率 π 喵~"""
-        return math.pi
+        """圆周率 π 喵~ Chudnovsky 级数"""
+        return PrecisionEngine.pi()
     
     @staticmethod
     def e():
-        """自然常数 e 喵~"""
-        return math.e
+        """自然常数 e 喵~ Σ 1/k! 二分拆分"""
+        with localcontext() as ctx:
+            ctx.prec += PrecisionEngine.GUARD
+            bits = ctx.prec * math.log2(10)
+            terms = 2
+            while math.lgamma(terms + 1) / math.log(2) < bits:
+                terms *= 2
+            result = PrecisionEngine.series(lambda k: 1, lambda k: max(k, 1), lambda k: 1, terms)
+        return +result
     
     @staticmethod
     def phi():
         """黄金比例 φ 喵~"""
-        return (1 + math.sqrt(5)) / 2
+        with localcontext() as ctx:
+            ctx.prec += PrecisionEngine.GUARD
+            result = (1 + PrecisionEngine.sqrt(5)) / 2
+        return +result
     
     @staticmethod
     def euler_mascheroni():
-        """欧拉-马歇罗尼常数 γ 喵~"""
-        # 使用调和级数近似计算
-        n = 1000000
-        gamma = 0.0
-        for i in range(1, n+1):
-            gamma += 1.0/i
-        gamma -= math.log(n)
-        return gamma
+        """欧拉-马歇罗尼常数 γ 喵~ Brent–McMillan 算法，n 取2的幂"""
+        def compute():
+            with localcontext() as ctx:
+                ctx.prec += PrecisionEngine.GUARD
+                log2_n = max(math.ceil(math.log2(ctx.prec * math.log(10) / 4 + 1)), 1)
+                shift = 2 * log2_n  # 乘 n² 就是左移喵~
+                terms = int(3.5911 * (1 << log2_n)) + 2
+
+                def split(lo, hi):
+                    # (D, C, T, V): D = Π k，C/D = Σ 1/k，T/D² = Σ Π n²/k²，V/D³ = Σ (Π n²/k²)·H_k
+                    if hi - lo == 1:
+                        n2 = BIGINT(1) << shift
+                        return BIGINT(lo), BIGINT(1), n2, n2
+                    mid = (lo + hi) // 2
+                    D1, C1, T1, V1 = split(lo, mid)
+                    D2, C2, T2, V2 = split(mid, hi)
+                    s1 = shift * (mid - lo)
+                    Q2 = D2 * D2
+                    C1D2 = C1 * D2
+                    return (D1 * D2, C1D2 + C2 * D1, T1 * Q2 + (T2 << s1),
+                            D2 * Q2 * V1 + ((C1D2 * T2 + D1 * V2) << s1))
+
+                D, _, T, V = split(1, terms)
+                return PrecisionEngine.ratio(V, D * (D * D + T)) - log2_n * PrecisionEngine.ln2()
+        return PrecisionEngine._remember('gamma', compute)
     
     @staticmethod
     def catalan():
-        """卡塔兰常数 G 喵~"""
-        # 使用级数求和: G = Σ((-1)^n/(2n+1)^2)
-        g = 0.0
-        for n in range(100000):
-            g += ((-1)**n) / ((2*n + 1)**2)
-        return g
+        """卡塔兰常数 G 喵~ G = ½·Σ (−8)^k·(3k+2)/((2k+1)³·C(2k,k)³)"""
+        with localcontext() as ctx:
+            ctx.prec += PrecisionEngine.GUARD
+            s = PrecisionEngine.series(
+                lambda k: 1 if k == 0 else -k ** 3,
+                lambda k: 1 if k == 0 else (2 * k + 1) ** 3,
+                lambda k: 3 * k + 2,
+                PrecisionEngine.terms(3))
+            result = s / 2
+        return +result
     
     @staticmethod
     def apery():
-        """阿佩里常数 ζ(3) 喵~"""
-        # ζ(3) = Σ(1/n^3)
-        zeta3 = 0.0
-        for n in range(1, 100000):
-            zeta3 += 1.0 / (n**3)
-        return zeta3
+        """阿佩里常数 ζ(3) 喵~ Amdeberhan–Zeilberger 级数，每项10个二进制位"""
+        with localcontext() as ctx:
+            ctx.prec += PrecisionEngine.GUARD
+            s = PrecisionEngine.series(
+                lambda k: 1 if k == 0 else -k ** 5,
+                lambda k: 1 if k == 0 else 32 * (2 * k + 1) ** 5,
+                lambda k: 205 * k * k + 250 * k + 77,
+                PrecisionEngine.terms(10))
+            result = s / 64
+        return +result
     
     @staticmethod
     def khinchin():
-        """辛钦常数 K₀ 喵~"""
-        # 近似值，理论值约为 2.6854520010...
-        return 2.6854520010
+        """辛钦常数 K₀ 喵~
+        ln K₀·ln 2 = Σ_{k=2}^{N} 4·atanh(1/(2k−1))·atanh(1/(2k+1)) + Σ_n ζ(2n, N+1)·A_n/n，
+        A_n = 1 − 1/2 + … + 1/(2n−1)
+        """
+        with localcontext() as ctx:
+            ctx.prec += PrecisionEngine.GUARD
+            bits = PrecisionEngine.fixed_bits()
+            one = 1 << bits
+            N = 40
+            atanh = {m: PrecisionEngine.fixed_atanh_inv(m, bits) for m in range(3, 2 * N + 2, 2)}
+            total = sum(4 * atanh[2 * k - 1] * atanh[2 * k + 1] >> bits for k in range(2, N + 1))
+            n_max = int((bits + 8) / (2 * math.log2(N + 1)))
+            zeta = PrecisionEngine.fixed_zeta_values(range(2, 2 * n_max + 1, 2), bits)
+            alt = one
+            for n in range(1, n_max + 1):
+                s = 2 * n
+                hurwitz = zeta[s] - sum(one // k ** s for k in range(1, N + 1))
+                total += (hurwitz * alt >> bits) // n
+                alt += one // (2 * n + 1) - one // (2 * n)
+            log_k = PrecisionEngine.ratio(total, one) * PrecisionEngine.recip(PrecisionEngine.ln2())
+            result = PrecisionEngine.exp(log_k)
+        return +result
     
     @staticmethod
     def twin_prime():
-        """孪生素数常数 Π₂ 喵~"""
-        # 孪生素数常数近似值
-        return 0.6601618158
+        """孪生素数常数 Π₂ 喵~
+        ln Π₂ = Σ_{3≤p≤47} ln(1 − 1/(p−1)²) − Σ_{k≥2} (2^k−2)/k · Σ_m μ(m)/m·ln ζ_P(mk)
+        """
+        with localcontext() as ctx:
+            ctx.prec += PrecisionEngine.GUARD
+            primes = MathConstants.SMALL_PRIMES
+            base_bits = PrecisionEngine.fixed_bits()
+            k_max = int(base_bits / math.log2(MathConstants.NEXT_PRIME / 2)) + 2
+            bits = base_bits + k_max  # 2^k 会放大误差，多留几位喵~
+            one = 1 << bits
+            total = 0
+            for p in primes[1:]:
+                total -= 2 * PrecisionEngine.fixed_atanh_inv(2 * (p - 1) ** 2 - 1, bits)
+            s_max = int((bits + 8) / math.log2(MathConstants.NEXT_PRIME))
+            log_zeta = PrecisionEngine.fixed_log_zeta_tails(range(2, s_max + 1), primes, bits)
+            for k in range(2, k_max + 1):
+                prime_zeta = 0
+                for m in range(1, s_max // k + 1):
+                    mu = PrecisionEngine.mobius(m)
+                    if mu:
+                        prime_zeta += mu * log_zeta[m * k] // m
+                total -= ((1 << k) - 2) * prime_zeta // k
+            result = PrecisionEngine.exp(PrecisionEngine.ratio(total, one))
+        return +result
     
     @staticmethod
     def mertens():
-        """梅滕斯常数 M 喵~"""
-        # 近似值
-        return 0.2614972128
+        """梅滕斯常数 M 喵~ M = γ + Σ_{p≤47}(ln(1−1/p) + 1/p) + Σ_{k≥2} μ(k)/k·ln ζ_P(k)"""
+        with localcontext() as ctx:
+            ctx.prec += PrecisionEngine.GUARD
+            bits = PrecisionEngine.fixed_bits()
+            one = 1 << bits
+            primes = MathConstants.SMALL_PRIMES
+            total = 0
+            for p in primes:
+                total += one // p - 2 * PrecisionEngine.fixed_atanh_inv(2 * p - 1, bits)
+            k_max = int((bits + 8) / math.log2(MathConstants.NEXT_PRIME))
+            ks = [k for k in range(2, k_max + 1) if PrecisionEngine.mobius(k)]
+            log_zeta = PrecisionEngine.fixed_log_zeta_tails(ks, primes, bits)
+            for k in ks:
+                total += PrecisionEngine.mobius(k) * log_zeta[k] // k
+            result = MathConstants.euler_mascheroni() + PrecisionEngine.ratio(total, one)
+        return +result
     
     @staticmethod
     def glaisher_kinkelin():
-        """格莱舍-金克林常数 A 喵~"""
-        # 近似值
-        return 1.2824271291
+        """格莱舍-金克林常数 A 喵~ ln A = (γ + ln 2π)/12 − ζ'(2)/(2π²)，ζ'(2) 由 Borwein 级数逐项求导"""
+        with localcontext() as ctx:
+            ctx.prec += PrecisionEngine.GUARD
+            bits = PrecisionEngine.fixed_bits()
+            one = 1 << bits
+            n = PrecisionEngine.borwein_terms(bits)
+            d = PrecisionEngine.borwein_coefficients(n)
+            dn = d[n]
+            logs = PrecisionEngine.fixed_log_table(n, bits)
+            h, dh = 0, 0
+            for k in range(n):
+                c = -(d[k] - dn) if k % 2 else d[k] - dn
+                sq = (k + 1) ** 2
+                h += c * one // sq
+                dh -= c * logs[k + 1] // sq
+            # ζ(s) = −g(s)·h(s)/d_n，g(2) = 2，g'(2) = −2·ln 2
+            zeta_prime_2 = PrecisionEngine.ratio(2 * (logs[2] * h >> bits) - 2 * dh, dn * one)
+            pi = PrecisionEngine.pi()
+            log_a = (MathConstants.euler_mascheroni() + PrecisionEngine.ln(2 * pi)) / 12 \
+                - zeta_prime_2 * PrecisionEngine.recip(2 * pi * pi)
+            result = PrecisionEngine.exp(log_a)
+        return +result
     
     @staticmethod
     def conway():
-        """康威常数 λ 喵~"""
-        # 康威常数，约为 1.3035772690...
-        return 1.3035772690
+        """康威常数 λ 喵~ look-and-say 多项式唯一的正实根"""
+        return PrecisionEngine.poly_root(MathConstants.CONWAY_POLYNOMIAL, 1.3035772690342964)
     
     @staticmethod
     def omega():
-        """欧米伽常数 Ω 喵~"""
-        # 满足 Ωe^Ω = 1 的常数
-        # 使用迭代法计算
-        omega = 0.5
-        for _ in range(100):
-            omega = math.exp(-omega)
-        return omega
+        """欧米伽常数 Ω 喵~ 满足 Ωe^Ω = 1，牛顿迭代 Ω ← Ω(1 − ln Ω)/(1 + Ω)"""
+        return PrecisionEngine.newton(
+            lambda w: w * (1 - PrecisionEngine.ln(w)) * PrecisionEngine.recip(1 + w),
+            0.5671432904097838)
     
     @staticmethod
     def plastic_number():
-        """塑料数 ρ 喵~"""
-        # 满足 ρ³ = ρ + 1 的实数解
-        return ((9 + math.sqrt(69))/18)**(1/3) + ((9 - math.sqrt(69))/18)**(1/3)
+        """塑料数 ρ 喵~ 满足 ρ³ = ρ + 1 的实数解"""
+        return PrecisionEngine.poly_root((1, 0, -1, -1), 1.3247179572447460)
     
     @staticmethod
     def silver_ratio():
         """银比 δs 喵~"""
-        return 1 + math.sqrt(2)
+        with localcontext() as ctx:
+            ctx.prec += PrecisionEngine.GUARD
+            result = 1 + PrecisionEngine.sqrt(2)
+        return +result
     
     @staticmethod
     def supergolden_ratio():
-        """超黄金比例 ψ 喵~"""
-        # 满足 ψ³ = ψ² + 1 的实数解
-        return ((29 + 3*math.sqrt(93))/54)**(1/3) + ((29 - 3*math.sqrt(93))/54)**(1/3) + 1/3
+        """超黄金比例 ψ 喵~ 满足 ψ³ = ψ² + 1 的实数解"""
+        return PrecisionEngine.poly_root((1, -1, 0, -1), 1.4655712318767680)
     
     @staticmethod
     def erdos_borwein():
-        """埃尔德什-博温常数 E 喵~"""
-        # E = Σ(1/(2^n - 1))
-        e = 0.0
-        for n in range(1, 1000):
-            e += 1.0 / (2**n - 1)
-        return e
+        """埃尔德什-博温常数 E 喵~ E = Σ 2^(−n²)·(2^n+1)/(2^n−1)，比 Σ 1/(2^n−1) 快得多"""
+        with localcontext() as ctx:
+            ctx.prec += PrecisionEngine.GUARD
+            bits = int(ctx.prec * math.log2(10)) + 16
+            total, n = 0, 1
+            while n * n < bits:
+                total += ((1 << n) + 1 << (bits - n * n)) // ((1 << n) - 1)
+                n += 1
+            result = PrecisionEngine.ratio(total, 1 << bits)
+        return +result
     
     @staticmethod
     def laplace_limit():
-        """拉普拉斯极限 λ 喵~"""
-        # 约为 0.6627434193...
-        return 0.6627434193
+        """拉普拉斯极限 λ 喵~ 解 ln x + √(1+x²) − ln(1+√(1+x²)) = 0"""
+        def step(x):
+            s = PrecisionEngine.sqrt(1 + x * x)
+            f = PrecisionEngine.ln(x) + s - PrecisionEngine.ln(1 + s)
+            df = PrecisionEngine.recip(x) + x * PrecisionEngine.recip(1 + s)
+            return x - f * PrecisionEngine.recip(df)
+        return PrecisionEngine.newton(step, 0.6627434193491816)
     
     @staticmethod
     def gauss():
-        """高斯常数 G 喵~"""
-        # G = 1/agm(1, 1/√2)
-        a, b = 1.0, 1.0/math.sqrt(2)
-        for _ in range(100):
-            a, b = (a + b)/2, math.sqrt(a*b)
-        return 1.0/a
+        """高斯常数 G 喵~ G = 1/agm(1, √2)"""
+        with localcontext() as ctx:
+            ctx.prec += PrecisionEngine.GUARD
+            result = PrecisionEngine.recip(PrecisionEngine.agm(1, PrecisionEngine.sqrt(2)))
+        return +result
+
+# ------------------ 猫娘浮点快速通道 ------------------
+class FloatConstants:
+    """双精度快速通道喵~ 要的位数不超过 FLOAT_DIGITS 时不走 Decimal
+
+    每个常数只加几十项：先直接加前 N 项，剩下的尾巴用欧拉-麦克劳林公式补上，
+    交错级数用 Cohen–Villegas–Zagier 加速，求和用 math.fsum，结果是正确舍入的双精度喵~
+    """
+    FLOAT_DIGITS = 15
+    EM_TERMS = 16  # 欧拉-麦克劳林公式之前直接加的项数，取2的幂让 ln N 能精确拆开
+    LN2_HI, LN2_LO = 0.6931471805599453, 2.3190468138462996e-17  # ln 2 = 高位 + 低位
+    # 伯努利数 B_2, B_4, …, B_12
+    BERNOULLI = (1 / 6, -1 / 30, 1 / 42, -1 / 30, 5 / 66, -691 / 2730)
+
+    @staticmethod
+    def zeta_tail(s, n):
+        """Σ_{k≥n} k^(−s) 的欧拉-麦克劳林展开喵~"""
+        terms = [n ** (1 - s) / (s - 1), n ** -s / 2]
+        rising = s  # s(s+1)…(s+2k−2)
+        for k, b in enumerate(FloatConstants.BERNOULLI, 1):
+            terms.append(b / math.factorial(2 * k) * rising * n ** (-s - 2 * k + 1))
+            rising *= (s + 2 * k - 1) * (s + 2 * k)
+        return math.fsum(terms)
+
+    @staticmethod
+    def alternating_sum(a, n=24):
+        """Σ (−1)^k a(k) 的 Cohen–Villegas–Zagier 加速喵~ 误差约 5.8^(−n)"""
+        d = (3 + math.sqrt(8)) ** n
+        d = (d + 1 / d) / 2
+        b, c, terms = -1.0, -d, []
+        for k in range(n):
+            c = b - c
+            terms.append(c * a(k))
+            b = (k + n) * (k - n) * b / ((k + 0.5) * (k + 1))
+        return math.fsum(terms) / d
+
+    @staticmethod
+    def euler_mascheroni():
+        """γ = H_N − ln N − 1/(2N) + Σ B_2k/(2k·N^2k) 喵~"""
+        n = FloatConstants.EM_TERMS
+        terms = [1 / k for k in range(1, n + 1)]
+        log2_n = n.bit_length() - 1
+        terms += [-log2_n * FloatConstants.LN2_HI, -log2_n * FloatConstants.LN2_LO, -1 / (2 * n)]
+        terms += [b / (2 * k * n ** (2 * k)) for k, b in enumerate(FloatConstants.BERNOULLI, 1)]
+        return math.fsum(terms)
+
+    @staticmethod
+    def catalan():
+        """G = Σ (−1)^k/(2k+1)² 喵~"""
+        return FloatConstants.alternating_sum(lambda k: 1 / (2 * k + 1) ** 2)
+
+    @staticmethod
+    def apery():
+        """ζ(3) = Σ_{k<N} 1/k³ + 欧拉-麦克劳林尾巴喵~"""
+        n = FloatConstants.EM_TERMS
+        return math.fsum([k ** -3 for k in range(1, n)] + [FloatConstants.zeta_tail(3, n)])
+
+    @staticmethod
+    def erdos_borwein():
+        """E = Σ 2^(−n²)·(2^n+1)/(2^n−1) 喵~ 8项就超过双精度了"""
+        return math.fsum(2.0 ** -(n * n) * (2 ** n + 1) / (2 ** n - 1) for n in range(1, 9))
+
+# ------------------ 猫娘常数缓存 ------------------
+class ConstantDigitCache:
+    """算过的常数存到硬盘上喵~
+
+    每个常数一个文件，只保留算过的最高精度：第一行是文件头
+    "CATCALC-DIGITS <版本> <常数名> <位数>"，后面是完整的十进制数字。
+    要的位数不超过存的位数时直接截取前缀再四舍五入，
+    读文件用 mmap，几十万位的文件也只会解析用得到的那一小段喵~
+    """
+    VERSION = 1  # 算法或文件格式变了就加一，旧缓存自动作废
+    MAGIC = "CATCALC-DIGITS"
+
+    def __init__(self, directory=None):
+        self.directory = directory or os.environ.get('CATCALC_CACHE_DIR') or \
+            os.path.join(os.path.expanduser('~'), '.cache', 'catcalc')
+
+    def _path(self, name):
+        return os.path.join(self.directory, f"{name}-v{self.VERSION}.digits")
+
+    def _read_header(self, mm):
+        """解析文件头，返回 (位数, 数字开始的偏移) 喵~ 格式不对返回 None"""
+        end = mm.find(b'\n', 0, 256)
+        if end < 0:
+            return None
+        parts = mm[:end].decode('ascii', 'replace').split()
+        if len(parts) != 4 or parts[0] != self.MAGIC or parts[1] != str(self.VERSION):
+            return None
+        return int(parts[3]), end + 1
+
+    def stored_precision(self, name):
+        """硬盘上存了多少位喵~ 没有就是0"""
+        try:
+            with open(self._path(name), 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                header = self._read_header(mm)
+        except (OSError, ValueError):
+            return 0
+        return header[0] if header else 0
+
+    def lookup(self, name, prec):
+        """取出 prec 位的常数喵~ 存的位数不够就返回 None"""
+        try:
+            with open(self._path(name), 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                header = self._read_header(mm)
+                if header is None or header[0] < prec:
+                    return None
+                start = header[1]
+                # 整数部分、小数点和多留的几位一起截出来，剩下的不碰喵~
+                text = mm[start:start + prec + 32].decode('ascii')
+        except (OSError, ValueError):
+            return None
+        with localcontext() as ctx:
+            ctx.prec = prec
+            return +Decimal(text)
+
+    def store(self, name, value, prec):
+        """存下 prec 位的结果喵~ 比已有的更精确才写，先写临时文件再替换"""
+        if prec <= self.stored_precision(name):
+            return
+        path = self._path(name)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, 'w', encoding='ascii') as f:
+                f.write(f"{self.MAGIC} {self.VERSION} {name} {prec}\n")
+                f.write(f"{value:f}")
+            os.replace(tmp, path)
+        except OSError:
+            pass  # 缓存写不进去也不影响计算喵~
 
 # ------------------ 常数菜单 ------------------
 CONSTANT_MENU = {
@@ -194,21 +773,30 @@ CONSTANT_MENU = {
     14: ("δs - 银比", "白银比例的美丽喵~", MathConstants.silver_ratio),
     15: ("ψ - 超黄金比例", "超级黄金比例喵~", MathConstants.supergolden_ratio),
     16: ("E - 埃尔德什-博温常数", "无穷级数的奇迹喵~", MathConstants.erdos_borwein),
-    16: ("λ - 拉普拉斯极限", "天体力学的边界喵~", MathConstants.laplace_limit),
+    17: ("λ - 拉普拉斯极限", "天体力学的边界喵~", MathConstants.laplace_limit),
     18: ("G - 高斯常数", "算术几何平均的魔法喵~", MathConstants.gauss),
 }
 
 # ------------------ 猫娘常数计算器 ------------------
 class CatgirlConstantCalculator:
     """猫娘常数计算器喵~"""
+    MAX_PRECISION = 100000
+    # 没有快速算法的常数耗时增长比立方还快 (1000 位就要几秒)，超过这些位数只算到上限喵~
+    PRECISION_LIMITS = {
+        'khinchin': 1000,
+        'twin_prime': 1000,
+        'mertens': 1000,
+        'glaisher_kinkelin': 5000,
+    }
     
-    def __init__(self):
+    def __init__(self, cache=None):
         self.constants = MathConstants()
         self.precision = 50  # 默认精度
+        self.cache = cache or ConstantDigitCache()
         
     def set_precision(self, prec):
         """设置计算精度喵~"""
-        self.precision = max(10, min(1000, prec))
+        self.precision = max(10, min(self.MAX_PRECISION, prec))
         getcontext().prec = self.precision
         print(color(f"精度已设置为 {self.precision} 位喵！{CatgirlEmoji.SPARKLE}", T.OKGREEN))
     
@@ -223,11 +811,7 @@ class CatgirlConstantCalculator:
         print(CatgirlDialog.constant_surprise(name.split('-')[0].strip()))
         
         try:
-            # 使用decimal提高精度
-            with decimal.localcontext() as ctx:
-                ctx.prec = self.precision
-                result = func()
-                
+            result = self.evaluate(func)
             # 格式化输出
             result_str = self.format_result(result)
             return result, result_str
@@ -235,8 +819,33 @@ class CatgirlConstantCalculator:
         except Exception as e:
             return None, f"计算出错喵: {e}"
     
+    def evaluate(self, func):
+        """按当前精度求常数喵~ 双精度够用就走快速通道；硬盘缓存里有就直接截取，没有再算并存起来"""
+        name = func.__name__
+        if self.precision <= FloatConstants.FLOAT_DIGITS and hasattr(FloatConstants, name):
+            return getattr(FloatConstants, name)()
+        digits = min(self.precision, self.PRECISION_LIMITS.get(name, self.MAX_PRECISION))
+        if digits < self.precision:
+            print(color(f"这个常数还没有快速算法，最多只能算 {digits} 位喵~ 先给主人 {digits} 位"
+                        f"{CatgirlEmoji.PRAYING}", T.WARNING))
+        result = self.cache.lookup(name, digits)
+        if result is not None:
+            print(color(f"从缓存里直接拿出来喵~ {CatgirlEmoji.WINK}", T.OKCYAN))
+            return result
+        if digits >= 10000:
+            print(color(f"{digits} 位要算一会儿喵，请主人稍等~{CatgirlEmoji.PRAYING}", T.OKCYAN))
+        # 使用decimal提高精度
+        with decimal.localcontext() as ctx:
+            ctx.prec = digits
+            result = func()
+        if isinstance(result, Decimal):
+            self.cache.store(name, result, digits)
+        return result
+    
     def format_result(self, result):
         """格式化结果喵~"""
+        if isinstance(result, Decimal):
+            return f"{result:f}"
         if isinstance(result, (int, float)):
             if abs(result) > 1e10 or abs(result) < 1e-5:
                 return f"{result:.{self.precision}e}"
@@ -244,13 +853,14 @@ class CatgirlConstantCalculator:
                 return f"{result:.{self.precision}f}".rstrip('0').rstrip('.')
         return str(result)
     
-    def show_constant_info(self, choice):
-        """显示常数详细信息喵~"""
+    def show_constant_info(self, choice, result=None):
+        """显示常数详细信息喵~ 已经算好的结果可以直接传进来"""
         if choice not in CONSTANT_MENU:
             return
         
         name, description, func = CONSTANT_MENU[choice]
-        result = func()
+        if result is None:
+            result = self.evaluate(func)
         
         print(color(f"\n{'='*50}", T.HEADER))
         print(color(f" 数学常数: {name}", T.BOLD))
@@ -313,6 +923,109 @@ def knowledge_classroom():
     
     print(color(f"\n{CatgirlEmoji.PRAYING} 数学的世界无限广阔，让我们一起探索更多奥秘喵~", T.OKGREEN))
 
+# ------------------ 猫娘性能测试 ------------------
+def _legacy_euler_mascheroni():
+    """旧版调和级数循环，只给性能测试做对比喵~"""
+    n = 1000000
+    gamma = 0.0
+    for i in range(1, n+1):
+        gamma += 1.0/i
+    gamma -= math.log(n)
+    return gamma
+
+def _legacy_catalan():
+    """旧版交错级数循环喵~"""
+    g = 0.0
+    for n in range(100000):
+        g += ((-1)**n) / ((2*n + 1)**2)
+    return g
+
+def _legacy_apery():
+    """旧版 Σ 1/n³ 循环喵~"""
+    zeta3 = 0.0
+    for n in range(1, 100000):
+        zeta3 += 1.0 / (n**3)
+    return zeta3
+
+def _legacy_erdos_borwein():
+    """旧版 Σ 1/(2^n−1) 循环喵~"""
+    e = 0.0
+    for n in range(1, 1000):
+        e += 1.0 / (2**n - 1)
+    return e
+
+def _bench_time(func, *args, repeat=1):
+    """计时小工具喵~ 返回 (结果, 每次的秒数)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(*args)
+    return result, (time.perf_counter() - start) / repeat
+
+def bench_float_constants():
+    """浮点快速通道 vs 旧版循环 vs 高精度引擎喵~"""
+    legacy = {
+        'euler_mascheroni': _legacy_euler_mascheroni,
+        'catalan': _legacy_catalan,
+        'apery': _legacy_apery,
+        'erdos_borwein': _legacy_erdos_borwein,
+    }
+    for name, old_func in legacy.items():
+        with localcontext() as ctx:
+            ctx.prec = 40
+            exact = getattr(MathConstants, name)()
+        fast, t_fast = _bench_time(getattr(FloatConstants, name), repeat=1000)
+        old, t_old = _bench_time(old_func)
+        def decimal_engine():
+            PrecisionEngine._cache.clear()
+            with localcontext() as ctx:
+                ctx.prec = FloatConstants.FLOAT_DIGITS + 1
+                return getattr(MathConstants, name)()
+        _, t_dec = _bench_time(decimal_engine, repeat=20)
+        err_fast = abs(Decimal(fast) - exact) / exact
+        err_old = abs(Decimal(old) - exact) / exact
+        print(f"  {name:17s} 旧循环 {t_old * 1e3:9.2f}ms 误差 {err_old:.1e} | "
+              f"快速通道 {t_fast * 1e6:7.1f}µs 误差 {err_fast:.1e} | Decimal引擎 {t_dec * 1e3:6.2f}ms")
+
+def bench_high_precision():
+    """高精度引擎在不同位数下的耗时喵~"""
+    names = ('pi', 'e', 'euler_mascheroni', 'catalan', 'apery', 'erdos_borwein', 'gauss')
+    print(f"  gmpy2 加速: {'开' if GMPY2_AVAILABLE else '关'}")
+    for digits in (1000, 10000, 100000):
+        cells = []
+        for name in names:
+            PrecisionEngine._cache.clear()
+            with localcontext() as ctx:
+                ctx.prec = digits
+                _, t = _bench_time(getattr(MathConstants, name))
+            cells.append(f"{name} {t:.2f}s")
+        print(f"  {digits:>6} 位: " + "  ".join(cells))
+    print("  没有快速算法的常数 (CatgirlConstantCalculator.PRECISION_LIMITS 里的上限):")
+    for name, limit in CatgirlConstantCalculator.PRECISION_LIMITS.items():
+        cells = []
+        for digits in sorted({300, 1000, limit}):
+            PrecisionEngine._cache.clear()
+            with localcontext() as ctx:
+                ctx.prec = digits
+                _, t = _bench_time(getattr(MathConstants, name))
+            cells.append(f"{digits} 位 {t:.2f}s")
+        print(f"    {name:17s} 上限 {limit:>5} 位: " + "  ".join(cells))
+
+BENCHMARKS = {
+    'float': ("双精度: 快速通道 vs 旧版循环", bench_float_constants),
+    'precision': ("高精度常数引擎", bench_high_precision),
+}
+
+def run_benchmarks(names=None):
+    """运行性能测试喵~ 用法: python CATCALCv10.0.py bench [名字...]"""
+    names = names or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print(color(f"没有叫 {name} 的性能测试喵~ 可选: {', '.join(BENCHMARKS)}", T.WARNING))
+            continue
+        title, func = BENCHMARKS[name]
+        print(color(f"=== {title} === {CatgirlEmoji.MAGIC}", T.HEADER))
+        func()
+
 # ------------------ 主循环 ------------------
 def main():
     calculator = CatgirlConstantCalculator()
@@ -346,7 +1059,7 @@ def main():
             
             elif choice == "77":
                 try:
-                    prec = int(input("设置精度位数喵 (10-1000): "))
+                    prec = int(input(f"设置精度位数喵 (10-{calculator.MAX_PRECISION}): "))
                     calculator.set_precision(prec)
                 except ValueError:
                     print(color("请输入有效的数字喵~", T.WARNING))
@@ -365,7 +1078,7 @@ def main():
                     
                     # 显示详细信息
                     if input(color("想看详细信息和趣闻喵？(y/n): ", T.OKCYAN)).lower() == 'y':
-                        calculator.show_constant_info(num)
+                        calculator.show_constant_info(num, result)
                 else:
                     print(color(f"计算出错了喵: {result_str}", T.FAIL))
                     print(CatgirlDialog.comfort())
@@ -384,4 +1097,7 @@ def main():
                 traceback.print_exc()
 
 if __name__ == '__main__':
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == 'bench':
+        run_benchmarks(sys.argv[2:])
+    else:
+        main()
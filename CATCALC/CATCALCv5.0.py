@@ -14,14 +14,23 @@ import threading
 import queue
 import time
 import concurrent.futures
+import heapq
+import itertools
+from array import array
+from multiprocessing import shared_memory
 from decimal import Decimal, getcontext
 from functools import lru_cache
 from datetime import datetime
 import re
 import signal
 
-os.system('clear')
-os.system('figlet CATCALC')
+# NumPy 可选: 有的话并行统计里每块用向量化计算，没有就用纯 Python
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 # ------------------ 彩色工具 ------------------
 class T:
@@ -666,77 +675,249 @@ def async_calculation_mode(task_manager):
         except ValueError:
             print(color("请输入有效的数字", T.WARNING))
 
-# ------------------ 多线程统计计算 ------------------
-def stats_mode_threaded():
-    """多线程统计计算模式"""
-    print(color("=== 多线程统计计算模式 ===", T.HEADER))
+# ------------------ 并行统计归约 ------------------
+class StatsPartial:
+    """一块数据的可合并统计量
+
+    个数/均值/离差平方和用 Chan 公式合并，最值直接比较，
+    分位数用 t-digest 质心，众数用 Misra-Gries 计数器，都可以两两合并。
+    每个进程算自己那一块，父进程把各块合并起来就是整体的结果。
+    """
+    COMPRESSION = 100   # t-digest 压缩参数，一块大约切成 COMPRESSION/2 个质心
+    EXACT_LIMIT = 1000  # 质心不超过这么多时保留原始值，分位数是精确的
+    HITTERS = 64        # 众数候选的计数器个数
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0       # 离差平方和
+        self.min = math.inf
+        self.max = -math.inf
+        self.centroids = []  # [(均值, 权重)]，按均值排序
+        self.counts = {}     # Misra-Gries 计数器
+        self.exact = True    # 还没减过计数，counts 是精确的
+
+    @classmethod
+    def from_values(cls, values):
+        """算一块数据的部分统计量，整块只排一次序"""
+        part = cls()
+        n = len(values)
+        if not n:
+            return part
+        part.count = n
+        if NUMPY_AVAILABLE:
+            ordered = np.sort(np.asarray(values, dtype=np.float64))
+            part.mean = float(ordered.mean())
+            part.m2 = float(np.square(ordered - part.mean).sum())
+            starts = np.flatnonzero(np.concatenate(([True], ordered[1:] != ordered[:-1])))
+            runs = np.diff(np.append(starts, n))
+            if len(runs) > cls.HITTERS + 1:
+                # 只有前 HITTERS+1 多的值可能在合并后留下来
+                top = np.sort(np.argpartition(runs, -(cls.HITTERS + 1))[-(cls.HITTERS + 1):])
+                starts, runs = starts[top], runs[top]
+            counts = dict(zip(ordered[starts].tolist(), runs.tolist()))
+        else:
+            ordered = sorted(values)
+            part.mean = math.fsum(ordered) / n
+            part.m2 = math.fsum((x - part.mean) ** 2 for x in ordered)
+            counts = {x: len(list(group)) for x, group in itertools.groupby(ordered)}
+        part.min, part.max = float(ordered[0]), float(ordered[-1])
+        part.centroids = cls._cut(ordered)
+        part._merge_counts(counts)
+        return part
+
+    @classmethod
+    def _cut(cls, ordered):
+        """排好序的一块按 t-digest 的 k 刻度切段，每段一个质心"""
+        n = len(ordered)
+        if n <= cls.EXACT_LIMIT:
+            return [(float(x), 1) for x in ordered]
+        steps = cls.COMPRESSION // 2
+        cuts = sorted({0, n} | {round(n * cls._scale_inverse(cls._scale(0) + j)) for j in range(1, steps)})
+        centroids = []
+        for a, b in zip(cuts, cuts[1:]):
+            if b > a:
+                piece = ordered[a:b]
+                mean = float(piece.mean()) if NUMPY_AVAILABLE else math.fsum(piece) / (b - a)
+                centroids.append((mean, b - a))
+        return centroids
+
+    @classmethod
+    def _scale(cls, q):
+        """k1 刻度函数: 两头的质心小，中间的大"""
+        return cls.COMPRESSION / (2 * math.pi) * math.asin(2 * q - 1)
+
+    @classmethod
+    def _scale_inverse(cls, k):
+        return (math.sin(min(k, cls.COMPRESSION / 4) * 2 * math.pi / cls.COMPRESSION) + 1) / 2
+
+    def merge(self, other):
+        """把另一块的统计量并进来"""
+        if not other.count:
+            return
+        if self.count:
+            count = self.count + other.count
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / count
+            self.m2 += other.m2 + delta * delta * self.count * other.count / count
+            self.count = count
+        else:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.centroids = list(heapq.merge(self.centroids, other.centroids))
+        if self.count > self.EXACT_LIMIT:
+            # 各块的质心交错在一起，要重新压缩，不然插值出来是台阶状的
+            self._compress()
+        self.exact = self.exact and other.exact
+        self._merge_counts(other.counts)
+
+    def _compress(self):
+        """相邻质心合并，每个质心跨的 k 不超过 1"""
+        total = self.count
+        merged = []
+        mean, weight = self.centroids[0]
+        before = 0
+        limit = self._scale_inverse(self._scale(0) + 1)
+        for m, w in self.centroids[1:]:
+            if (before + weight + w) / total <= limit:
+                weight += w
+                mean += (m - mean) * w / weight
+            else:
+                merged.append((mean, weight))
+                before += weight
+                limit = self._scale_inverse(self._scale(before / total) + 1)
+                mean, weight = m, w
+        merged.append((mean, weight))
+        self.centroids = merged
+
+    def _merge_counts(self, counts):
+        """可合并的 Misra-Gries: 计数相加，超出容量时都减去第 HITTERS+1 大的计数
+
+        减过一次之后计数只是下界，exact 变成 False
+        """
+        combined = dict(self.counts)
+        for x, c in counts.items():
+            combined[x] = combined.get(x, 0) + c
+        if len(combined) > self.HITTERS:
+            cut = heapq.nlargest(self.HITTERS + 1, combined.values())[-1]
+            combined = {x: c - cut for x, c in combined.items() if c > cut}
+            self.exact = False
+        self.counts = combined
+
+    def quantile(self, q):
+        """第 q 分位数，质心中心之间线性插值；全是原始值时和 statistics 一致"""
+        points = self.centroids
+        if not points:
+            return None
+        target = q * (self.count - 1) + 0.5
+        center = points[0][1] / 2
+        if target <= center:
+            return points[0][0]
+        for (m0, w0), (m1, w1) in zip(points, points[1:]):
+            upper = center + (w0 + w1) / 2
+            if target <= upper:
+                return m0 + (m1 - m0) * (target - center) / (upper - center)
+            center = upper
+        return points[-1][0]
+
+    def result(self):
+        """整理成统计结果"""
+        if not self.count:
+            return None
+        mode, hits = max(self.counts.items(), key=lambda item: item[1], default=(None, 0))
+        if self.exact:
+            mode = mode if hits > 1 or self.count == 1 else "无众数"
+        elif mode is None:
+            mode = "无明显众数"
+        variance = self.m2 / (self.count - 1) if self.count > 1 else 0
+        results = {
+            '样本数': self.count,
+            '平均值': self.mean,
+            '中位数': self.quantile(0.5),
+            '众数': mode,
+            '标准差': math.sqrt(variance),
+            '方差': variance,
+            '最小值': self.min,
+            '最大值': self.max,
+            '极差': self.max - self.min
+        }
+        if not self.exact:
+            results['众数说明'] = f"不同的值超过 {self.HITTERS} 个，众数为估计值"
+        return results
+
+PARALLEL_STATS_MIN = 200000    # 数据比这少就不开进程池了
+PARALLEL_STATS_CHUNK = 1 << 23  # 每块最多这么多个数，单个进程排序时的内存有上限
+
+def _reduce_chunk(job):
+    """进程池里算一块的部分统计量，数据从共享内存里读"""
+    name, lo, hi = job
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        if NUMPY_AVAILABLE:
+            values = np.frombuffer(shm.buf, dtype=np.float64, count=hi - lo, offset=8 * lo)
+            part = StatsPartial.from_values(values)
+            del values
+        else:
+            with shm.buf.cast('d') as view:
+                values = view[lo:hi].tolist()
+            part = StatsPartial.from_values(values)
+        return part
+    finally:
+        shm.close()
+
+def reduce_shared(shm, n, workers, chunk_size=None):
+    """共享内存里的 n 个 float64 切块交给进程池，合并各块的部分统计量"""
+    step = chunk_size or min(-(-n // workers), PARALLEL_STATS_CHUNK)
+    jobs = [(shm.name, lo, min(lo + step, n)) for lo in range(0, n, step)]
+    total = StatsPartial()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(_reduce_chunk, jobs):
+            total.merge(part)
+    return total
+
+def parallel_stats(values, workers=None, chunk_size=None):
+    """多进程并行统计: 数据放进共享内存，各进程算一块，父进程精确合并"""
+    n = len(values)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or n < PARALLEL_STATS_MIN:
+        return StatsPartial.from_values(values)
+    shm = shared_memory.SharedMemory(create=True, size=8 * n)
+    try:
+        with shm.buf.cast('d') as view:
+            view[:] = values if isinstance(values, array) else array('d', values)
+        return reduce_shared(shm, n, workers, chunk_size)
+    finally:
+        shm.close()
+        shm.unlink()
+
+def stats_mode_parallel():
+    """多进程统计计算模式"""
+    print(color("=== 多进程统计计算模式 ===", T.HEADER))
     print("输入数据 (用空格分隔，输入空行结束):")
     
-    stats_calc = StatsCalculator()
+    values = array('d')
     
     while True:
         data_input = input("数据: ").strip()
         if not data_input:
             break
         try:
-            values = [float(x) for x in data_input.split()]
-            stats_calc.add_data(values)
-            print(f"已添加 {len(values)} 个数据点")
+            batch = [float(x) for x in data_input.split()]
+            values.extend(batch)
+            print(f"已添加 {len(batch)} 个数据点")
         except ValueError:
             print(color("请输入有效的数字", T.WARNING))
     
-    if not stats_calc.data:
+    if not values:
         print(color("没有输入数据", T.WARNING))
         return
     
-    # 使用多线程并行计算统计值
-    def calc_mean(data):
-        return statistics.mean(data)
-    
-    def calc_median(data):
-        return statistics.median(data)
-    
-    def calc_std_dev(data):
-        return statistics.stdev(data) if len(data) > 1 else 0
-    
-    def calc_min_max(data):
-        return min(data), max(data)
-    
-    data = stats_calc.data.copy()
-    
-    # 提交并行计算任务
-    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-        future_mean = executor.submit(calc_mean, data)
-        future_median = executor.submit(calc_median, data)
-        future_std_dev = executor.submit(calc_std_dev, data)
-        future_min_max = executor.submit(calc_min_max, data)
-        
-        # 收集结果
-        mean = future_mean.result()
-        median = future_median.result()
-        std_dev = future_std_dev.result()
-        min_val, max_val = future_min_max.result()
-    
-    # 计算其他统计值
-    n = len(data)
-    try:
-        mode = statistics.mode(data)
-    except statistics.StatisticsError:
-        mode = "无众数"
-    
-    variance = std_dev ** 2
-    range_val = max_val - min_val
+    results = parallel_stats(values).result()
     
-    print(color("=== 统计结果 (多线程加速) ===", T.OKGREEN))
-    print(f"样本数: {n}")
-    print(f"平均值: {fmt_num(mean)}")
-    print(f"中位数: {fmt_num(median)}")
-    print(f"众数: {mode}")
-    print(f"标准差: {fmt_num(std_dev)}")
-    print(f"方差: {fmt_num(variance)}")
-    print(f"最小值: {fmt_num(min_val)}")
-    print(f"最大值: {fmt_num(max_val)}")
-    print(f"极差: {fmt_num(range_val)}")
+    print(color("=== 统计结果 (多进程并行) ===", T.OKGREEN))
+    for key, value in results.items():
+        print(f"{key}: {value if isinstance(value, (int, str)) else fmt_num(value)}")
 
 # ------------------ 统计计算模式 ------------------
 def stats_mode():
@@ -947,7 +1128,7 @@ def show_main_menu():
     print(color("""
 === CATCALC v5.0 超级多线程万能猫 ===
  1. 基础计算模式
- 2. 统计计算模式 (多线程加速)
+ 2. 统计计算模式 (多进程并行)
  3. 进制转换模式
  4. 单位换算模式
  5. 方程求解模式
@@ -965,7 +1146,7 @@ def show_help():
     print(color("""
 === 帮助信息 ===
 基础计算模式: 支持各种数学运算、三角函数、复数运算等
-统计计算模式: 多线程加速计算统计值
+统计计算模式: 多进程分块并行计算统计值
 进制转换模式: 支持2-36进制之间的任意转换
 单位换算模式: 支持长度、重量、温度、面积、体积、速度换算
 方程求解模式: 求解线性和二次方程
@@ -976,7 +1157,7 @@ def show_help():
 - 后台异步计算，不阻塞主界面
 - 实时进度条显示
 - 任务状态查询
-- 并行加速统计计算
+- 多进程分块并行统计
 
 特殊命令:
   prec - 设置显示精度
@@ -984,8 +1165,87 @@ def show_help():
   help - 显示帮助信息
 ================""", T.OKCYAN))
 
+# ------------------ 性能测试 ------------------
+def _legacy_stats_threaded(data):
+    """旧版: 四个线程各自把整个列表扫一遍，只给性能测试做对比"""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        mean = executor.submit(statistics.mean, data)
+        median = executor.submit(statistics.median, data)
+        std_dev = executor.submit(statistics.stdev, data)
+        min_max = executor.submit(lambda d: (min(d), max(d)), data)
+        return mean.result(), median.result(), std_dev.result(), min_max.result()
+
+def _bench_time(func, *args):
+    """计时小工具，返回 (结果, 秒数)"""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def _fill_shared(shm, n, seed=42):
+    """往共享内存里填 n 个正态分布的测试数据，每 1000 个放一个 3.5 当众数"""
+    if NUMPY_AVAILABLE:
+        rng = np.random.default_rng(seed)
+        data = np.frombuffer(shm.buf, dtype=np.float64, count=n)
+        for lo in range(0, n, 10**7):
+            hi = min(lo + 10**7, n)
+            data[lo:hi] = rng.normal(10, 3, hi - lo)
+        data[::1000] = 3.5
+        del data
+    else:
+        rng = random.Random(seed)
+        with shm.buf.cast('d') as view:
+            for lo in range(0, n, 10**6):
+                hi = min(lo + 10**6, n)
+                view[lo:hi] = array('d', (3.5 if i % 1000 == 0 else rng.gauss(10, 3) for i in range(lo, hi)))
+
+def bench_stats():
+    """旧的四线程 vs 多进程分块归约，再看进程数增加时的加速比"""
+    data = [random.gauss(10, 3) for _ in range(10**6)]
+    old, t_old = _bench_time(_legacy_stats_threaded, data)
+    new, t_new = _bench_time(parallel_stats, data)
+    print(f"  10^6 个数: 旧四线程 {t_old:7.3f}秒  分块归约 {t_new:7.3f}秒  快了 {t_old / t_new:6.1f} 倍")
+    print(f"    均值差 {abs(old[0] - new.mean):.1e}  标准差差 {abs(old[2] - math.sqrt(new.m2 / (new.count - 1))):.1e}"
+          f"  中位数差 {abs(old[1] - new.quantile(0.5)):.1e}")
+    
+    n = 10**8 if NUMPY_AVAILABLE else 10**7
+    cores = os.cpu_count() or 1
+    counts = sorted({1, cores} | {w for w in (2, 4, 8, 16, 32, 64) if w <= cores})
+    print(f"  CPU核数: {cores}  NumPy: {'有' if NUMPY_AVAILABLE else '没有'}  数据量: {n:,}")
+    shm = shared_memory.SharedMemory(create=True, size=8 * n)
+    try:
+        _fill_shared(shm, n)
+        base = None
+        for workers in counts:
+            total, elapsed = _bench_time(reduce_shared, shm, n, workers)
+            base = base or elapsed
+            result = total.result()
+            print(f"  {workers:>2} 个进程: {elapsed:7.2f}秒  加速 {base / elapsed:5.2f} 倍"
+                  f"  (均值 {result['平均值']:.6f} 中位数 {result['中位数']:.4f} 众数 {result['众数']})")
+    finally:
+        shm.close()
+        shm.unlink()
+
+BENCHMARKS = {
+    'stats': ("统计: 多进程分块归约 vs 旧四线程", bench_stats),
+}
+
+def run_benchmarks(names=None):
+    """运行性能测试，用法: python CATCALCv5.0.py bench [名字...]"""
+    names = names or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print(color(f"没有叫 {name} 的性能测试，可选: {', '.join(BENCHMARKS)}", T.WARNING))
+            continue
+        title, func = BENCHMARKS[name]
+        print(color(f"=== {title} ===", T.HEADER))
+        func()
+
 # ------------------ 主循环 ------------------
 def main():
+    # 清屏和横幅只在真正启动时做，spawn 方式的工作进程重新导入本文件时不会刷屏
+    os.system('clear')
+    os.system('figlet CATCALC')
+
     # 创建任务管理器
     task_manager = TaskManager(max_workers=4)
     
@@ -1019,7 +1279,7 @@ def main():
             if cmd == '1' or cmd == '':
                 calc_once()
             elif cmd == '2':
-                stats_mode_threaded()
+                stats_mode_parallel()
             elif cmd == '3':
                 base_convert_mode()
             elif cmd == '4':
@@ -1049,4 +1309,7 @@ def main():
                 traceback.print_exc()
 
 if __name__ == '__main__':
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == 'bench':
+        run_benchmarks(sys.argv[2:])
+    else:
+        main()
@@ -0,0 +1,5902 @@
+#!/usr/bin/env python3
+"""CATCALC v7.0 本体喵~ 由 CATCALCv7.0.py 导入启动，这样字节码能缓存进 __pycache__"""
+
+import math
+import cmath
+import os
+import sys
+import operator
+import random
+import itertools
+import functools
+import heapq
+import bisect
+import threading
+import time
+import struct
+import importlib
+import importlib.util
+from collections import namedtuple, OrderedDict, deque
+from decimal import Decimal, getcontext, localcontext
+from fractions import Fraction
+from array import array
+import re
+import mmap
+import ast
+import warnings
+
+# 大数计算器不限制整数转字符串的位数喵~
+if hasattr(sys, 'set_int_max_str_digits'):
+    sys.set_int_max_str_digits(0)
+
+# ------------------ 猫娘延迟加载 ------------------
+class CatgirlLazyModule:
+    """第一次用到属性时才真正 import 的模块喵~
+
+    SymPy 光 import 就要小半秒，菜单根本用不到它；先放一个替身，
+    进了对应的模式第一次用到才加载，加载完把全局名字换成真模块，之后就没有额外开销了喵~
+    """
+    def __init__(self, name, alias):
+        self._name = name
+        self._alias = alias
+
+    def _load(self):
+        module = importlib.import_module(self._name)
+        globals()[self._alias] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        return f"<延迟加载的模块 {self._name!r} 喵>"
+
+def module_available(name):
+    """不 import 就看看装没装这个模块喵~"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+# 任务管理器和 SymPy 工作进程才用得到，启动时不加载喵~
+futures = CatgirlLazyModule('concurrent.futures', 'futures')
+multiprocessing = CatgirlLazyModule('multiprocessing', 'multiprocessing')
+shared_memory = CatgirlLazyModule('multiprocessing.shared_memory', 'shared_memory')
+json = CatgirlLazyModule('json', 'json')  # 只有插件索引用到喵~
+
+# ------------------ SymPy 符号计算库 ------------------
+# 只检查装没装，真正的 import 留到第一次符号计算喵~
+SYMPY_AVAILABLE = module_available('sympy')
+if SYMPY_AVAILABLE:
+    sp = CatgirlLazyModule('sympy', 'sp')
+else:
+    sp = None
+    print("SymPy库未安装喵~，部分高级功能不可用喵。请运行: pip install sympy喵！")
+
+# ------------------ NumPy 数组库(可选) ------------------
+# 有 NumPy 时大数据文件按块解析成 float64 数组，没有也能用 array('d') 慢一点地跑喵~
+NUMPY_AVAILABLE = module_available('numpy')
+np = CatgirlLazyModule('numpy', 'np') if NUMPY_AVAILABLE else None
+
+def _is_ndarray(values):
+    # NumPy 还没加载的话手里不可能有 ndarray，不用为了判断去加载它喵~
+    return NUMPY_AVAILABLE and 'numpy' in sys.modules and isinstance(values, np.ndarray)
+
+# ------------------ 猫娘彩色工具 ------------------
+class T:
+    """猫娘彩色终端很好玩的喵~"""
+    HEADER = '\033[95m'      # 粉色 - 猫娘的可爱
+    OKBLUE = '\033[94m'      # 蓝色 - 猫娘的冷静
+    OKCYAN = '\033[96m'      # 青色 - 猫娘的清新
+    OKGREEN = '\033[92m'     # 绿色 - 猫娘的活力
+    WARNING = '\033[93m'     # 黄色 - 猫娘的提醒
+    FAIL = '\033[91m'        # 红色 - 猫娘的担心
+    ENDC = '\033[0m'         # 结束
+    BOLD = '\033[1m'         # 粗体 - 猫娘的强调
+    UNDERLINE = '\033[4m'    # 下划线 - 猫娘的重点
+
+def color(txt, code): return f"{code}{txt}{T.ENDC}"
+
+# ------------------ 猫娘表情库 ------------------
+class CatgirlEmoji:
+    """猫娘专用表情库喵~"""
+    HAPPY = "(*≧▽≦)"
+    EXCITED = "☆*: .｡. o(≧▽≦)o .｡.:*☆"
+    THINKING = "(￣ω￣;)"
+    SURPRISED = "（゜ロ゜）"
+    SAD = "(｡•́︿•̀｡)"
+    BLUSHING = "(*///▽///*)"
+    CONFUSED = "(￣ω￣;)"
+    DETERMINED = "（￣︶￣）↗"
+    SLEEPY = "(￣o￣) zzZ"
+    WINK = "(￣▽￣)ノ"
+    LOVING = "(づ￣ ³￣)づ"
+    PRAYING = "(｡>﹏<｡)"
+    CELEBRATING = "♪(´▽｀)"
+    CALCULATING = "(￣ー￣)ノ~~~~〜☆"
+    COMFORT = "(｡>﹏<｡)♡"
+
+# ------------------ 猫娘插件加载器 ------------------
+# 约定: 插件模块里 dict FUNC={符号:(名字,函数,需第二数?,需弧度?)}
+PLUGINS = {}
+PLUGIN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plugins")
+PLUGIN_MANIFEST = "_manifest.json"  # 下划线开头，不会被当成插件喵~
+PLUGIN_MANIFEST_VERSION = 1
+
+def _import_plugin(plug_dir, mod_name):
+    sys.path.insert(0, plug_dir)
+    try:
+        return importlib.import_module(mod_name)
+    finally:
+        sys.path.remove(plug_dir)
+
+class CatgirlPluginFunction:
+    """插件运算的替身喵~ 第一次真的被调用时才 import 插件模块"""
+    __slots__ = ('plug_dir', 'module', 'symbol', '_func')
+
+    def __init__(self, plug_dir, module, symbol):
+        self.plug_dir = plug_dir
+        self.module = module
+        self.symbol = symbol
+        self._func = None
+
+    def load(self):
+        if self._func is None:
+            entry = getattr(_import_plugin(self.plug_dir, self.module), "FUNC", {}).get(self.symbol)
+            if entry is None:
+                raise ValueError(f"插件 {self.module} 里已经没有运算 {self.symbol} 了喵~")
+            self._func = entry[1]
+        return self._func
+
+    def __call__(self, *args):
+        return self.load()(*args)
+
+    def __repr__(self):
+        return f"<插件 {self.module} 的运算 {self.symbol!r} 喵>"
+
+def _scan_plugin(plug_dir, fname, stat):
+    """import 一次插件，记下它声明的运算和元数据喵~ 出错也记下来，文件没改就不再试"""
+    entry = {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'ops': {}}
+    try:
+        mod = _import_plugin(plug_dir, fname[:-3])
+        entry['ops'] = {str(symbol): [str(name), bool(need_second), bool(need_rad)]
+                        for symbol, (name, _, need_second, need_rad) in getattr(mod, "FUNC", {}).items()}
+    except Exception as e:
+        entry['error'] = str(e)
+    return entry
+
+def _read_plugin_manifest(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get('version') != PLUGIN_MANIFEST_VERSION:
+        return {}
+    return manifest.get('plugins', {})
+
+def _write_plugin_manifest(path, plugins):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'version': PLUGIN_MANIFEST_VERSION, 'plugins': plugins}, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        # 插件目录不能写也没关系，只是下次还得重新扫描喵~
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+def load_plugins(plug_dir=PLUGIN_DIR):
+    """猫娘加载插件喵~ 返回 {符号: (名字,函数,需第二数?,需弧度?)}
+
+    插件目录里的 _manifest.json 记着每个插件文件的修改时间、大小和声明的运算，
+    文件没变过就直接用记录，不 import；运算第一次被调用时才加载对应的模块。
+    插件再多，启动时也只是读一个索引文件、看一眼目录喵~
+    """
+    if not os.path.isdir(plug_dir):
+        return {}
+    manifest_path = os.path.join(plug_dir, PLUGIN_MANIFEST)
+    manifest = _read_plugin_manifest(manifest_path)
+    fresh, changed = {}, False
+    with os.scandir(plug_dir) as items:
+        for item in items:
+            fname = item.name
+            if not fname.endswith(".py") or fname.startswith("_") or not item.is_file():
+                continue
+            stat = item.stat()
+            entry = manifest.get(fname)
+            if not entry or entry.get('mtime') != stat.st_mtime_ns or entry.get('size') != stat.st_size:
+                entry = _scan_plugin(plug_dir, fname, stat)
+                changed = True
+            fresh[fname] = entry
+    if changed or fresh.keys() != manifest.keys():
+        _write_plugin_manifest(manifest_path, fresh)
+    found = {}
+    for fname in sorted(fresh):
+        entry = fresh[fname]
+        if 'error' in entry:
+            print(color(f"[插件] 加载 {fname} 失败了喵：{entry['error']}", T.WARNING))
+            continue
+        for symbol, (name, need_second, need_rad) in entry['ops'].items():
+            found[symbol] = (name, CatgirlPluginFunction(plug_dir, fname[:-3], symbol), need_second, need_rad)
+    return found
+
+# ------------------ 猫娘任务进度与取消 ------------------
+class CatgirlTaskCancelled(Exception):
+    """任务被主人取消了喵~"""
+
+class CatgirlTaskTimeout(CatgirlTaskCancelled):
+    """任务超过截止时间了喵~"""
+
+class CatgirlTaskContext:
+    """一个任务的进度和取消开关喵~
+
+    计算内核只管调用 report_progress(done, total)，进度就记在这里；
+    每次汇报的时候顺便检查有没有被取消或者超时，有的话就抛异常停下来喵~
+    """
+    def __init__(self, task_id=None, description="", deadline=None):
+        self.task_id = task_id
+        self.description = description
+        self.deadline = deadline  # time.monotonic() 的时间点，None 表示不限时
+        self.done = 0
+        self.total = 0
+        self.started = None
+        self.finished = None
+        self.listeners = []  # 每次汇报都会调用 listener(context)
+        self._cancel_reason = None
+
+    @property
+    def fraction(self):
+        """完成的比例喵~ 还不知道总量时是0"""
+        return min(self.done / self.total, 1.0) if self.total else 0.0
+
+    @property
+    def cancelled(self):
+        return self._cancel_reason is not None
+
+    def cancel(self, reason='cancelled'):
+        """请求取消喵~ 真正停下来要等内核下一次汇报"""
+        if self._cancel_reason is None:
+            self._cancel_reason = reason
+
+    def check(self):
+        """被取消或者超时了就抛异常喵~"""
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            self.cancel('timeout')
+        if self._cancel_reason == 'timeout':
+            raise CatgirlTaskTimeout("任务超时了喵~")
+        if self._cancel_reason is not None:
+            raise CatgirlTaskCancelled("任务被取消了喵~")
+
+    def report(self, done, total=None):
+        """记录进度并检查取消喵~"""
+        self.done = done
+        if total is not None:
+            self.total = total
+        for listener in self.listeners:
+            listener(self)
+        self.check()
+
+_TASK_LOCAL = threading.local()
+
+def current_task():
+    """当前线程正在跑的任务喵~ 不在任务里就是 None"""
+    return getattr(_TASK_LOCAL, 'context', None)
+
+def report_progress(done, total=None):
+    """计算内核汇报进度用的喵~ 不在任务里调用也没关系"""
+    context = current_task()
+    if context is not None:
+        context.report(done, total)
+
+# ------------------ 猫娘多进程后端 ------------------
+# 交给进程池的任务描述: 函数按 模块名 + 限定名 传过去，在子进程里再找回来，
+# control 是父进程建的共享内存控制块的名字，用来传进度和取消信号喵~
+CatgirlTaskSpec = namedtuple('CatgirlTaskSpec', 'module qualname args kwargs control')
+# 大结果放在共享内存里，子进程只把这个小把手传回来喵~
+SharedResult = namedtuple('SharedResult', 'kind name size negative')
+
+# 控制块: [已完成 double][总量 double][开始的时间戳 double][取消标记 1字节]
+# 进度只有子进程写，取消标记只有父进程写，互不覆盖喵~
+CONTROL_PROGRESS = struct.Struct('<ddd')
+CONTROL_FLAG = CONTROL_PROGRESS.size
+CONTROL_SIZE = CONTROL_FLAG + 1
+CANCEL_FLAGS = {'cancelled': 1, 'timeout': 2}
+SHARED_RESULT_BYTES = 1 << 16  # 超过 64KB 的整数和列表走共享内存喵~
+
+def _resolve_task(module, qualname):
+    """按模块名和限定名找回任务函数喵~"""
+    obj = sys.modules[module]
+    for part in qualname.split('.'):
+        obj = getattr(obj, part)
+    return obj
+
+def _share_result(result):
+    """大整数和 int64 列表放进共享内存喵~ 其它结果照常 pickle"""
+    if isinstance(result, int) and not isinstance(result, bool) \
+            and result.bit_length() > 8 * SHARED_RESULT_BYTES:
+        data = abs(result).to_bytes((result.bit_length() + 7) // 8, 'little')
+        kind, negative = 'int', result < 0
+    elif isinstance(result, list) and len(result) * 8 > SHARED_RESULT_BYTES:
+        try:
+            data = array('q', result).tobytes()
+        except (TypeError, OverflowError):
+            return result
+        kind, negative = 'list', False
+    else:
+        return result
+    shm = shared_memory.SharedMemory(create=True, size=len(data))
+    shm.buf[:len(data)] = data
+    handle = SharedResult(kind, shm.name, len(data), negative)
+    shm.close()
+    return handle
+
+def _unshare_result(result):
+    """父进程把共享内存里的结果取出来，顺手释放喵~"""
+    if not isinstance(result, SharedResult):
+        return result
+    shm = shared_memory.SharedMemory(name=result.name)
+    try:
+        data = bytes(shm.buf[:result.size])
+    finally:
+        shm.close()
+        shm.unlink()
+    if result.kind == 'int':
+        value = int.from_bytes(data, 'little')
+        return -value if result.negative else value
+    return array('q', data).tolist()
+
+def _run_in_process(spec):
+    """进程池里执行任务喵~ 进度写进控制块，每次汇报时看看父进程有没有喊停
+
+    共享内存都由父进程 unlink；resource_tracker 是父子进程共用的，
+    子进程里不用再登记或注销喵~
+    """
+    control = shared_memory.SharedMemory(name=spec.control)
+    context = CatgirlTaskContext(description=spec.qualname)
+    started = time.time()
+
+    def sync(ctx):
+        CONTROL_PROGRESS.pack_into(control.buf, 0, float(ctx.done), float(ctx.total), started)
+        flag = control.buf[CONTROL_FLAG]
+        if flag:
+            ctx.cancel('timeout' if flag == CANCEL_FLAGS['timeout'] else 'cancelled')
+
+    context.listeners.append(sync)
+    _TASK_LOCAL.context = context
+    try:
+        context.report(0)  # 标记已开始，顺便检查排队时有没有被取消
+        func = _resolve_task(spec.module, spec.qualname)
+        return _share_result(func(*spec.args, **spec.kwargs))
+    finally:
+        _TASK_LOCAL.context = None
+        control.close()
+
+# ------------------ 猫娘多线程任务管理器 ------------------
+class CatgirlTaskManager:
+    """猫娘多线程任务管理器喵~
+
+    任务结束由 future 的回调记录，截止时间由一个共用的看门狗线程盯着，
+    不再给每个任务单独开监控线程了喵~
+    backend 可以是 'thread'、'process' 或 'auto'：auto 时标成吃CPU的计算
+    (async_calculation_with_moe 装饰过的) 交给进程池，绕开 GIL 真正多核并行喵~
+    """
+    BACKENDS = ('auto', 'thread', 'process')
+
+    def __init__(self, max_workers=4, default_timeout=60, backend='auto', process_workers=None):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"不认识的后端 {backend} 喵~ 可选: {', '.join(self.BACKENDS)}")
+        self.max_workers = max_workers
+        self._executor = None
+        self.backend = backend
+        self.process_workers = process_workers  # None 表示CPU核数
+        self._process_executor = None
+        self.default_timeout = default_timeout  # 秒，None 表示不限时
+        self.tasks = {}  # task_id -> future
+        self.contexts = {}  # task_id -> CatgirlTaskContext
+        self.controls = {}  # task_id -> 进程任务的共享内存控制块
+        self.results = {}  # task_id -> (status, result)
+        self.task_counter = 0
+        self.lock = threading.Lock()
+        self._deadlines = []  # (deadline, task_id) 小根堆
+        self._deadline_cond = threading.Condition()
+        self._watchdog = None
+    
+    def submit_task(self, func, *args, timeout=None, **kwargs):
+        """提交任务喵~ timeout 是这个任务的截止秒数，不给就用 default_timeout"""
+        timeout = self.default_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout if timeout else None
+        with self.lock:
+            self.task_counter += 1
+            task_id = self.task_counter
+            context = CatgirlTaskContext(task_id, getattr(func, 'moe_description', func.__name__), deadline)
+            self.contexts[task_id] = context
+            if self._use_process(func):
+                control = shared_memory.SharedMemory(create=True, size=CONTROL_SIZE)
+                control.buf[:CONTROL_SIZE] = bytes(CONTROL_SIZE)
+                self.controls[task_id] = control
+                spec = CatgirlTaskSpec(func.__module__, func.__qualname__, args, kwargs, control.name)
+                future = self._processes().submit(_run_in_process, spec)
+            else:
+                future = self.executor.submit(self._run, context, func, args, kwargs)
+            self.tasks[task_id] = future
+        future.add_done_callback(lambda f: self._on_done(task_id, f))
+        if deadline is not None:
+            self._watch(deadline, task_id)
+        return task_id
+
+    def _use_process(self, func):
+        """这个任务要不要交给进程池喵~ 子进程找不回来的函数(lambda之类)只能用线程"""
+        if self.backend == 'thread':
+            return False
+        if self.backend == 'auto' and not getattr(func, 'moe_cpu_bound', False):
+            return False
+        try:
+            return _resolve_task(func.__module__, func.__qualname__) is func
+        except (KeyError, AttributeError):
+            return False
+
+    @property
+    def executor(self):
+        """线程池也是第一次提交任务时才建喵~"""
+        if self._executor is None:
+            self._executor = futures.ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def _processes(self):
+        """进程池第一次用到时才启动喵~"""
+        if self._process_executor is None:
+            self._process_executor = futures.ProcessPoolExecutor(max_workers=self.process_workers)
+        return self._process_executor
+
+    def _sync_control(self, task_id):
+        """把进程任务控制块里的进度抄到父进程的上下文里喵~ 要在 self.lock 里调用"""
+        control = self.controls.get(task_id)
+        context = self.contexts.get(task_id)
+        if control is not None and context is not None:
+            self._read_control(context, control)
+
+    @staticmethod
+    def _read_control(context, control):
+        """从控制块读进度 (完成数、总数、开始时间) 喵~"""
+        context.done, context.total, started = CONTROL_PROGRESS.unpack_from(control.buf)
+        if started and context.started is None:
+            # 子进程记的是墙上时间，换算成本进程的 monotonic 喵~
+            context.started = time.monotonic() - (time.time() - started)
+
+    def _signal(self, task_id, reason):
+        """请求任务停下喵~ 进程任务还要把标记写进控制块，要在 self.lock 里调用"""
+        self.contexts[task_id].cancel(reason)
+        control = self.controls.get(task_id)
+        if control is not None:
+            control.buf[CONTROL_FLAG] = CANCEL_FLAGS[reason]
+
+    @staticmethod
+    def _run(context, func, args, kwargs):
+        """在工作线程里挂上任务上下文再跑喵~"""
+        _TASK_LOCAL.context = context
+        context.started = time.monotonic()
+        try:
+            context.check()  # 排队的时候可能就被取消了喵
+            return func(*args, **kwargs)
+        finally:
+            context.finished = time.monotonic()
+            _TASK_LOCAL.context = None
+
+    def _on_done(self, task_id, future):
+        """任务结束的回调喵~ 超时已经记过的就不覆盖了
+
+        超时的任务结果可能已经被 cleanup_completed 清掉了，上下文要用 get 取；
+        控制块不管怎样都在 finally 里释放，不然共享内存会漏掉喵~
+        """
+        control = None
+        try:
+            with self.lock:
+                control = self.controls.pop(task_id, None)
+                context = self.contexts.get(task_id)
+                if context is not None and control is not None:
+                    self._read_control(context, control)
+                    context.finished = time.monotonic()
+        finally:
+            if control is not None:
+                control.close()
+                control.unlink()
+        if context is None:
+            return
+        if future.cancelled():
+            reason = context._cancel_reason
+            outcome = ('timeout' if reason == 'timeout' else 'cancelled', None)
+        else:
+            error = future.exception()
+            if error is None:
+                try:
+                    outcome = ('completed', _unshare_result(future.result()))
+                except OSError as e:
+                    outcome = ('error', f"共享内存里的结果取不出来了: {e}")
+            elif isinstance(error, CatgirlTaskTimeout):
+                outcome = ('timeout', None)
+            elif isinstance(error, CatgirlTaskCancelled):
+                outcome = ('cancelled', None)
+            else:
+                outcome = ('error', str(error))
+        with self.lock:
+            self.results.setdefault(task_id, outcome)
+
+    def _watch(self, deadline, task_id):
+        """把截止时间交给看门狗喵~ 看门狗只有一个，第一次用到时才启动"""
+        with self._deadline_cond:
+            heapq.heappush(self._deadlines, (deadline, task_id))
+            if self._watchdog is None:
+                self._watchdog = threading.Thread(target=self._watch_deadlines, daemon=True)
+                self._watchdog.start()
+            self._deadline_cond.notify()
+
+    def _watch_deadlines(self):
+        """看门狗: 睡到最近的截止时间，到点就让任务超时喵~"""
+        while True:
+            with self._deadline_cond:
+                while not self._deadlines:
+                    self._deadline_cond.wait()
+                deadline, task_id = self._deadlines[0]
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    self._deadline_cond.wait(delay)
+                    continue
+                heapq.heappop(self._deadlines)
+            self._expire(task_id)
+
+    def _expire(self, task_id):
+        """任务到点了喵~ 还在排队的直接取消，在跑的等它下次汇报时停下"""
+        with self.lock:
+            future = self.tasks.get(task_id)
+            context = self.contexts.get(task_id)
+            if future is None or future.done():
+                return
+            self._signal(task_id, 'timeout')
+            self.results.setdefault(task_id, ('timeout', None))
+        future.cancel()
+
+    def cancel_task(self, task_id):
+        """取消任务喵~ 返回是否找到了还没结束的任务"""
+        with self.lock:
+            future = self.tasks.get(task_id)
+            if future is None or future.done():
+                return False
+            self._signal(task_id, 'cancelled')
+        future.cancel()
+        return True
+    
+    def get_result(self, task_id):
+        """获取任务结果喵~"""
+        with self.lock:
+            if task_id in self.results:
+                status, result = self.results[task_id]
+                if status == 'completed':
+                    return True, result
+                elif status == 'timeout':
+                    return False, "任务超时了喵~"
+                elif status == 'cancelled':
+                    return False, "任务被取消了喵~"
+                elif status == 'error':
+                    return False, f"任务出错了喵~: {result}"
+            elif task_id in self.tasks:
+                if self.contexts[task_id].cancelled:
+                    return None, "任务正在停下来喵~..."
+                return None, "任务还在努力进行中喵~..."
+            else:
+                return False, "找不到这个任务ID喵~"
+    
+    def get_task_status(self, task_id):
+        """获取任务状态喵~"""
+        with self.lock:
+            if task_id in self.results:
+                return self.results[task_id][0]
+            elif task_id in self.tasks:
+                self._sync_control(task_id)
+                context = self.contexts[task_id]
+                if context.cancelled:
+                    return 'cancelling'
+                return 'running' if context.started is not None else 'pending'
+            else:
+                return 'not_found'
+
+    def get_progress(self, task_id):
+        """任务的进度喵~ 返回 (完成比例, 已用秒数, 描述)，找不到就是 None"""
+        with self.lock:
+            context = self.contexts.get(task_id)
+            if context is None:
+                return None
+            self._sync_control(task_id)
+        if context.started is None:
+            elapsed = 0.0
+        else:
+            elapsed = (context.finished or time.monotonic()) - context.started
+        return context.fraction, elapsed, context.description
+    
+    def cleanup_completed(self):
+        """清理已完成的任务喵~"""
+        with self.lock:
+            completed_tasks = [tid for tid, (status, _) in self.results.items() 
+                             if status in ['completed', 'timeout', 'cancelled', 'error']]
+            for tid in completed_tasks:
+                if tid in self.tasks and self.tasks[tid].done():
+                    del self.tasks[tid]
+                    del self.contexts[tid]
+                    del self.results[tid]
+
+    def shutdown(self, cancel=True):
+        """关掉任务管理器喵~ 默认先请求取消所有还没结束的任务"""
+        if cancel:
+            with self.lock:
+                pending = list(self.tasks)
+            for task_id in pending:
+                self.cancel_task(task_id)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        if self._process_executor is not None:
+            self._process_executor.shutdown(wait=True)
+
+# ------------------ 猫娘进度条 ------------------
+class CatgirlProgressBar:
+    """猫娘专用进度条喵~"""
+    def __init__(self, total=100, width=50):
+        self.total = total
+        self.width = width
+        self.current = 0
+        self.start_time = None
+        self.lock = threading.Lock()
+    
+    def start(self):
+        """开始进度条喵~"""
+        self.start_time = time.time()
+        self.update(0)
+    
+    def update(self, current):
+        """更新进度喵~"""
+        with self.lock:
+            self.current = current
+            percent = current / self.total
+            filled = int(self.width * percent)
+            bar = '♡' * filled + '·' * (self.width - filled)
+            
+            elapsed = time.time() - self.start_time if self.start_time else 0
+            eta = (elapsed / current * (self.total - current)) if current > 0 else 0
+            
+            print(f'\r|{bar}| {percent:.1%} 预计剩余时间: {eta:.1f}秒 ', end='', flush=True)
+    
+    def finish(self):
+        """完成进度条喵~"""
+        self.update(self.total)
+        print()  # 换行
+        elapsed = time.time() - self.start_time if self.start_time else 0
+        print(f"完成喵~! 用时: {elapsed:.2f}秒 {CatgirlEmoji.CELEBRATING}")
+
+# ------------------ 猫娘异步计算装饰器 ------------------
+def async_calculation_with_moe(description="计算中喵~", cpu_bound=True):
+    """带萌感的异步计算装饰器喵~
+
+    在任务管理器里跑时，进度交给任务上下文，随时可以查可以取消；
+    直接调用时，内核汇报的真实进度会画成猫娘进度条喵~
+    cpu_bound 的任务在 auto 后端下会交给进程池。
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            context = current_task()
+            if context is not None:
+                context.description = description
+                return func(*args, **kwargs)
+            
+            # 创建猫娘进度条
+            progress = CatgirlProgressBar(total=100)
+            context = CatgirlTaskContext(description=description)
+            shown = [-1]
+            def draw(ctx):
+                percent = int(100 * ctx.fraction)
+                if percent != shown[0]:  # 百分比变了才重画喵~
+                    shown[0] = percent
+                    progress.update(percent)
+            context.listeners.append(draw)
+            print(f"{CatgirlEmoji.CALCULATING} 开始{description}...")
+            progress.start()
+            _TASK_LOCAL.context = context
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                _TASK_LOCAL.context = None
+            progress.finish()
+            return result
+        wrapper.moe_description = description
+        wrapper.moe_cpu_bound = cpu_bound
+        return wrapper
+    return decorator
+
+# ------------------ 猫娘分段素数筛 ------------------
+class CatgirlPrimeSieve:
+    """猫娘分段埃氏筛喵~ 只存奇数，一段一段地吐出素数，内存不会爆喵~"""
+    SEGMENT_SIZE = 1 << 18  # 每段的奇数个数，256KB刚好装进缓存喵~
+
+    @staticmethod
+    def base_primes(limit):
+        """小筛子: 返回 <= limit 的所有素数喵~"""
+        if limit < 2:
+            return []
+        sieve = bytearray([1]) * (limit // 2 + 1)  # 下标i代表奇数2i+1
+        sieve[0] = 0
+        for i in range(1, (math.isqrt(limit) - 1) // 2 + 1):
+            if sieve[i]:
+                p = 2 * i + 1
+                start = p * p // 2
+                sieve[start::p] = bytes(len(range(start, len(sieve), p)))
+        primes = [2]
+        primes.extend(2 * i + 1 for i in itertools.compress(range(len(sieve)), sieve)
+                      if 2 * i + 1 <= limit)
+        return primes
+
+    @classmethod
+    def segments(cls, lo, hi, segment_size=None):
+        """按段产出 (段起点奇数, 标记bytearray) 喵~ 标记下标i代表 起点+2i"""
+        segment_size = segment_size or cls.SEGMENT_SIZE
+        lo = max(lo, 3) | 1
+        if hi <= lo:
+            return
+        base = cls.base_primes(math.isqrt(hi - 1))[1:]
+        for seg_lo in range(lo, hi, 2 * segment_size):
+            seg_hi = min(seg_lo + 2 * segment_size, hi)
+            size = (seg_hi - seg_lo + 1) // 2
+            seg = bytearray([1]) * size
+            for p in base:
+                pp = p * p
+                if pp >= seg_hi:
+                    break
+                if pp >= seg_lo:
+                    start = (pp - seg_lo) // 2
+                else:
+                    first = -(-seg_lo // p) * p
+                    if first % 2 == 0:
+                        first += p
+                    start = (first - seg_lo) // 2
+                if start < size:
+                    seg[start::p] = bytes(len(range(start, size, p)))
+            yield seg_lo, seg
+
+    @classmethod
+    def iter_primes(cls, lo, hi, segment_size=None):
+        """生成 [lo, hi) 区间里的素数喵~"""
+        if lo <= 2 < hi:
+            yield 2
+        for seg_lo, seg in cls.segments(lo, hi, segment_size):
+            yield from itertools.compress(range(seg_lo, seg_lo + 2 * len(seg), 2), seg)
+
+    @classmethod
+    def count_primes(cls, lo, hi, segment_size=None):
+        """数一数 [lo, hi) 区间里有多少素数喵~"""
+        count = 1 if lo <= 2 < hi else 0
+        for _, seg in cls.segments(lo, hi, segment_size):
+            count += seg.count(1)
+        return count
+
+# ------------------ 猫娘素数计数 ------------------
+# 进程池里的子进程各自挂上同一组共享内存数组喵~
+_LUCY_ARRAYS = {}
+
+def _lucy_worker_init(names):
+    """子进程启动时挂上 large/small/scratch 三个共享数组喵~"""
+    for key, name in names.items():
+        shm = shared_memory.SharedMemory(name=name)
+        _LUCY_ARRAYS[key] = (shm, shm.buf.cast('q'))
+
+def _lucy_worker_sweep(job):
+    """子进程里更新一块下标喵~ job = (种类, x, p, c, lo, hi)"""
+    kind, x, p, c, lo, hi = job
+    arrays = {key: view for key, (_, view) in _LUCY_ARRAYS.items()}
+    CatgirlPrimeCounter.sweep(kind, x, p, c, lo, hi, arrays['large'], arrays['small'], arrays['scratch'])
+
+class CatgirlPrimeCounter:
+    """Lucy_Hedgehog 算法数 π(x) 喵~ O(x^(3/4)) 时间、O(√x) 内存，不用把素数列出来
+
+    S(v) 是 [2, v] 里还没被筛掉的数的个数，只需要 v = x // k 这 2√x 个值:
+    small[v] = S(v) (v <= √x)，large[i] = S(x // i) (i <= √x)。
+    依次用每个素数 p <= √x 更新 S(v) -= S(v // p) - S(p - 1)，最后 large[1] 就是 π(x)。
+    同一个 p 的更新里各下标互不依赖，两段大循环切成块交给进程池喵~
+    """
+    PARALLEL_MIN = 10**10   # 比这小的 x 单进程几秒就数完了喵~
+    CHUNK = 1 << 16         # 每块至少这么多个下标，太碎了进程间通信不划算
+
+    @staticmethod
+    def sweep(kind, x, p, c, lo, hi, large, small, scratch):
+        """更新 [lo, hi) 这一块下标喵~ 读的都是这一轮还没改过的值，所以可以分块并行
+
+        large: i*p > √x 的部分，S(x // (i p)) 在 small 里；
+        small: v >= p² 的部分，S(v // p) 从父进程拍好的快照 scratch 里读。
+        """
+        if kind == 'large':
+            values = [v - small[x // (i * p)] + c for i, v in zip(range(lo, hi), large[lo:hi])]
+            large[lo:hi] = array('q', values)
+        else:
+            values = [s - scratch[v // p] + c for v, s in zip(range(lo, hi), small[lo:hi])]
+            small[lo:hi] = array('q', values)
+
+    @classmethod
+    def default_workers(cls, x):
+        """x 够大才值得拉起进程池喵~"""
+        return (os.cpu_count() or 1) if x >= cls.PARALLEL_MIN else 1
+
+    @classmethod
+    def count(cls, x, workers=None, progress=None):
+        """π(x): 不超过 x 的素数个数喵~ workers > 1 时把每轮的大循环分给进程池"""
+        x = int(x)
+        if x < 2:
+            return 0
+        r = math.isqrt(x)
+        workers = cls.default_workers(x) if workers is None else max(1, int(workers))
+        if workers == 1 or r < 2 * cls.CHUNK:
+            large = array('q', [0] + [x // i - 1 for i in range(1, r + 1)])
+            small = array('q', range(-1, r))
+            scratch = array('q', bytes(8 * (r // 2 + 1)))
+            run = lambda kind, p, c, lo, hi: cls.sweep(kind, x, p, c, lo, hi, large, small, scratch)
+            return cls._lucy(x, large, small, scratch, run, progress)
+        return cls._count_parallel(x, r, workers, progress)
+
+    @classmethod
+    def _lucy(cls, x, large, small, scratch, run, progress=None):
+        """Lucy 主循环喵~ 每个素数一轮，run(种类, p, c, lo, hi) 负责 (可能并行地) 更新一段"""
+        r = len(small) - 1
+        primes = CatgirlPrimeSieve.base_primes(r)
+        # 每轮的工作量大约是 min(√x, x/p²) + (√x - p²)，按它估算进度喵~
+        work = [min(r, x // (p * p)) + max(0, r - p * p + 1) for p in primes]
+        total, done = sum(work), 0
+        for p, amount in zip(primes, work):
+            c = small[p - 1]
+            p2 = p * p
+            end = min(r, x // p2)
+            head = min(end, r // p)
+            # i*p <= √x 的这一小段读的是 large 自己，必须在大段之前、在本进程里做完喵~
+            large[1:head + 1] = array('q', [large[i] - large[i * p] + c for i in range(1, head + 1)])
+            if end > head:
+                run('large', p, c, head + 1, end + 1)
+            if p2 <= r:
+                m = r // p + 1
+                scratch[:m] = small[:m]
+                run('small', p, c, p2, r + 1)
+            done += amount
+            if progress:
+                progress(done, total)
+        return large[1]
+
+    @classmethod
+    def _count_parallel(cls, x, r, workers, progress=None):
+        """三个数组放进共享内存，每轮把大循环切块交给进程池喵~"""
+        sizes = {'large': r + 1, 'small': r + 1, 'scratch': r // 2 + 1}
+        blocks, views = {}, {}
+        pool = None
+        try:
+            for key, size in sizes.items():
+                blocks[key] = shared_memory.SharedMemory(create=True, size=8 * size)
+                views[key] = blocks[key].buf.cast('q')
+            large, small, scratch = views['large'], views['small'], views['scratch']
+            for i in range(0, r + 1, cls.CHUNK):
+                hi = min(i + cls.CHUNK, r + 1)
+                large[i:hi] = array('q', [x // k - 1 if k else 0 for k in range(i, hi)])
+                small[i:hi] = array('q', range(i - 1, hi - 1))
+            pool = futures.ProcessPoolExecutor(
+                max_workers=workers, initializer=_lucy_worker_init,
+                initargs=({key: shm.name for key, shm in blocks.items()},))
+
+            def run(kind, p, c, lo, hi):
+                step = max(cls.CHUNK, -(-(hi - lo) // workers))
+                jobs = [(kind, x, p, c, a, min(a + step, hi)) for a in range(lo, hi, step)]
+                if len(jobs) == 1:
+                    cls.sweep(kind, x, p, c, lo, hi, large, small, scratch)
+                else:
+                    list(pool.map(_lucy_worker_sweep, jobs))
+
+            return cls._lucy(x, large, small, scratch, run, progress)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+            for view in views.values():
+                view.release()
+            for shm in blocks.values():
+                shm.close()
+                shm.unlink()
+
+# ------------------ 猫娘高性能计算 ------------------
+class CatgirlHighPerformanceCalculator:
+    """猫娘高性能计算器喵~"""
+    
+    @staticmethod
+    @async_calculation_with_moe("计算大数阶乘喵~")
+    def large_factorial(n, digits_only=False):
+        """大数阶乘计算喵~ 进度跟着真实的计算走，不再假装睡觉了喵"""
+        if n < 0 or n != int(n):
+            return math.gamma(n + 1)
+        n = int(n)
+        result = CatgirlHighPerformanceCalculator.factorial_prime_swing(n, progress=report_progress)
+        if digits_only:
+            return describe_big_int(result, trailing_zeros=CatgirlHighPerformanceCalculator.factorial_trailing_zeros(n))
+        return result
+
+    @staticmethod
+    def product_tree(values):
+        """乘积树(二分乘法)喵~ 两两相乘，让大数乘法的两边差不多大"""
+        values = list(values)
+        if not values:
+            return 1
+        while len(values) > 1:
+            paired = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)]
+            if len(values) % 2:
+                paired.append(values[-1])
+            values = paired
+        return values[0]
+
+    @staticmethod
+    def _swing_odd_part(m, primes):
+        """摆动阶乘 m≀ = m! / ((m//2)!)^2 的奇数部分喵~ primes是升序的奇素数"""
+        factors = []
+        root = math.isqrt(m)
+        for p in primes[:bisect.bisect_right(primes, m)]:
+            if p <= root:
+                # 小素数: 数一数 m/p^k 里有几个是奇数喵~
+                q, power = m, 1
+                while q >= p:
+                    q //= p
+                    if q & 1:
+                        power *= p
+                if power > 1:
+                    factors.append(power)
+            elif (m // p) & 1:
+                factors.append(p)
+        return CatgirlHighPerformanceCalculator.product_tree(factors)
+
+    @staticmethod
+    def factorial_prime_swing(n, progress=None):
+        """素数摆动 + 乘积树算 n! 喵~ n! = ((n//2)!)^2 * n≀，2的幂最后一次左移补上"""
+        if n < 2:
+            return 1
+        primes = array('q', CatgirlPrimeSieve.iter_primes(3, n + 1))
+        levels = []
+        m = n
+        while m > 1:
+            levels.append(m)
+            m //= 2
+        total = sum(levels)
+        done = 0
+        odd = 1
+        for m in reversed(levels):
+            odd = odd * odd * CatgirlHighPerformanceCalculator._swing_odd_part(m, primes)
+            done += m
+            if progress:
+                progress(done, total)
+        return odd << (n - bin(n).count('1'))
+
+    @staticmethod
+    def factorial_trailing_zeros(n):
+        """n! 末尾有几个0喵~ (勒让德公式)"""
+        zeros, p = 0, 5
+        while p <= n:
+            zeros += n // p
+            p *= 5
+        return zeros
+    
+    @staticmethod
+    @async_calculation_with_moe("计算斐波那契数列喵~")
+    def fibonacci_sequence(n):
+        """计算斐波那契数列喵~"""
+        sequence = []
+        for i, value in enumerate(CatgirlHighPerformanceCalculator.iter_fibonacci(n)):
+            sequence.append(value)
+            if i % 1024 == 0:
+                report_progress(i, n)
+        return sequence
+
+    @staticmethod
+    def fibonacci_pair(n, progress=None):
+        """快速倍增法求 (F(n), F(n+1)) 喵~ 只要 O(log n) 次大数乘法"""
+        a, b = 0, 1
+        bits = bin(n)[2:]
+        for i, bit in enumerate(bits):
+            if progress:
+                # 每轮数字长度翻倍，后面的轮次最费时间，按 2^i 估算进度喵~
+                progress((1 << i) - 1, (1 << len(bits)) - 1)
+            c = a * (2 * b - a)   # F(2k)
+            d = a * a + b * b     # F(2k+1)
+            if bit == '1':
+                a, b = d, c + d
+            else:
+                a, b = c, d
+        return a, b
+
+    @staticmethod
+    @async_calculation_with_moe("计算斐波那契第n项喵~")
+    def fibonacci_nth(n):
+        """斐波那契第n项 F(n) 喵~ (F(0)=0)"""
+        if n < 0:
+            # F(-n) = (-1)^(n+1) F(n) 喵~
+            value = CatgirlHighPerformanceCalculator.fibonacci_pair(-n, report_progress)[0]
+            return value if n % 2 else -value
+        return CatgirlHighPerformanceCalculator.fibonacci_pair(n, report_progress)[0]
+
+    @staticmethod
+    def iter_fibonacci(n, start=0):
+        """一项一项地生成 F(start)..F(start+n-1) 喵~ 不会把整个数列放在内存里"""
+        a, b = CatgirlHighPerformanceCalculator.fibonacci_pair(start)
+        for _ in range(max(n, 0)):
+            yield a
+            a, b = b, a + b
+
+    @staticmethod
+    @async_calculation_with_moe("把斐波那契数列写进文件喵~")
+    def fibonacci_to_file(n, path, start=0):
+        """把斐波那契数列一行一项地流式写入文件喵~ 返回写入的项数"""
+        count = 0
+        with open(path, 'w', encoding='utf-8') as f:
+            for value in CatgirlHighPerformanceCalculator.iter_fibonacci(n, start):
+                f.write(f"{value}\n")
+                count += 1
+                if count % 1024 == 0:
+                    report_progress(count, n)
+        return count
+    
+    @staticmethod
+    @async_calculation_with_moe("计算素数喵~")
+    def prime_numbers(limit, lower=2):
+        """用分段筛计算 [lower, limit] 里的素数喵~"""
+        if limit < 2:
+            return []
+        primes = [2] if lower <= 2 else []
+        span = limit + 1 - lower
+        for seg_lo, seg in CatgirlPrimeSieve.segments(lower, limit + 1):
+            seg_hi = seg_lo + 2 * len(seg)
+            primes.extend(itertools.compress(range(seg_lo, seg_hi, 2), seg))
+            report_progress(seg_hi - lower, span)
+        return primes
+
+    @staticmethod
+    @async_calculation_with_moe("数素数个数喵~")
+    def prime_count(x, workers=None):
+        """π(x): 不超过 x 的素数有多少个喵~ 不列出素数，10^12 也数得出来"""
+        return CatgirlPrimeCounter.count(x, workers, progress=report_progress)
+    
+    @staticmethod
+    @async_calculation_with_moe("计算π的近似值喵~")
+    def calculate_pi(precision):
+        """使用莱布尼茨公式计算π喵~"""
+        pi_approx = 0
+        sign = 1
+        
+        for i in range(precision):
+            term = sign / (2 * i + 1)
+            pi_approx += term
+            sign *= -1
+            
+            if i % 10000 == 0:  # 每10000步汇报一次进度喵~
+                report_progress(i, precision)
+        
+        return pi_approx * 4
+
+# ------------------ 猫娘SymPy符号计算器 ------------------
+SYMPY_CACHE_SIZE = 256  # 解析结果和运算结果各缓存这么多条喵~
+SYMPY_TIMEOUT = 20.0    # 昂贵运算最多等这么多秒，超时就把子进程杀掉喵~
+# 这些运算可能算很久 (甚至算不完)，放进独立子进程里跑；求导、展开这种很快的就在本进程算喵~
+SYMPY_HEAVY_OPS = frozenset({'solve', 'solve_system', 'integrate', 'limit', 'simplify', 'factor', 'series'})
+
+def _sympy_integrate(expr, var, bounds=None):
+    return sp.integrate(expr, (var, *bounds)) if bounds else sp.integrate(expr, var)
+
+SYMPY_OPERATIONS = {
+    'solve': lambda expr, var: sp.solve(expr, var),
+    'solve_system': lambda equations, variables: sp.solve(list(equations), list(variables)),
+    'diff': lambda expr, var, order: sp.diff(expr, var, order),
+    'integrate': _sympy_integrate,
+    'limit': lambda expr, var, point: sp.limit(expr, var, point),
+    'simplify': lambda expr: sp.simplify(expr),
+    'expand': lambda expr: sp.expand(expr),
+    'factor': lambda expr: sp.factor(expr),
+    'series': lambda expr, var, point, n: sp.series(expr, var, point, n),
+}
+
+def _sympy_worker_loop(conn):
+    """SymPy 子进程的主循环喵~ 收到 (运算名, 参数) 就算，回 (成功?, 结果或错误信息)，收到 None 就退出"""
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            break
+        if job is None:
+            break
+        op, args = job
+        try:
+            reply = (True, SYMPY_OPERATIONS[op](*args))
+        except Exception as e:
+            reply = (False, f"{type(e).__name__}: {e}")
+        try:
+            conn.send(reply)
+        except Exception as e:  # 结果没法 pickle 之类的喵~
+            conn.send((False, f"{type(e).__name__}: {e}"))
+    conn.close()
+
+class CatgirlSymPyWorker:
+    """跑昂贵 SymPy 运算的常驻子进程喵~
+
+    simplify/integrate/solve 不会汇报进度，没法靠 report_progress 喊停，
+    所以放进单独的进程里：等结果时每隔一小会儿看一眼超时、任务取消和 Ctrl+C，
+    需要停的时候直接把进程杀掉，下次用到再开一个新的喵~
+    """
+    POLL = 0.05
+
+    def __init__(self):
+        self.process = None
+        self.conn = None
+        self.lock = threading.Lock()
+
+    def _start(self):
+        parent, child = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_sympy_worker_loop, args=(child,),
+                                               name="catgirl-sympy", daemon=True)
+        self.process.start()
+        child.close()
+        self.conn = parent
+
+    def kill(self):
+        """立刻杀掉子进程喵~"""
+        if self.process is not None:
+            self.process.kill()
+            self.process.join()
+            self.conn.close()
+        self.process = self.conn = None
+
+    def close(self):
+        """让子进程自己退出喵~"""
+        with self.lock:
+            if self.process is not None and self.process.is_alive():
+                try:
+                    self.conn.send(None)
+                    self.process.join(1.0)
+                except OSError:
+                    pass
+            self.kill()
+
+    def run(self, op, args, timeout=None):
+        """在子进程里算一次喵~ 超时抛 CatgirlTaskTimeout，运算出错抛 ValueError"""
+        with self.lock:
+            if self.process is None or not self.process.is_alive():
+                self._start()
+            deadline = None if timeout is None else time.monotonic() + timeout
+            try:
+                self.conn.send((op, args))
+                while not self.conn.poll(self.POLL):
+                    if not self.process.is_alive():
+                        raise ValueError("SymPy 子进程意外退出了喵~")
+                    if deadline is not None and time.monotonic() > deadline:
+                        raise CatgirlTaskTimeout(f"算了 {timeout:g} 秒还没算完喵~")
+                    context = current_task()
+                    if context is not None:
+                        context.check()
+                ok, value = self.conn.recv()
+            except BaseException:
+                self.kill()  # 超时、取消、Ctrl+C 和通信出错都直接杀掉，别留半截任务喵~
+                raise
+        if not ok:
+            raise ValueError(value)
+        return value
+
+SYMPY_WORKER = CatgirlSymPyWorker()
+_SYMPY_RESULTS = OrderedDict()
+_SYMPY_RESULTS_LOCK = threading.Lock()
+
+def _normalize_sympy_text(text):
+    """规整输入喵~ 连续空白并成一个、^ 换成 **，只差空格的输入共用一条解析缓存"""
+    return ' '.join(text.split()).replace('^', '**')
+
+@functools.lru_cache(maxsize=SYMPY_CACHE_SIZE)
+def parse_sympy(text, names=()):
+    """把 (已经规整过的) 字符串解析成 SymPy 表达式喵~ 按文本和已定义的符号名缓存
+
+    'a = b' (或 'a == b') 解析成方程 Eq(a, b)；e 是自然常数 (除非主人自己定义了符号 e)。
+    """
+    from sympy.parsing.sympy_parser import parse_expr, standard_transformations, convert_xor
+    local = {'e': sp.E}
+    local.update((name, sp.Symbol(name)) for name in names)
+    parse = functools.partial(parse_expr, local_dict=local,
+                              transformations=standard_transformations + (convert_xor,))
+    sides = re.split(r'==|(?<![<>!])=', text)
+    if len(sides) > 2:
+        raise ValueError("一个方程只能有一个等号喵~")
+    if len(sides) == 2:
+        return sp.Eq(parse(sides[0]), parse(sides[1]))
+    return parse(text)
+
+def sympy_compute(op, args, timeout=None):
+    """带缓存地做一次 SymPy 运算喵~ 键是 (运算名, 参数)，参数里的表达式是解析好的
+    SymPy 对象，所以 x+y 和 y + x 是同一条缓存。昂贵运算交给子进程，超时和出错不进缓存"""
+    key = (op, args)
+    with _SYMPY_RESULTS_LOCK:
+        if key in _SYMPY_RESULTS:
+            _SYMPY_RESULTS.move_to_end(key)
+            return _SYMPY_RESULTS[key]
+    if op in SYMPY_HEAVY_OPS:
+        result = SYMPY_WORKER.run(op, args, SYMPY_TIMEOUT if timeout is None else timeout)
+    else:
+        result = SYMPY_OPERATIONS[op](*args)
+    with _SYMPY_RESULTS_LOCK:
+        _SYMPY_RESULTS[key] = result
+        while len(_SYMPY_RESULTS) > SYMPY_CACHE_SIZE:
+            _SYMPY_RESULTS.popitem(last=False)
+    return result
+
+def sympy_cache_info():
+    """(解析缓存命中, 解析缓存条数, 结果缓存条数) 喵~"""
+    info = parse_sympy.cache_info()
+    with _SYMPY_RESULTS_LOCK:
+        return info.hits, info.currsize, len(_SYMPY_RESULTS)
+
+def clear_sympy_cache():
+    parse_sympy.cache_clear()
+    lambdify_sympy.cache_clear()
+    with _SYMPY_RESULTS_LOCK:
+        _SYMPY_RESULTS.clear()
+
+class CatgirlSymPyCalculator:
+    """猫娘SymPy符号计算器喵~
+
+    表达式解析和运算结果都放在全局的 LRU 缓存里 (见 parse_sympy / sympy_compute)，
+    同一个表达式求导、积分、级数展开只解析一次，整个会话里重复的问题马上就有答案喵~
+    """
+    
+    def __init__(self, timeout=None):
+        self.symbols_dict = {}
+        self.expressions = {}
+        self.timeout = timeout  # None 表示用 SYMPY_TIMEOUT
+    
+    def create_symbols(self, symbol_names):
+        """创建符号变量喵~"""
+        try:
+            symbols_list = sp.symbols(symbol_names)
+            if isinstance(symbols_list, tuple):
+                for sym in symbols_list:
+                    self.symbols_dict[str(sym)] = sym
+            else:
+                self.symbols_dict[str(symbols_list)] = symbols_list
+            return True, f"已经创建好符号了喵: {symbol_names} {CatgirlEmoji.HAPPY}"
+        except Exception as e:
+            return False, f"创建符号失败了喵...: {e} {CatgirlEmoji.SAD}"
+
+    def _compute(self, op, *args):
+        return sympy_compute(op, args, self.timeout)
+
+    def _timeout_message(self):
+        timeout = SYMPY_TIMEOUT if self.timeout is None else self.timeout
+        return f"算了 {timeout:g} 秒还没算完，猫娘先停下来了喵~ {CatgirlEmoji.SAD}"
+    
+    def solve_equation(self, equation_str, variable_str):
+        """求解方程喵~"""
+        try:
+            if variable_str not in self.symbols_dict:
+                return False, f"符号 {variable_str} 还没有定义喵... {CatgirlEmoji.CONFUSED}"
+            
+            var = self.symbols_dict[variable_str]
+            # 解析方程
+            equation = self.parse_expression(equation_str)
+            solutions = self._compute('solve', equation, var)
+            
+            return True, solutions
+        except CatgirlTaskTimeout:
+            return False, self._timeout_message()
+        except Exception as e:
+            return False, f"求解方程遇到了困难喵...: {e} {CatgirlEmoji.THINKING}"
+    
+    def solve_equation_system(self, equations, variables):
+        """求解方程组喵~"""
+        try:
+            eq_list = []
+            for eq_str in equations:
+                eq = self.parse_expression(eq_str)
+                if isinstance(eq, sp.Eq):
+                    eq_list.append(eq)
+                else:
+                    # 假设方程形式为 expr = 0
+                    eq_list.append(sp.Eq(eq, 0))
+            
+            var_list = [self.symbols_dict[var] for var in variables if var in self.symbols_dict]
+            solutions = self._compute('solve_system', tuple(eq_list), tuple(var_list))
+            
+            return True, solutions
+        except CatgirlTaskTimeout:
+            return False, self._timeout_message()
+        except Exception as e:
+            return False, f"求解方程组失败了喵...: {e} {CatgirlEmoji.SAD}"
+    
+    def calculate_derivative(self, expr_str, variable_str, order=1):
+        """计算导数喵~"""
+        try:
+            if variable_str not in self.symbols_dict:
+                return False, f"符号 {variable_str} 还没有定义喵... {CatgirlEmoji.CONFUSED}"
+            
+            expr = self.parse_expression(expr_str)
+            var = self.symbols_dict[variable_str]
+            
+            derivative = self._compute('diff', expr, var, order)
+            return True, derivative
+        except Exception as e:
+            return False, f"计算导数出错了喵...: {e} {CatgirlEmoji.THINKING}"
+    
+    def calculate_integral(self, expr_str, variable_str, definite=None):
+        """计算积分喵~ definite=(a, b) 时是定积分"""
+        try:
+            if variable_str not in self.symbols_dict:
+                return False, f"符号 {variable_str} 还没有定义喵... {CatgirlEmoji.CONFUSED}"
+            
+            expr = self.parse_expression(expr_str)
+            var = self.symbols_dict[variable_str]
+            
+            result = self._compute('integrate', expr, var, tuple(definite) if definite else None)
+            return True, result
+        except CatgirlTaskTimeout:
+            return False, self._timeout_message()
+        except Exception as e:
+            return False, f"计算积分遇到了问题喵...: {e} {CatgirlEmoji.SAD}"
+    
+    def calculate_limit(self, expr_str, variable_str, point):
+        """计算极限喵~"""
+        try:
+            if variable_str not in self.symbols_dict:
+                return False, f"符号 {variable_str} 还没有定义喵... {CatgirlEmoji.CONFUSED}"
+            
+            expr = self.parse_expression(expr_str)
+            var = self.symbols_dict[variable_str]
+            
+            limit_result = self._compute('limit', expr, var, point)
+            return True, limit_result
+        except CatgirlTaskTimeout:
+            return False, self._timeout_message()
+        except Exception as e:
+            return False, f"计算极限失败了喵...: {e} {CatgirlEmoji.THINKING}"
+    
+    def simplify_expression(self, expr_str):
+        """简化表达式喵~"""
+        try:
+            simplified = self._compute('simplify', self.parse_expression(expr_str))
+            return True, simplified
+        except CatgirlTaskTimeout:
+            return False, self._timeout_message()
+        except Exception as e:
+            return False, f"简化表达式出错了喵...: {e} {CatgirlEmoji.SAD}"
+    
+    def expand_expression(self, expr_str):
+        """展开表达式喵~"""
+        try:
+            expanded = self._compute('expand', self.parse_expression(expr_str))
+            return True, expanded
+        except Exception as e:
+            return False, f"展开表达式失败了喵...: {e} {CatgirlEmoji.SAD}"
+    
+    def factor_expression(self, expr_str):
+        """因式分解喵~"""
+        try:
+            factored = self._compute('factor', self.parse_expression(expr_str))
+            return True, factored
+        except CatgirlTaskTimeout:
+            return False, self._timeout_message()
+        except Exception as e:
+            return False, f"因式分解遇到了问题喵...: {e} {CatgirlEmoji.THINKING}"
+    
+    def plot_function(self, expr_str, variable_str, range_x=(-10, 10)):
+        """绘制函数图像喵~ 表达式编译成数值函数后自适应采样，不再一个点一个点地代入"""
+        try:
+            if not SYMPY_AVAILABLE:
+                return False, "SymPy绘图功能不可用喵..."
+            
+            if variable_str not in self.symbols_dict:
+                return False, f"符号 {variable_str} 还没有定义喵... {CatgirlEmoji.CONFUSED}"
+            
+            expr = self.parse_expression(expr_str)
+            var = self.symbols_dict[variable_str]
+            
+            xs, ys = sample_sympy(expr, var, float(range_x[0]), float(range_x[1]))
+            show_plot(xs, ys, str(expr))
+            return True, f"图像已经画好了喵~ 一共采样了 {len(xs)} 个点 {CatgirlEmoji.HAPPY}"
+        except Exception as e:
+            return False, f"绘制图像失败了喵...: {e} {CatgirlEmoji.SAD}"
+
+    def evaluate_grid(self, expr_str, variable_strs, specs):
+        """在网格上算表达式的数值喵~ specs 是每个变量一个 'a:b:步长' (含终点) 或文件名
+
+        返回 (成功?, (各变量的取值, 结果))：一个变量时结果是一列，两个变量时是二维表格
+        (行对应第一个变量)，表达式编译一次后整个网格一起算喵~
+        """
+        try:
+            if not 1 <= len(variable_strs) <= 2 or len(specs) != len(variable_strs):
+                return False, f"网格求值要一个或两个变量，每个变量一个范围喵~ {CatgirlEmoji.CONFUSED}"
+            missing = [v for v in variable_strs if v not in self.symbols_dict]
+            if missing:
+                return False, f"符号 {', '.join(missing)} 还没有定义喵... {CatgirlEmoji.CONFUSED}"
+            expr = self.parse_expression(expr_str)
+            variables = tuple(self.symbols_dict[v] for v in variable_strs)
+            unbound = expr.free_symbols - set(variables)
+            if unbound:
+                names = ', '.join(sorted(map(str, unbound)))
+                return False, f"表达式里的 {names} 还没有给取值喵~ {CatgirlEmoji.CONFUSED}"
+            axes = [batch_inputs(spec) for spec in specs]
+            if len(axes) == 1:
+                return True, (axes, sympy_values(expr, variables, axes))
+            if NUMPY_AVAILABLE:
+                grid = np.meshgrid(*axes, indexing='ij')
+                return True, (axes, sympy_values(expr, variables, grid))
+            xs, ys = zip(*itertools.product(*axes))
+            return True, (axes, sympy_values(expr, variables, (xs, ys)))
+        except Exception as e:
+            return False, f"网格求值失败了喵...: {e} {CatgirlEmoji.SAD}"
+    
+    def series_expansion(self, expr_str, variable_str, point=0, n=6):
+        """泰勒级数展开喵~"""
+        try:
+            if variable_str not in self.symbols_dict:
+                return False, f"符号 {variable_str} 还没有定义喵... {CatgirlEmoji.CONFUSED}"
+            
+            expr = self.parse_expression(expr_str)
+            var = self.symbols_dict[variable_str]
+            
+            series_exp = self._compute('series', expr, var, point, n)
+            return True, series_exp
+        except CatgirlTaskTimeout:
+            return False, self._timeout_message()
+        except Exception as e:
+            return False, f"级数展开出错了喵...: {e} {CatgirlEmoji.THINKING}"
+    
+    def parse_expression(self, expr_str):
+        """解析表达式字符串喵~ 结果走 parse_sympy 的缓存"""
+        return parse_sympy(_normalize_sympy_text(expr_str), tuple(sorted(self.symbols_dict)))
+
+# ------------------ SymPy数值快速通道 ------------------
+SYMPY_PLOT_POINTS = 400     # 画图时先均匀取这么多点喵~
+SYMPY_PLOT_MAX_POINTS = 20000
+SYMPY_PLOT_ROUNDS = 8       # 自适应加密最多几轮
+SYMPY_PLOT_TOL = 1e-3       # 中点离直线插值超过 y 范围的这个比例就加密喵~
+
+@functools.lru_cache(maxsize=SYMPY_CACHE_SIZE)
+def lambdify_sympy(expr, variables, modules=None):
+    """把 SymPy 表达式编译成数值函数喵~ 按 (表达式, 变量, 模块) 缓存，每个表达式只编译一次
+
+    有 NumPy 时默认编译成整列计算的 NumPy 函数，没有就是 math 的标量函数喵~
+    """
+    if modules is None:
+        modules = 'numpy' if NUMPY_AVAILABLE else 'math'
+    return sp.lambdify(variables, expr, modules=modules)
+
+def _real_or_nan(y):
+    """复数结果虚部可以忽略就取实部，不然这个点画不出来，当成 nan 喵~"""
+    y = complex(y)
+    return y.real if abs(y.imag) <= 1e-12 * (1 + abs(y.real)) else math.nan
+
+def _pointwise_values(func, columns):
+    """一个点一个点地算喵~ 算不了的点是 nan"""
+    out = array('d')
+    for point in zip(*columns):
+        try:
+            out.append(_real_or_nan(func(*point)))
+        except (ArithmeticError, ValueError, TypeError):
+            out.append(math.nan)
+    return out
+
+def sympy_values(expr, variables, columns):
+    """在一组点上算 SymPy 表达式的实数值喵~ columns 是每个变量一列，返回一列 float
+
+    NumPy 编译的函数一次算完整列；碰到 NumPy 没有的函数 (比如特殊函数) 就退回 mpmath 逐点算喵~
+    """
+    if not NUMPY_AVAILABLE:
+        return _pointwise_values(lambdify_sympy(expr, variables), columns)
+    columns = [np.asarray(c, dtype=np.float64) for c in columns]
+    shape = np.broadcast(*columns).shape if columns else ()
+    try:
+        with np.errstate(all='ignore'):
+            ys = np.asarray(lambdify_sympy(expr, variables)(*columns))
+    except (NameError, TypeError, AttributeError, ValueError, ZeroDivisionError):
+        flat = [c.ravel() for c in np.broadcast_arrays(*columns)]
+        ys = np.frombuffer(_pointwise_values(lambdify_sympy(expr, variables, 'mpmath'), flat),
+                           dtype=np.float64)
+        return ys.reshape(shape)
+    ys = np.broadcast_to(ys, shape)  # 常数表达式也铺满整列喵~
+    if ys.dtype.kind == 'c':
+        real = ys.real.copy()
+        real[np.abs(ys.imag) > 1e-12 * (1 + np.abs(ys.real))] = np.nan
+        return real
+    if ys.dtype.kind == 'O':
+        return np.vectorize(_real_or_nan, otypes=[np.float64])(ys)
+    return ys.astype(np.float64)
+
+def sample_sympy(expr, var, a, b, points=None, max_points=None, rounds=None, tol=None):
+    """给画图用的自适应采样喵~ 返回 (xs, ys)
+
+    先均匀取点整列算一遍，然后每一轮算出所有区间的中点，离两端连线太远的
+    (弯得厉害、跳变、一边是 nan) 区间就把中点插进去；每一轮的新点也是整列一起算喵~
+    """
+    points = points or SYMPY_PLOT_POINTS
+    max_points = max_points or SYMPY_PLOT_MAX_POINTS
+    rounds = SYMPY_PLOT_ROUNDS if rounds is None else rounds
+    tol = tol or SYMPY_PLOT_TOL
+    if NUMPY_AVAILABLE:
+        xs = np.linspace(a, b, points)
+        ys = sympy_values(expr, (var,), (xs,))
+        for _ in range(rounds):
+            finite = ys[np.isfinite(ys)]
+            scale = (finite.max() - finite.min()) if finite.size else 0.0
+            mids = (xs[:-1] + xs[1:]) / 2
+            ym = sympy_values(expr, (var,), (mids,))
+            with np.errstate(invalid='ignore'):
+                bad = ~(np.abs(ym - (ys[:-1] + ys[1:]) / 2) <= tol * (scale or 1.0))
+            bad &= ~(np.isnan(ys[:-1]) & np.isnan(ys[1:]) & np.isnan(ym))
+            room = max_points - len(xs)
+            if not bad.any() or room <= 0:
+                break
+            where = np.flatnonzero(bad)[:room]
+            xs = np.insert(xs, where + 1, mids[where])
+            ys = np.insert(ys, where + 1, ym[where])
+        return xs, ys
+    xs = [a + (b - a) * i / (points - 1) for i in range(points)]
+    ys = list(sympy_values(expr, (var,), (xs,)))
+    for _ in range(rounds):
+        finite = [y for y in ys if math.isfinite(y)]
+        scale = (max(finite) - min(finite)) if finite else 0.0
+        mids = [(x0 + x1) / 2 for x0, x1 in zip(xs, xs[1:])]
+        ym = sympy_values(expr, (var,), (mids,))
+        new_x, new_y, added = [xs[0]], [ys[0]], 0
+        for i, (m, y) in enumerate(zip(mids, ym)):
+            y0, y1 = ys[i], ys[i + 1]
+            if not (math.isnan(y0) and math.isnan(y1) and math.isnan(y)) \
+                    and not abs(y - (y0 + y1) / 2) <= tol * (scale or 1.0) \
+                    and len(xs) + added < max_points:
+                new_x.append(m)
+                new_y.append(y)
+                added += 1
+            new_x.append(xs[i + 1])
+            new_y.append(y1)
+        if not added:
+            break
+        xs, ys = new_x, new_y
+    return xs, ys
+
+def plot_limits(ys):
+    """画图的 y 范围喵~ 有极点之类的离群值时，用 2%~98% 分位数往外放宽一点，别让一个尖把图压扁"""
+    finite = sorted(y for y in ys if math.isfinite(y))
+    if not finite:
+        return None
+    lo, hi = finite[0], finite[-1]
+    q_lo, q_hi = finite[int(0.02 * (len(finite) - 1))], finite[int(0.98 * (len(finite) - 1))]
+    if hi - lo > 10 * (q_hi - q_lo) > 0:
+        pad = 0.25 * (q_hi - q_lo)
+        lo, hi = max(lo, q_lo - pad), min(hi, q_hi + pad)
+    return (lo, hi) if hi > lo else (lo - 0.5, lo + 0.5)
+
+def text_plot(xs, ys, width=72, height=20):
+    """没有 matplotlib 时在终端里画字符图喵~ 每一列取这一段 x 里的最小值和最大值连成竖线"""
+    limits = plot_limits(ys)
+    if limits is None:
+        return "一个能画的点都没有喵~"
+    lo, hi = limits
+    pts = [(x, y) for x, y in zip(xs, ys) if lo <= y <= hi]
+    x0, x1 = float(xs[0]), float(xs[-1])
+    grid = [[' '] * width for _ in range(height)]
+    spans = {}
+    for x, y in pts:
+        col = min(int((x - x0) / ((x1 - x0) or 1.0) * (width - 1) + 0.5), width - 1)
+        row = height - 1 - int((y - lo) / (hi - lo) * (height - 1) + 0.5)
+        a, b = spans.get(col, (row, row))
+        spans[col] = (min(a, row), max(b, row))
+    if lo < 0 < hi:
+        zero = height - 1 - int(-lo / (hi - lo) * (height - 1) + 0.5)
+        grid[zero] = ['-'] * width
+    for col, (a, b) in spans.items():
+        for row in range(a, b + 1):
+            grid[row][col] = '*'
+    lines = [f"{hi:>10.4g} |" + ''.join(grid[0])]
+    lines += ["           |" + ''.join(row) for row in grid[1:-1]]
+    lines.append(f"{lo:>10.4g} |" + ''.join(grid[-1]))
+    lines.append(f"{'':11}{x0:<{width // 2}.4g}{x1:>{width - width // 2}.4g}")
+    return '\n'.join(lines)
+
+def show_plot(xs, ys, title):
+    """画出采样好的点喵~ 有 matplotlib 开窗口，没有就在终端里画字符图"""
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print(text_plot(xs, ys))
+        return
+    plt.figure(title)
+    plt.plot(xs, ys)
+    limits = plot_limits(ys)
+    if limits is not None:
+        plt.ylim(*limits)
+    plt.title(title)
+    plt.grid(True)
+    plt.show()
+
+# ------------------ 猫娘流式统计 ------------------
+class CatgirlRunningMoments:
+    """Welford 单遍算 个数/均值/方差/最值 喵~ 只存几个数，两份结果还能合并 (Chan 公式)"""
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # 离差平方和
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, x):
+        """加一个数喵~ (Welford)"""
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+
+    def update(self, values):
+        """加一批数喵~ 先算这批自己的矩，再合并进来，比一个个加快也更准"""
+        if not _is_ndarray(values) and not isinstance(values, (list, tuple, array)):
+            values = list(values)
+        if not len(values):
+            return
+        batch = CatgirlRunningMoments()
+        batch.count = len(values)
+        if _is_ndarray(values):
+            batch.mean = float(values.mean())
+            batch.m2 = float(np.square(values - batch.mean).sum())
+            batch.min, batch.max = float(values.min()), float(values.max())
+        else:
+            batch.mean = math.fsum(values) / batch.count
+            batch.m2 = math.fsum((x - batch.mean) ** 2 for x in values)
+            batch.min, batch.max = min(values), max(values)
+        self.merge(batch)
+
+    def merge(self, other):
+        """并入另一份矩喵~ (Chan 等人的并行公式)"""
+        if not other.count:
+            return
+        if not self.count:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def variance(self):
+        """样本方差喵~ 少于两个数时是0"""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0
+
+class CatgirlTDigest:
+    """合并式 t-digest 分位数草图喵~ 最多存 约compression个质心 + 一个缓冲区
+
+    缓冲区满了才排序压缩；还没压缩过时分位数是精确的，手敲的小数据和以前一样准喵~
+    """
+    def __init__(self, compression=100, buffer_size=1000):
+        self.compression = compression
+        self.buffer_size = buffer_size
+        self.centroids = []  # [(均值, 权重)]，按均值排好序
+        self.buffer = []
+        self.total = 0
+
+    def add(self, x):
+        """加一个数喵~"""
+        self.buffer.append(x)
+        self.total += 1
+        if len(self.buffer) >= self.buffer_size:
+            self._compress()
+
+    def update(self, values):
+        """加一批数喵~ 大批量先排序直接切成质心，不用一个个进缓冲区"""
+        if len(values) >= self.buffer_size:
+            self.add_sorted(np.sort(values) if _is_ndarray(values) else sorted(values))
+            return
+        values = values.tolist() if _is_ndarray(values) else list(values)
+        for i in range(0, len(values), self.buffer_size):
+            chunk = values[i:i + self.buffer_size]
+            self.buffer.extend(chunk)
+            self.total += len(chunk)
+            if len(self.buffer) >= self.buffer_size:
+                self._compress()
+
+    def add_sorted(self, ordered):
+        """加一批排好序的数喵~ 按这批自己的 k 刻度切段，每段变成一个质心再压缩"""
+        n = len(ordered)
+        if not n:
+            return
+        steps = int(self.compression // 2)
+        cuts = sorted({0, n} | {round(n * self._scale_inverse(self._scale(0) + j)) for j in range(1, steps)})
+        batch = []
+        for a, b in zip(cuts, cuts[1:]):
+            if b > a:
+                part = ordered[a:b]
+                mean = float(part.mean()) if _is_ndarray(part) else math.fsum(part) / (b - a)
+                batch.append((mean, b - a))
+        self.centroids = list(heapq.merge(self.centroids, batch))
+        self.total += n
+        self._compress()
+
+    def merge(self, other):
+        """并入另一个草图喵~"""
+        self.centroids = sorted(self.centroids + other.centroids)
+        self.buffer.extend(other.buffer)
+        self.total += other.total
+        self._compress()
+
+    def _scale(self, q):
+        """k1 尺度函数喵~ 两头的质心小、中间的大"""
+        return self.compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _scale_inverse(self, k):
+        return (math.sin(min(k, self.compression / 4) * 2 * math.pi / self.compression) + 1) / 2
+
+    def _points(self):
+        """质心和缓冲区里的数按均值归并好喵~ 不改动草图"""
+        if not self.buffer:
+            return self.centroids
+        return list(heapq.merge(self.centroids, sorted((x, 1) for x in self.buffer)))
+
+    def _compress(self):
+        """把相邻的点合并成质心，每个质心跨的 k 不超过 1 喵~"""
+        points = self._points()
+        self.buffer = []
+        if not points:
+            return
+        total = self.total
+        merged = []
+        mean, weight = points[0]
+        before = 0  # 当前质心左边的总权重
+        limit = self._scale_inverse(self._scale(0) + 1)
+        for m, w in points[1:]:
+            if (before + weight + w) / total <= limit:
+                weight += w
+                mean += (m - mean) * w / weight
+            else:
+                merged.append((mean, weight))
+                before += weight
+                limit = self._scale_inverse(self._scale(before / total) + 1)
+                mean, weight = m, w
+        merged.append((mean, weight))
+        self.centroids = merged
+
+    def quantile(self, q):
+        """第 q 分位数喵~ 质心中心之间线性插值，全是单点时和 statistics 的算法一致"""
+        points = self._points()
+        if not points:
+            return None
+        target = q * (self.total - 1) + 0.5  # 全是单点时第i个点的中心在 i+0.5
+        center = points[0][1] / 2
+        if target <= center:
+            return points[0][0]
+        for (m0, w0), (m1, w1) in zip(points, points[1:]):
+            upper = center + (w0 + w1) / 2
+            if target <= upper:
+                return m0 + (m1 - m0) * (target - center) / (upper - center)
+            center = upper
+        return points[-1][0]
+
+class CatgirlHeavyHitters:
+    """Misra-Gries 高频项计数喵~ 最多 capacity 个计数器，出现超过 n/(capacity+1) 次的数一定在里面
+
+    不同的数没超过 capacity 种时计数是精确的；第一次减计数之后 exact 变成 False，计数只是下界喵~
+    """
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.counts = {}
+        self.exact = True
+
+    def update(self, values, presorted=False):
+        """加一批数喵~ 按批计数再合并，比一个个加快得多"""
+        if _is_ndarray(values):
+            self._merge_counts(self._array_counts(values if presorted else np.sort(values)))
+            return
+        batch = {}
+        for x in values:
+            batch[x] = batch.get(x, 0) + 1
+        self._merge_counts(batch)
+
+    def _array_counts(self, ordered):
+        """排好序的 NumPy 数组按值计数喵~ 只把这批前 capacity+1 多的数和已有的计数器变回 Python 对象
+
+        其它数的次数不超过第 capacity+1 大的次数，合并后一定会被减掉，不用带上喵~
+        """
+        if not len(ordered):
+            return {}
+        starts = np.flatnonzero(np.concatenate(([True], ordered[1:] != ordered[:-1])))
+        keys, counts = ordered[starts], np.diff(np.append(starts, len(ordered)))
+        keep = self.capacity + 1
+        if len(keys) > keep:
+            chosen = set(np.argpartition(counts, -keep)[-keep:].tolist())
+            if self.counts:
+                known = np.fromiter(self.counts, dtype=keys.dtype, count=len(self.counts))
+                where = np.minimum(np.searchsorted(keys, known), len(keys) - 1)
+                chosen.update(where[keys[where] == known].tolist())
+            chosen = sorted(chosen)
+            keys, counts = keys[chosen], counts[chosen]
+        return dict(zip(keys.tolist(), counts.tolist()))
+
+    def merge(self, other):
+        """并入另一份计数喵~"""
+        self.exact = self.exact and other.exact
+        self._merge_counts(other.counts)
+
+    def _merge_counts(self, counts):
+        combined = dict(self.counts)
+        for x, c in counts.items():
+            combined[x] = combined.get(x, 0) + c
+        if len(combined) > self.capacity:
+            # 所有计数减去第 capacity+1 大的计数，不是正数的丢掉 (可合并的 Misra-Gries)
+            cut = heapq.nlargest(self.capacity + 1, combined.values())[-1]
+            combined = {x: c - cut for x, c in combined.items() if c > cut}
+            self.exact = False
+        self.counts = combined
+
+    def mode(self):
+        """众数和它的计数喵~ exact 为 False 时是估计的众数和计数下界；并列时取最早出现的"""
+        if not self.counts:
+            return None, 0
+        best = max(self.counts, key=self.counts.get)
+        return best, self.counts[best]
+
+class CatgirlStreamingStats:
+    """流式统计喵~ 矩、分位数草图、高频项一起更新，内存和数据量无关，每批之后都能出结果"""
+    def __init__(self, compression=100, heavy_hitters=64):
+        self.moments = CatgirlRunningMoments()
+        self.digest = CatgirlTDigest(compression)
+        self.hitters = CatgirlHeavyHitters(heavy_hitters)
+
+    @property
+    def count(self):
+        return self.moments.count
+
+    def update(self, values):
+        """加一批数喵~ NumPy 数组和 array('d') 直接用，不拆成 Python 浮点数"""
+        if not _is_ndarray(values) and not isinstance(values, array):
+            values = [float(x) for x in values]
+        self.moments.update(values)
+        if _is_ndarray(values) and len(values) >= self.digest.buffer_size:
+            # 大数组只排一次序，草图和高频项共用喵~
+            ordered = np.sort(values)
+            self.digest.add_sorted(ordered)
+            self.hitters.update(ordered, presorted=True)
+            return
+        self.digest.update(values)
+        self.hitters.update(values)
+
+    def merge(self, other):
+        """并入另一份流式统计喵~ 各部分都是可合并的"""
+        self.moments.merge(other.moments)
+        self.digest.merge(other.digest)
+        self.hitters.merge(other.hitters)
+
+    def summary(self):
+        """所有统计值喵~ 没有数据时返回 None"""
+        moments = self.moments
+        if not moments.count:
+            return None
+        mode, hits = self.hitters.mode()
+        if self.hitters.exact:
+            mode = mode if hits > 1 or moments.count == 1 else "没有众数喵~"
+        elif mode is None:
+            mode = "没有明显的众数喵~"
+        variance = moments.variance()
+        results = {
+            '数据个数': moments.count,
+            '平均值': moments.mean,
+            '中位数': self.digest.quantile(0.5),
+            '下四分位数': self.digest.quantile(0.25),
+            '上四分位数': self.digest.quantile(0.75),
+            '众数': mode,
+            '标准差': math.sqrt(variance),
+            '方差': variance,
+            '最小值': moments.min,
+            '最大值': moments.max,
+            '极差': moments.max - moments.min
+        }
+        if not self.hitters.exact:
+            results['众数说明'] = f"不同的数超过 {self.hitters.capacity} 种，众数是高频项草图估计的喵~"
+        return results
+
+# ------------------ 猫娘统计计算器 ------------------
+class CatgirlStatsCalculator:
+    """猫娘统计计算器喵~ 数据不再整列存着，边加边算，多少数据都只占一点点内存"""
+    def __init__(self):
+        self.stream = CatgirlStreamingStats()
+        self.lock = threading.Lock()
+
+    @property
+    def count(self):
+        return self.stream.count
+    
+    def add_data(self, values):
+        """添加一批数据喵~"""
+        with self.lock:
+            self.stream.update(values)
+    
+    def clear(self):
+        """清空数据喵~"""
+        with self.lock:
+            self.stream = CatgirlStreamingStats()
+    
+    def add_file(self, path, fmt=None):
+        """把数据文件整个读进来喵~ 返回 (读到的个数, 跳过的非数字个数)"""
+        stream, skipped = CatgirlDataFile.load(path, fmt)
+        with self.lock:
+            self.stream.merge(stream)
+        return stream.count, skipped
+    
+    def calculate_all(self):
+        """计算所有统计值喵~ 中位数和四分位数数据多时是草图估计"""
+        with self.lock:
+            return self.stream.summary()
+
+# ------------------ 猫娘数据文件读取 ------------------
+class CatgirlDataFile:
+    """用 mmap 一块一块地读大数据文件喵~ 支持文本 (空白/换行/逗号/分号分隔) 和原始 float64 二进制
+
+    有 NumPy 时每块直接解析成 float64 数组，没有就用 array('d')；
+    每块读完就并进流式统计，整个文件从来不会变成一个大列表喵~
+    """
+    CHUNK_BYTES = 1 << 23  # 每块 8MB
+    BINARY_SUFFIXES = ('.bin', '.f64', '.float64')
+    SEPARATORS = (b'\n', b' ', b',', b'\t', b';', b'\r')
+    TO_SPACE = bytes.maketrans(b',;', b'  ')
+
+    @classmethod
+    def detect_format(cls, path):
+        """按扩展名猜格式喵~ 'binary' 是小端 float64，其它都当文本"""
+        return 'binary' if path.lower().endswith(cls.BINARY_SUFFIXES) else 'text'
+
+    @classmethod
+    def chunks(cls, path, fmt=None, chunk_bytes=None, offset=0):
+        """逐块产出 (读到的字节位置, 文件大小, 数值数组, 跳过的个数) 喵~ offset 之前的字节 (文件头) 跳过"""
+        fmt = fmt or cls.detect_format(path)
+        chunk_bytes = max(chunk_bytes or cls.CHUNK_BYTES, 8)
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if not size:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if fmt == 'binary':
+                    step = chunk_bytes - chunk_bytes % 8
+                    usable = size - size % 8  # 末尾凑不满8字节的残渣不要喵~
+                    for start in range(offset, usable, step):
+                        end = min(start + step, usable)
+                        yield end, size, cls._parse_binary(mm[start:end]), 0
+                else:
+                    start = offset
+                    while start < size:
+                        end = cls._text_boundary(mm, start, start + chunk_bytes, size)
+                        values, skipped = cls._parse_text(mm[start:end])
+                        yield end, size, values, skipped
+                        start = end
+
+    @staticmethod
+    def _parse_binary(data):
+        if NUMPY_AVAILABLE:
+            return np.frombuffer(data, dtype='<f8')
+        values = array('d')
+        values.frombytes(data)
+        if sys.byteorder == 'big':
+            values.byteswap()
+        return values
+
+    @classmethod
+    def _text_boundary(cls, mm, start, end, size):
+        """块的结尾挪到分隔符后面，别把一个数切成两半喵~"""
+        if end >= size:
+            return size
+        cut = max(mm.rfind(sep, start, end) for sep in cls.SEPARATORS)
+        if cut >= start:
+            return cut + 1
+        # 一整块都没有分隔符(超长的一个词)，往后找下一个分隔符喵~
+        ahead = [i for i in (mm.find(sep, end) for sep in cls.SEPARATORS) if i >= 0]
+        return min(ahead) + 1 if ahead else size
+
+    @classmethod
+    def _parse_text(cls, data):
+        """解析一块文本喵~ 返回 (数值数组, 跳过的非数字个数)"""
+        data = data.translate(cls.TO_SPACE)
+        if data.isspace():
+            # NumPy 解析纯空白会给出 [-1.]，这里先挡掉喵~
+            return array('d'), 0
+        try:
+            if NUMPY_AVAILABLE:
+                with warnings.catch_warnings():
+                    # 老版本 NumPy 读到非数字只是警告，这里统一当成错误喵~
+                    warnings.simplefilter('error', DeprecationWarning)
+                    return np.fromstring(data, dtype=np.float64, sep=' '), 0
+            return array('d', map(float, data.split())), 0
+        except (ValueError, DeprecationWarning):
+            pass
+        # 有表头之类的文字: 这一块逐个挑出能读的数喵~
+        values, skipped = array('d'), 0
+        for token in data.split():
+            try:
+                values.append(float(token))
+            except ValueError:
+                skipped += 1
+        return (np.frombuffer(values, dtype=np.float64) if NUMPY_AVAILABLE else values), skipped
+
+    @staticmethod
+    @async_calculation_with_moe("读取数据文件喵~")
+    def load(path, fmt=None, chunk_bytes=None):
+        """把整个文件读进一份流式统计喵~ 返回 (CatgirlStreamingStats, 跳过的非数字个数)"""
+        stream, skipped = CatgirlStreamingStats(), 0
+        for end, size, values, bad in CatgirlDataFile.chunks(path, fmt, chunk_bytes):
+            stream.update(values)
+            skipped += bad
+            report_progress(end, size)
+        return stream, skipped
+
+# ------------------ 猫娘进制转换器 ------------------
+BIGINT_DIV_LIMIT = 4000  # 比这么多位(二进制)短的除法直接交给内置 divmod 喵~
+
+def _div2n1n(a, b, n):
+    """2n 位的 a 除以正好 n 位的 b 喵~ 递归拆成两次 3n/2n 除法，只用乘法和移位 (Burnikel-Ziegler)"""
+    if a.bit_length() - n <= BIGINT_DIV_LIMIT:
+        return divmod(a, b)
+    pad = n & 1
+    if pad:
+        a <<= 1
+        b <<= 1
+        n += 1
+    half = n >> 1
+    mask = (1 << half) - 1
+    b1, b2 = b >> half, b & mask
+    q1, r = _div3n2n(a >> n, (a >> half) & mask, b, b1, b2, half)
+    q2, r = _div3n2n(r, a & mask, b, b1, b2, half)
+    if pad:
+        r >>= 1
+    return q1 << half | q2, r
+
+def _div3n2n(a12, a3, b, b1, b2, n):
+    if a12 >> n == b1:
+        q, r = (1 << n) - 1, a12 - (b1 << n) + b1
+    else:
+        q, r = _div2n1n(a12, b1, n)
+    r = (r << n | a3) - q * b2
+    while r < 0:
+        q -= 1
+        r += b
+    return q, r
+
+def bigint_divmod(a, b):
+    """非负大整数的 divmod 喵~ 除数很长时比内置的平方复杂度快得多，短的照样用内置的"""
+    n = b.bit_length()
+    if n <= BIGINT_DIV_LIMIT or a.bit_length() - n <= BIGINT_DIV_LIMIT:
+        return divmod(a, b)
+    q, r = 0, 0
+    # 把 a 切成 n 位一段，从高到低做竖式除法，每一步都是 2n/n 的除法喵~
+    for shift in range((a.bit_length() - 1) // n * n, -1, -n):
+        digit, r = _div2n1n((r << n) | ((a >> shift) & ((1 << n) - 1)), b, n)
+        q = (q << n) | digit
+    return q, r
+
+class BaseConverter:
+    """猫娘进制转换器喵~ 支持 2-36 进制，几十万位的大数也不怕
+
+    大数按 base^(LEAF·2^k) 的幂表一层层对半分 (幂表按进制缓存起来)，
+    除法用 bigint_divmod，整体是乘法的复杂度而不是一位一位除的平方复杂度；
+    输出按块从高位往低位吐出来，可以直接写进文件。反方向也按同一张幂表分治拼回去喵~
+    """
+    DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    LEAF = 240           # 叶子块的位数，是 3 的倍数喵~
+    SMALL_BITS = 4096    # 比这小的数直接一位位转，不用分治喵~
+    PARSE_LEAF = 2048    # 字符串比这短就直接交给 int() 喵~
+    _powers = {}         # base -> [base^LEAF, base^(2·LEAF), base^(4·LEAF), ...]
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _check_base(base):
+        if not 2 <= base <= 36:
+            raise ValueError(f"进制只能是 2 到 36 喵，{base} 不行~")
+
+    @staticmethod
+    def _is_power_of_two(base):
+        return base & (base - 1) == 0
+
+    @staticmethod
+    @functools.lru_cache(maxsize=36)
+    def _digit_table(base):
+        """三位一组的查表喵~ table[r] 是 r 的三位数字 (r < base^3)"""
+        digits = BaseConverter.DIGITS[:base]
+        return [a + b + c for a in digits for b in digits for c in digits]
+
+    @classmethod
+    def powers(cls, base, bound=0, levels=0):
+        """取出缓存的幂表喵~ 不够就平方着往上加，直到至少 levels+1 项、最后一项超过 bound"""
+        with cls._lock:
+            table = cls._powers.setdefault(base, [base ** cls.LEAF])
+            while len(table) <= levels or table[-1] <= bound:
+                table.append(table[-1] * table[-1])
+            return table
+
+    @classmethod
+    def clear_cache(cls):
+        with cls._lock:
+            cls._powers.clear()
+
+    @classmethod
+    def _split(cls, base):
+        """按进制选拆分方式喵~ 2 的幂进制用移位，其他用 bigint_divmod"""
+        if cls._is_power_of_two(base):
+            bits = base.bit_length() - 1
+            def split(n, level, power):
+                shift = bits * cls.LEAF << level
+                return n >> shift, n & (power - 1)
+            return split
+        return lambda n, level, power: bigint_divmod(n, power)
+
+    @classmethod
+    def _leaf(cls, n, base):
+        """n < base^LEAF，三位一组查表转成字符串 (带前导零，正好 LEAF 位) 喵~"""
+        table, step = cls._digit_table(base), base ** 3
+        parts = []
+        for _ in range(cls.LEAF // 3):
+            n, r = divmod(n, step)
+            parts.append(table[r])
+        return ''.join(reversed(parts))
+
+    @classmethod
+    def iter_digits(cls, num, base):
+        """把整数按 base 进制一块块吐出来喵~ 从高位到低位，拼起来就是完整的结果"""
+        cls._check_base(base)
+        if num < 0:
+            yield '-'
+            num = -num
+        if num.bit_length() <= cls.SMALL_BITS:
+            yield cls._base_n(num, base)
+            return
+        table = cls.powers(base, num)
+        split = cls._split(base)
+
+        def emit(n, level, pad):
+            # n < table[level]，pad 时补满 LEAF·2^level 位
+            if level == 0:
+                text = cls._leaf(n, base)
+                yield text if pad else text.lstrip('0') or '0'
+                return
+            hi, lo = split(n, level - 1, table[level - 1])
+            if hi or pad:
+                yield from emit(hi, level - 1, pad)
+                yield from emit(lo, level - 1, True)
+            else:
+                yield from emit(lo, level - 1, False)
+
+        yield from emit(num, len(table) - 1, False)
+
+    @classmethod
+    def to_base(cls, num, base):
+        """整数转成 base 进制的字符串喵~ (不带 0x 这种前缀)"""
+        return ''.join(cls.iter_digits(num, base))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=36)
+    def _digit_pattern(base):
+        return re.compile(f"[{re.escape(BaseConverter.DIGITS[:base])}]+", re.IGNORECASE)
+
+    @classmethod
+    def from_base(cls, text, base):
+        """base 进制的字符串转成整数喵~ 很长的串按幂表分治，比内置 int() 的平方复杂度快"""
+        cls._check_base(base)
+        text = text.strip()
+        if len(text) <= cls.PARSE_LEAF or cls._is_power_of_two(base):
+            return int(text, base)  # 短的、2 的幂进制内置就是线性的喵~
+        sign = -1 if text[0] == '-' else 1
+        digits = text[1:] if text[0] in '+-' else text
+        if not cls._digit_pattern(base).fullmatch(digits):
+            raise ValueError(f"这不是 {base} 进制的数字喵: {text[:20]}{'...' if len(text) > 20 else ''}")
+        table = cls.powers(base, levels=((len(digits) - 1) // cls.LEAF).bit_length() - 1)
+
+        def parse(lo, hi):
+            if hi - lo <= cls.PARSE_LEAF:
+                return int(digits[lo:hi], base)
+            # 右半边取 LEAF·2^level 位，正好能用幂表里的一项
+            level = ((hi - lo - 1) // cls.LEAF).bit_length() - 1
+            mid = hi - (cls.LEAF << level)
+            return parse(lo, mid) * table[level] + parse(mid, hi)
+
+        return sign * parse(0, len(digits))
+
+    @staticmethod
+    def convert_number(number, from_base, to_base):
+        """转换进制喵~ 2/8/16 进制的结果带 0b/0o/0x 前缀，出错时返回错误信息"""
+        try:
+            BaseConverter._check_base(from_base)
+            BaseConverter._check_base(to_base)
+            # 先转换为整数
+            if isinstance(number, str):
+                decimal_num = BaseConverter.from_base(number, from_base)
+            else:
+                decimal_num = int(number)
+
+            # 再转换到目标进制
+            if to_base == 2:
+                return bin(decimal_num)
+            elif to_base == 8:
+                return oct(decimal_num)
+            elif to_base == 16:
+                return hex(decimal_num)
+            else:
+                return BaseConverter.to_base(decimal_num, to_base)
+        except ValueError as e:
+            return f"错误: {e}"
+
+    @staticmethod
+    def _base_n(num, base):
+        """小整数转换为任意进制喵~ 三位一组查表"""
+        if num == 0:
+            return "0"
+        table, step = BaseConverter._digit_table(base), base ** 3
+        parts = []
+        while num:
+            num, r = divmod(num, step)
+            parts.append(table[r])
+        return ''.join(reversed(parts)).lstrip('0')
+
+# ------------------ 猫娘批量进制转换 ------------------
+BASE_BATCH_BLOCK = 1 << 20  # 每次读这么多字节，在空白处切开喵~
+
+@functools.lru_cache(maxsize=None)
+def _fixed_width(base):
+    """uint64 一定装得下的 base 进制位数喵~"""
+    width = 1
+    while base ** (width + 1) <= 1 << 64:
+        width += 1
+    return width
+
+@functools.lru_cache(maxsize=None)
+def _base_lut(base):
+    """字节 -> 数字值的查表，不是这个进制的字符是 255 喵~"""
+    lut = np.full(256, 255, dtype=np.uint8)
+    for value, ch in enumerate(BaseConverter.DIGITS[:base]):
+        lut[ord(ch)] = lut[ord(ch.lower())] = value
+    return lut
+
+def _convert_base_numpy(tokens, from_base, to_base):
+    """定长的整数整列一起转换喵~ 有看不懂的字符 (符号、前缀…) 就返回 None 交给逐个转换"""
+    width = _fixed_width(from_base)
+    chars = np.array(tokens, dtype=f'S{width}').view(np.uint8).reshape(len(tokens), width)
+    digits = _base_lut(from_base)[chars]
+    pad = chars == 0  # 字符串靠左对齐，右边补的 0 字节不算数喵~
+    if np.any(digits[~pad] == 255):
+        return None
+    values = np.zeros(len(tokens), dtype=np.uint64)
+    base = np.uint64(from_base)
+    for j in range(width):
+        values = np.where(pad[:, j], values, values * base + digits[:, j])
+    size = len(BaseConverter._base_n((1 << 64) - 1, to_base))
+    table = np.frombuffer(BaseConverter.DIGITS.encode('ascii'), dtype=np.uint8)
+    out = np.empty((len(tokens), size + 1), dtype=np.uint8)
+    out[:, size] = ord('\n')
+    base = np.uint64(to_base)
+    for j in range(size - 1, -1, -1):
+        out[:, j] = table[values % base]
+        values //= base
+    # 去掉前导零，0 本身留一位喵~
+    nonzero = out[:, :size] != ord('0')
+    start = np.where(nonzero.any(axis=1), nonzero.argmax(axis=1), size - 1)
+    return out[np.arange(size + 1) >= start[:, None]].tobytes()
+
+def convert_base_tokens(tokens, from_base, to_base):
+    """一组数字 (bytes) 从 from_base 转成 to_base 喵~ 返回一行一个的 bytes，进程池里也跑这个"""
+    if NUMPY_AVAILABLE and max(map(len, tokens)) <= _fixed_width(from_base):
+        out = _convert_base_numpy(tokens, from_base, to_base)
+        if out is not None:
+            return out
+    lines = []
+    for token in tokens:
+        text = token.decode('ascii', 'replace')
+        try:
+            value = BaseConverter.from_base(text, from_base)
+        except ValueError:
+            raise ValueError(f"这不是 {from_base} 进制的数字喵: {text[:40]}") from None
+        lines.append(BaseConverter.to_base(value, to_base))
+    lines.append('')
+    return '\n'.join(lines).encode('ascii')
+
+def _base_blocks(f, size=BASE_BATCH_BLOCK):
+    """按块读输入，每块都在空白处结束，不会把一个数切成两半喵~"""
+    rest = b''
+    while True:
+        block = f.read(size)
+        if not block:
+            break
+        block = rest + block
+        cut = max(block.rfind(sep) for sep in (b'\n', b' ', b'\t', b'\r'))
+        if cut < 0:
+            rest = block
+            continue
+        rest = block[cut + 1:]
+        yield block[:cut + 1]
+    if rest:
+        yield rest
+
+def convert_base_stream(source, from_base, to_base, output=None, workers=None):
+    """批量进制转换喵~ source 是文件名或者 '-' (标准输入)，output 不给就写到标准输出；返回转换了多少个数
+
+    uint64 装得下的数整块交给 NumPy 一起转；更长的数分块交给进程池，
+    结果按原来的顺序一边算一边写出去，几百万个数也不用全放进内存喵~
+    """
+    BaseConverter._check_base(from_base)
+    BaseConverter._check_base(to_base)
+    workers = workers or os.cpu_count() or 1
+    width = _fixed_width(from_base) if NUMPY_AVAILABLE else 0
+    src = sys.stdin.buffer if source == '-' else open(source, 'rb')
+    dst = sys.stdout.buffer if output is None else open(output, 'wb')
+    pool, pending, count = None, deque(), 0
+    try:
+        for block in _base_blocks(src):
+            tokens = block.split()
+            if not tokens:
+                continue
+            count += len(tokens)
+            if workers == 1 or max(map(len, tokens)) <= width:
+                pending.append(convert_base_tokens(tokens, from_base, to_base))
+            else:
+                if pool is None:
+                    pool = futures.ProcessPoolExecutor(max_workers=workers)
+                pending.append(pool.submit(convert_base_tokens, tokens, from_base, to_base))
+            # 最多攒两轮的块，写出最早的那块，顺序不会乱喵~
+            while len(pending) > 2 * workers or pending and isinstance(pending[0], bytes):
+                done = pending.popleft()
+                dst.write(done if isinstance(done, bytes) else done.result())
+        while pending:
+            done = pending.popleft()
+            dst.write(done if isinstance(done, bytes) else done.result())
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        if src is not sys.stdin.buffer:
+            src.close()
+        if dst is not sys.stdout.buffer:
+            dst.close()
+        else:
+            dst.flush()
+    return count
+
+# ------------------ 猫娘单位换算器 ------------------
+class UnitConverter:
+    """猫娘单位换算器喵~
+
+    每个单位写成到另一个单位的仿射变换 (倍数, 偏移[, 参照单位])：只写倍数表示乘到本类的基准单位，
+    写了参照单位就先换到那个单位。第一次用时把这张图编译好 (用分数精确合成，最后才变成浮点数)，
+    任意两个单位之间都预先算出一个合成的 (倍数, 偏移)，换算就是一次乘加，整列数据也是一次乘加喵~
+    """
+    CONVERSIONS = {
+        # 长度 (基准 m)
+        '长度': {
+            'mm': 0.001, 'cm': 0.01, 'm': 1, 'km': 1000,
+            'in': 0.0254, 'ft': (12, 0, 'in'), 'yd': (3, 0, 'ft'), 'mile': (1760, 0, 'yd'),
+        },
+        # 重量 (基准 kg)
+        '重量': {
+            'mg': 0.000001, 'g': 0.001, 'kg': 1, 't': 1000,
+            'lb': 0.45359237, 'oz': (Fraction(1, 16), 0, 'lb'),
+        },
+        # 温度 (基准 C)：F、K 都是带偏移的仿射变换喵~
+        '温度': {
+            'C': 1, 'F': (Fraction(5, 9), Fraction(-160, 9)), 'K': (1, -273.15),
+        },
+        # 面积 (基准 m2)
+        '面积': {
+            'mm2': 0.000001, 'cm2': 0.0001, 'm2': 1, 'km2': 1000000, 'ha': 10000,
+            'acre': 4046.8564224,
+        },
+        # 体积 (基准 l)
+        '体积': {
+            'ml': 0.001, 'l': 1, 'm3': 1000, 'gal': 3.785411784, 'qt': (Fraction(1, 4), 0, 'gal'),
+        },
+        # 速度 (基准 m/s)
+        '速度': {
+            'm/s': 1, 'km/h': Fraction(1000, 3600), 'mph': 0.44704, 'ft/s': 0.3048,
+        }
+    }
+    _compiled = None  # (category, from, to) 和 (from, to) -> (倍数, 偏移)
+
+    @staticmethod
+    def _exact(x):
+        # 浮点数按写出来的十进制取精确值，0.0254 就是 254/10000 喵~
+        return Fraction(repr(x)) if isinstance(x, float) else Fraction(x)
+
+    @classmethod
+    def _to_base(cls, category, unit, seen=()):
+        """沿着参照单位一路换到基准单位，返回合成的 (倍数, 偏移) 喵~"""
+        if unit in seen:
+            raise ValueError(f"{category} 里的单位定义绕成圈了喵: {' -> '.join(seen + (unit,))}")
+        spec = cls.CONVERSIONS[category][unit]
+        if not isinstance(spec, tuple):
+            return cls._exact(spec), Fraction(0)
+        scale, offset = cls._exact(spec[0]), cls._exact(spec[1])
+        if len(spec) == 2:
+            return scale, offset
+        ref_scale, ref_offset = cls._to_base(category, spec[2], seen + (unit,))
+        # base = (x·scale + offset)·ref_scale + ref_offset
+        return scale * ref_scale, offset * ref_scale + ref_offset
+
+    @classmethod
+    def compile(cls):
+        """把换算表编译成两两之间的合成变换喵~ 改了 CONVERSIONS 之后再调用一次就好"""
+        compiled = {}
+        for category, units in cls.CONVERSIONS.items():
+            to_base = {unit: cls._to_base(category, unit) for unit in units}
+            for src, (s1, o1) in to_base.items():
+                for dst, (s2, o2) in to_base.items():
+                    # y = ((x·s1 + o1) - o2) / s2
+                    compiled[category, src, dst] = pair = (float(s1 / s2), float((o1 - o2) / s2))
+                    compiled.setdefault((src, dst), pair)  # 不给类别时按前面的类别算喵~
+        cls._compiled = compiled
+        return compiled
+
+    @classmethod
+    def transform(cls, from_unit, to_unit, category=None):
+        """from_unit 到 to_unit 的 (倍数, 偏移) 喵~ 结果 = 数值·倍数 + 偏移；category 不给就按单位自己找
+
+        表里没有的单位 (kg*m/s^2、kWh 这种复合单位) 交给量纲分析 unit_transform 喵~
+        """
+        compiled = cls._compiled or cls.compile()
+        try:
+            return compiled[(from_unit, to_unit) if category is None else (category, from_unit, to_unit)]
+        except KeyError:
+            return unit_transform(from_unit, to_unit)
+
+    @staticmethod
+    def convert(value, from_unit, to_unit, category=None):
+        """单位转换喵~ 出错时返回错误信息"""
+        compiled = UnitConverter._compiled or UnitConverter.compile()
+        try:
+            scale, offset = compiled[(from_unit, to_unit) if category is None else (category, from_unit, to_unit)]
+        except KeyError:
+            try:
+                scale, offset = unit_transform(from_unit, to_unit)
+            except ValueError as e:
+                return str(e)
+        try:
+            return value * scale + offset
+        except Exception as e:
+            return f"转换错误: {e}"
+
+    @staticmethod
+    def convert_many(values, from_unit, to_unit, category=None):
+        """整列数据一起换算喵~ 有 NumPy 时就是一次向量化的乘加，没有就返回 array('d')
+
+        单位不对时抛 ValueError。
+        """
+        scale, offset = UnitConverter.transform(from_unit, to_unit, category)
+        if NUMPY_AVAILABLE:
+            result = np.multiply(values, scale, dtype=np.float64)
+            if offset:
+                result += offset
+            return result
+        return array('d', [v * scale + offset for v in values])
+
+# ------------------ 猫娘量纲分析 ------------------
+# 量纲向量的顺序: 长度 质量 时间 温度 电流 物质的量 发光强度
+BASE_DIMENSIONS = ('m', 'kg', 's', 'K', 'A', 'mol', 'cd')
+UNIT_CACHE_SIZE = 512  # 解析过的单位和换算系数各缓存这么多条喵~
+
+CatgirlUnit = namedtuple('CatgirlUnit', 'scale offset dims')
+CatgirlUnit.__doc__ = """一个单位喵~ 数值·scale + offset 就是国际单位制基本单位下的值 (都是精确的分数)，dims 是量纲指数"""
+
+def _dims(m=0, kg=0, s=0, K=0, A=0, mol=0, cd=0):
+    return (m, kg, s, K, A, mol, cd)
+
+# 单位表: 符号 -> (倍数, 偏移, 量纲) 或者 (倍数, 表达式)；PREFIXABLE 里的可以加 k、m、µ 这些前缀喵~
+UNIT_TABLE = {
+    'm': (1.0, 0.0, _dims(m=1)), 'g': (1e-3, 0.0, _dims(kg=1)), 's': (1.0, 0.0, _dims(s=1)),
+    'K': (1.0, 0.0, _dims(K=1)), 'A': (1.0, 0.0, _dims(A=1)), 'mol': (1.0, 0.0, _dims(mol=1)),
+    'cd': (1.0, 0.0, _dims(cd=1)),
+    # 带偏移的温度，只能单独用喵~
+    'C': (1.0, 273.15, _dims(K=1)), '°C': (1.0, 273.15, _dims(K=1)), 'degC': (1.0, 273.15, _dims(K=1)),
+    'F': (Fraction(5, 9), Fraction('459.67') * 5 / 9, _dims(K=1)),
+    '°F': (Fraction(5, 9), Fraction('459.67') * 5 / 9, _dims(K=1)),
+    'degF': (Fraction(5, 9), Fraction('459.67') * 5 / 9, _dims(K=1)),
+    'rad': (1.0, 0.0, _dims()), 'deg': (math.pi / 180, 0.0, _dims()),
+    'N': (1.0, 'kg*m/s^2'), 'J': (1.0, 'N*m'), 'W': (1.0, 'J/s'), 'Pa': (1.0, 'N/m^2'), 'Hz': (1.0, '1/s'),
+    'V': (1.0, 'W/A'), 'ohm': (1.0, 'V/A'), 'Ω': (1.0, 'V/A'), 'Wh': (3600.0, 'J'), 'eV': (1.602176634e-19, 'J'),
+    'cal': (4.184, 'J'), 'bar': (1e5, 'Pa'), 'atm': (101325.0, 'Pa'), 'L': (1e-3, 'm^3'), 'l': (1e-3, 'm^3'),
+    'min': (60.0, 's'), 'h': (3600.0, 's'), 'day': (86400.0, 's'), 't': (1000.0, 'kg'),
+    'in': (0.0254, 'm'), 'ft': (12.0, 'in'), 'yd': (3.0, 'ft'), 'mile': (1760.0, 'yd'), 'mi': (1.0, 'mile'),
+    'lb': (0.45359237, 'kg'), 'oz': (Fraction(1, 16), 'lb'), 'gal': (3.785411784, 'L'), 'qt': (0.25, 'gal'),
+    'acre': (4046.8564224, 'm^2'), 'ha': (1e4, 'm^2'), 'mph': (1.0, 'mile/h'), 'kn': (Fraction(1852, 3600), 'm/s'),
+}
+PREFIXABLE = frozenset({'m', 'g', 's', 'K', 'A', 'mol', 'cd', 'N', 'J', 'W', 'Pa', 'Hz', 'V', 'ohm', 'Ω',
+                        'Wh', 'eV', 'cal', 'bar', 'L', 'l'})
+UNIT_PREFIXES = {'Y': 1e24, 'Z': 1e21, 'E': 1e18, 'P': 1e15, 'T': 1e12, 'G': 1e9, 'M': 1e6, 'k': 1e3,
+                 'h': 1e2, 'da': 1e1, 'd': 1e-1, 'c': 1e-2, 'm': 1e-3, 'u': 1e-6, 'µ': 1e-6, 'μ': 1e-6,
+                 'n': 1e-9, 'p': 1e-12, 'f': 1e-15, 'a': 1e-18}
+_SUPERSCRIPTS = str.maketrans('⁰¹²³⁴⁵⁶⁷⁸⁹⁻', '0123456789-')
+_UNIT_TOKEN = re.compile(r"\s*(?:(?P<num>\d+(?:\.\d*)?(?:[eE][+-]?\d+)?)|(?P<name>°?[^\W\d_⁰¹²³⁴⁵⁶⁷⁸⁹]+)"
+                         r"|(?P<pow>\^|\*\*)|(?P<op>[*/·()-])|(?P<sup>[⁰¹²³⁴⁵⁶⁷⁸⁹⁻]+))")
+
+def _unit_power(unit, n):
+    if unit.offset and n != 1:
+        raise ValueError("带偏移的温度单位 (C、F) 不能做乘方喵，温差请用 K")
+    return CatgirlUnit(unit.scale ** n, unit.offset if n == 1 else Fraction(0), tuple(d * n for d in unit.dims))
+
+def _unit_product(a, b, sign=1):
+    if a.offset or b.offset:
+        raise ValueError("带偏移的温度单位 (C、F) 不能和别的单位相乘除喵，温差请用 K")
+    return CatgirlUnit(a.scale * b.scale ** sign, Fraction(0), tuple(x + sign * y for x, y in zip(a.dims, b.dims)))
+
+def _lookup_unit(name):
+    """查单位表喵~ 先查整个符号，查不到再试试拆成 前缀+单位"""
+    if name in UNIT_TABLE:
+        return _table_unit(name)
+    for size in (2, 1):
+        prefix, rest = name[:size], name[size:]
+        if prefix in UNIT_PREFIXES and rest in PREFIXABLE:
+            unit = _table_unit(rest)
+            return CatgirlUnit(unit.scale * UnitConverter._exact(UNIT_PREFIXES[prefix]), Fraction(0), unit.dims)
+    raise ValueError(f"喵娘不认识单位 {name!r} 喵~")
+
+@functools.lru_cache(maxsize=None)
+def _table_unit(name):
+    entry = UNIT_TABLE[name]
+    if len(entry) == 3:
+        scale, offset, dims = entry
+        return CatgirlUnit(UnitConverter._exact(scale), UnitConverter._exact(offset), dims)
+    scale, expression = entry
+    unit = parse_unit(expression)
+    return CatgirlUnit(UnitConverter._exact(scale) * unit.scale, Fraction(0), unit.dims)
+
+class _UnitParser:
+    """单位表达式的递归下降解析喵~ 乘 (*、·、空格)、除 (/ 左结合)、乘方 (^、**、m2 这种紧跟的数字、²)、括号"""
+    def __init__(self, text):
+        self.text = text
+        self.tokens = self._tokenize(text)
+        self.pos = 0
+
+    @staticmethod
+    def _tokenize(text):
+        tokens, pos, end = [], 0, len(text.rstrip())
+        while pos < end:
+            match = _UNIT_TOKEN.match(text, pos)
+            if not match:
+                raise ValueError(f"单位 {text!r} 第{pos + 1}个字符看不懂喵~")
+            kind = match.lastgroup
+            value = match.group(kind)
+            # m2、cm3 这种名字后面紧跟的数字当成指数喵~
+            if kind == 'num' and tokens and tokens[-1][0] == 'name' and match.start(kind) == pos:
+                tokens.append(('pow', '^'))
+            if kind == 'sup':
+                kind, value = 'num', value.translate(_SUPERSCRIPTS)
+                tokens.append(('pow', '^'))
+            tokens.append((kind, value))
+            pos = match.end()
+        tokens.append(('end', None))
+        return tokens
+
+    def peek(self):
+        return self.tokens[self.pos]
+
+    def take(self):
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def parse(self):
+        unit = self.product()
+        if self.peek()[0] != 'end':
+            raise ValueError(f"单位 {self.text!r} 后面多了 {self.peek()[1]!r} 喵~")
+        return unit
+
+    def product(self):
+        unit = self.power()
+        while True:
+            kind, value = self.peek()
+            if kind == 'op' and value in '*·/':
+                self.take()
+                unit = _unit_product(unit, self.power(), -1 if value == '/' else 1)
+            elif kind in ('name', 'num') or (kind, value) == ('op', '('):
+                unit = _unit_product(unit, self.power())  # 空格隔开也是相乘喵~
+            else:
+                return unit
+
+    def power(self):
+        unit = self.atom()
+        if self.peek()[0] != 'pow':
+            return unit
+        self.take()
+        paren = self.peek() == ('op', '(')
+        if paren:
+            self.take()
+        negative = self.peek() == ('op', '-')
+        if negative:
+            self.take()
+        kind, value = self.take()
+        if kind != 'num' or not value.lstrip('-').isdigit():
+            raise ValueError(f"单位 {self.text!r} 的指数要是整数喵~")
+        if paren and self.take() != ('op', ')'):
+            raise ValueError(f"单位 {self.text!r} 的括号没配对喵~")
+        exponent = int(value)
+        return _unit_power(unit, -exponent if negative else exponent)
+
+    def atom(self):
+        kind, value = self.take()
+        if kind == 'name':
+            return _lookup_unit(value)
+        if kind == 'num':
+            return CatgirlUnit(Fraction(value), Fraction(0), _dims())
+        if (kind, value) == ('op', '('):
+            unit = self.product()
+            if self.take() != ('op', ')'):
+                raise ValueError(f"单位 {self.text!r} 的括号没配对喵~")
+            return unit
+        raise ValueError(f"单位 {self.text!r} 在 {value!r} 这里缺了单位喵~")
+
+@functools.lru_cache(maxsize=UNIT_CACHE_SIZE)
+def parse_unit(text):
+    """把单位表达式解析成 CatgirlUnit 喵~ 比如 'kg*m/s^2'、'km/h'、'J/(mol*K)'、'm²'
+
+    结果放在 LRU 缓存里，循环里反复换算同样的单位就不用再解析了喵~
+    """
+    text = text.strip()
+    if not text:
+        raise ValueError("单位是空的喵~")
+    return _UnitParser(text).parse()
+
+def format_dims(dims):
+    """量纲向量写成 m·kg·s^-2 这样喵~ 无量纲写成 1"""
+    parts = [name if power == 1 else f"{name}^{power}" for name, power in zip(BASE_DIMENSIONS, dims) if power]
+    return '·'.join(parts) or '1'
+
+@functools.lru_cache(maxsize=UNIT_CACHE_SIZE)
+def unit_transform(from_unit, to_unit):
+    """两个单位表达式之间的 (倍数, 偏移) 喵~ 量纲对不上就抛 ValueError"""
+    a, b = parse_unit(from_unit), parse_unit(to_unit)
+    if a.dims != b.dims:
+        raise ValueError(f"量纲不一致喵: {from_unit} 是 {format_dims(a.dims)}，{to_unit} 是 {format_dims(b.dims)}")
+    # y·b.scale + b.offset = x·a.scale + a.offset
+    return float(a.scale / b.scale), float((a.offset - b.offset) / b.scale)
+
+def convert_quantity(value, from_unit, to_unit):
+    """按量纲换算任意单位喵~ convert_quantity(1, 'kg*m/s^2', 'N') == 1.0"""
+    scale, offset = unit_transform(from_unit, to_unit)
+    return value * scale + offset
+
+# ------------------ 猫娘方程求解器 ------------------
+class EquationSolver:
+    """猫娘方程求解器喵~ 一次、二次方程有公式，任意次多项式用 Aberth-Ehrlich 迭代一起求所有根
+
+    有 NumPy 时同一次数的一批多项式堆成 (个数, 次数) 的数组一起迭代，
+    几千个多项式也只是几十次整块的数组运算喵~
+    """
+    ROOT_TOL = 1e-12     # 相对修正量小于这个就算收敛了喵~
+    ROOT_MAXITER = 200
+
+    @staticmethod
+    def solve_quadratic(a, b, c):
+        """求解二次方程 ax² + bx + c = 0"""
+        try:
+            a, b, c = float(a), float(b), float(c)
+            if a == 0:
+                return EquationSolver.solve_linear(b, c)
+            discriminant = b**2 - 4*a*c
+            
+            if discriminant > 0:
+                x1 = (-b + cmath.sqrt(discriminant)) / (2*a)
+                x2 = (-b - cmath.sqrt(discriminant)) / (2*a)
+                return f"两个实数根: x₁ = {fmt_num(x1)}, x₂ = {fmt_num(x2)}"
+            elif discriminant == 0:
+                x = -b / (2*a)
+                return f"一个实数根: x = {fmt_num(x)}"
+            else:
+                x1 = (-b + cmath.sqrt(discriminant)) / (2*a)
+                x2 = (-b - cmath.sqrt(discriminant)) / (2*a)
+                return f"两个复数根: x₁ = {fmt_num(x1)}, x₂ = {fmt_num(x2)}"
+        except Exception as e:
+            return f"求解错误: {e}"
+    
+    @staticmethod
+    def solve_linear(a, b):
+        """求解线性方程 ax + b = 0"""
+        try:
+            a, b = float(a), float(b)
+            if a == 0:
+                if b == 0:
+                    return "无限多解"
+                else:
+                    return "无解"
+            x = -b / a
+            return f"解: x = {fmt_num(x)}"
+        except Exception as e:
+            return f"求解错误: {e}"
+
+    @staticmethod
+    def _normalize(coeffs):
+        """去掉最高次前面的 0，末尾的 0 变成 0 根；返回 (首一化的系数, 0 根个数) 喵~"""
+        coeffs = [complex(c) for c in coeffs]
+        while coeffs and coeffs[0] == 0:
+            coeffs.pop(0)
+        if not coeffs:
+            raise ValueError("系数全是 0，每个数都是根喵~")
+        zeros = 0
+        while len(coeffs) > 1 and coeffs[-1] == 0:
+            coeffs.pop()
+            zeros += 1
+        lead = coeffs[0]
+        return [c / lead for c in coeffs], zeros
+
+    @staticmethod
+    def _initial_guess(monic):
+        """初始点放在一个圆上喵~ 半径取所有根模长的几何平均 |a_n|^(1/n)，角度错开一点免得对称卡住"""
+        n = len(monic) - 1
+        radius = abs(monic[-1]) ** (1 / n)
+        return [radius * cmath.exp(1j * (2 * math.pi * j / n + 0.4)) for j in range(n)]
+
+    @staticmethod
+    def _tidy(roots):
+        """虚部相对模长小到可以忽略的根变成实数，按实部、虚部排好喵~ (±1e-10i 这种小复根不能当成 0)"""
+        out = []
+        for z in roots:
+            if abs(z.imag) <= 1e-10 * abs(z):
+                z = z.real
+            out.append(z)
+        return sorted(out, key=lambda z: (z.real, z.imag) if isinstance(z, complex) else (z, 0.0))
+
+    @staticmethod
+    def _aberth(monic, tol, maxiter):
+        """单个多项式的纯 Python Aberth-Ehrlich 迭代喵~ 返回 (根, 是否全部收敛)"""
+        n = len(monic) - 1
+        z = EquationSolver._initial_guess(monic)
+        active = set(range(n))
+        for _ in range(maxiter):
+            for i in list(active):
+                zi = z[i]
+                p, dp = 1 + 0j, 0j
+                for c in monic[1:]:
+                    dp = dp * zi + p
+                    p = p * zi + c
+                if p == 0:
+                    active.discard(i)
+                    continue
+                ratio = p / dp if dp else complex(tol + abs(zi))
+                s = sum(1 / (zi - zj) for j, zj in enumerate(z) if j != i and zi != zj)
+                w = ratio / (1 - ratio * s)
+                z[i] = zi - w
+                if abs(w) <= tol * abs(z[i]) + 1e-300:
+                    active.discard(i)
+            if not active:
+                break
+        return z, not active
+
+    @staticmethod
+    def _aberth_numpy(monic, tol, maxiter):
+        """同一次数的一批首一多项式一起迭代喵~ monic 是 (个数, 次数+1) 的复数数组
+
+        返回 (根数组, 每一行是否全部收敛)
+        """
+        count, n = monic.shape[0], monic.shape[1] - 1
+        radius = np.abs(monic[:, -1]) ** (1.0 / n)
+        z = radius[:, None] * np.exp(1j * (2 * np.pi * np.arange(n) / n + 0.4))[None, :]
+        active = np.ones((count, n), dtype=bool)
+        eye = np.eye(n, dtype=bool)
+        for _ in range(maxiter):
+            rows = np.flatnonzero(active.any(axis=1))
+            if not len(rows):
+                break
+            zr, coeffs = z[rows], monic[rows]
+            p, dp = np.ones_like(zr), np.zeros_like(zr)
+            for j in range(1, n + 1):
+                dp = dp * zr + p
+                p = p * zr + coeffs[:, j:j + 1]
+            with np.errstate(all='ignore'):
+                ratio = p / dp
+                diff = zr[:, :, None] - zr[:, None, :]
+                diff[:, eye] = np.inf
+                s = (1 / diff).sum(axis=2)
+                w = ratio / (1 - ratio * s)
+            w[p == 0] = 0
+            bad = ~np.isfinite(w)
+            w[bad] = 1e-3 * (1 + np.abs(zr[bad]))  # 导数是 0 之类的情况，推一下换个地方喵~
+            w[~active[rows]] = 0
+            z[rows] = zr - w
+            active[rows] &= ~(np.abs(w) <= tol * np.abs(z[rows]) + 1e-300) | bad
+        return z, ~active.any(axis=1)
+
+    @staticmethod
+    def polynomial_roots(coeffs, tol=None, maxiter=None, return_status=False):
+        """任意次多项式的所有根喵~ coeffs 从最高次往下排，和 numpy.roots 一样
+
+        实根返回 float，复根返回 complex，按实部排好。
+        return_status=True 时返回 (根, 是否收敛)，迭代 maxiter 次还没收敛的根可能不准喵~
+        """
+        results, unconverged = EquationSolver.polynomial_roots_batch([coeffs], tol, maxiter, return_status=True)
+        return (results[0], not unconverged) if return_status else results[0]
+
+    @staticmethod
+    def polynomial_roots_batch(polys, tol=None, maxiter=None, method='aberth', return_status=False):
+        """一批多项式一起求根喵~ 有 NumPy 时同次数的一组一次整块迭代 (method='companion' 用伴随矩阵特征值)
+
+        return_status=True 时返回 (结果, 没收敛的多项式下标列表)；伴随矩阵法总是算作收敛喵~
+        """
+        tol = EquationSolver.ROOT_TOL if tol is None else tol
+        maxiter = EquationSolver.ROOT_MAXITER if maxiter is None else maxiter
+        if method not in ('aberth', 'companion'):
+            raise ValueError(f"不认识的求根方法 {method} 喵~ 可选: aberth, companion")
+        results = [None] * len(polys)
+        unconverged = []
+        groups = {}
+        for index, coeffs in enumerate(polys):
+            monic, zeros = EquationSolver._normalize(coeffs)
+            groups.setdefault(len(monic) - 1, []).append((index, monic, zeros))
+        for degree, members in groups.items():
+            converged = [True] * len(members)
+            if degree == 0:
+                found = [[] for _ in members]
+            elif NUMPY_AVAILABLE:
+                monic = np.array([m for _, m, _ in members], dtype=np.complex128)
+                if method == 'companion':
+                    companion = np.zeros((len(members), degree, degree), dtype=np.complex128)
+                    companion[:, 0, :] = -monic[:, 1:]
+                    companion[:, np.arange(1, degree), np.arange(degree - 1)] = 1
+                    found = np.linalg.eigvals(companion).tolist()
+                else:
+                    found, converged = EquationSolver._aberth_numpy(monic, tol, maxiter)
+                    found, converged = found.tolist(), converged.tolist()
+            else:
+                found, converged = zip(*(EquationSolver._aberth(m, tol, maxiter) for _, m, _ in members))
+            for (index, _, zeros), roots, ok in zip(members, found, converged):
+                results[index] = EquationSolver._tidy(list(roots) + [0j] * zeros)
+                if not ok:
+                    unconverged.append(index)
+        return (results, sorted(unconverged)) if return_status else results
+
+    @staticmethod
+    def solve_polynomial(coeffs):
+        """求解任意次多项式方程喵~ 返回和一次、二次方程一样的文字结果"""
+        try:
+            roots, converged = EquationSolver.polynomial_roots(coeffs, return_status=True)
+        except (ValueError, TypeError) as e:
+            return f"求解错误: {e}"
+        if not roots:
+            return "无解"
+        result = f"{len(roots)} 个根: " + ", ".join(f"x{i} = {fmt_num(z)}" for i, z in enumerate(roots, 1))
+        if not converged:
+            result += f" (迭代 {EquationSolver.ROOT_MAXITER} 次还没收敛，结果可能不准喵~)"
+        return result
+
+    @staticmethod
+    def load_polynomials(path):
+        """从文件读多项式喵~ 一行一个，系数从最高次往下，用空格或逗号隔开，# 开头的行跳过"""
+        polys = []
+        with open(path, encoding='utf-8') as f:
+            for number, line in enumerate(f, 1):
+                line = line.split('#', 1)[0].replace(',', ' ').split()
+                if not line:
+                    continue
+                try:
+                    polys.append([complex(c.replace('i', 'j')) for c in line])
+                except ValueError:
+                    raise ValueError(f"{path} 第{number}行有看不懂的系数喵~") from None
+        return polys
+
+# ------------------ 猫娘矩阵计算器 ------------------
+class CatgirlMatrix:
+    """稠密矩阵喵~ 有 NumPy 时数据是二维 float64 ndarray (乘法和分解走 BLAS/LAPACK)，
+    没有时按行优先存进一条 array('d')，交给 MatrixCalculator 的纯 Python 分块内核喵~
+    """
+    __slots__ = ('rows', 'cols', 'data')
+
+    def __init__(self, rows, cols, data=None):
+        if data is None:
+            data = np.zeros((rows, cols)) if NUMPY_AVAILABLE else array('d', bytes(8 * rows * cols))
+        self.rows, self.cols, self.data = rows, cols, data
+
+    @classmethod
+    def from_rows(cls, rows):
+        """从一行一行的列表建矩阵喵~ 只收实数"""
+        try:
+            rows = [[float(x) for x in row] for row in rows]
+        except TypeError:
+            raise ValueError("矩阵里只能放实数喵，复数还不支持~") from None
+        if not rows or not rows[0] or any(len(row) != len(rows[0]) for row in rows):
+            raise ValueError("矩阵每一行的长度要一样，而且不能是空的喵~")
+        if NUMPY_AVAILABLE:
+            return cls(len(rows), len(rows[0]), np.array(rows, dtype=np.float64))
+        flat = array('d')
+        for row in rows:
+            flat.extend(row)
+        return cls(len(rows), len(rows[0]), flat)
+
+    @classmethod
+    def from_flat(cls, rows, cols, values):
+        """从行优先的一维数据建矩阵喵~"""
+        if len(values) != rows * cols:
+            raise ValueError(f"{len(values)} 个数凑不成 {rows}x{cols} 的矩阵喵~")
+        if NUMPY_AVAILABLE:
+            return cls(rows, cols, np.asarray(values, dtype=np.float64).reshape(rows, cols))
+        return cls(rows, cols, values if isinstance(values, array) else array('d', values))
+
+    @classmethod
+    def identity(cls, n):
+        """n 阶单位矩阵喵~"""
+        if NUMPY_AVAILABLE:
+            return cls(n, n, np.eye(n))
+        m = cls(n, n)
+        m.data[::n + 1] = array('d', [1.0]) * n
+        return m
+
+    @property
+    def shape(self):
+        return self.rows, self.cols
+
+    def row(self, i):
+        """第 i 行喵~ (ndarray 或 array('d'))"""
+        if _is_ndarray(self.data):
+            return self.data[i]
+        return self.data[i * self.cols:(i + 1) * self.cols]
+
+    def flat(self):
+        """行优先的一维数据喵~"""
+        return self.data.ravel() if _is_ndarray(self.data) else self.data
+
+    def __getitem__(self, index):
+        i, j = index
+        if _is_ndarray(self.data):
+            return float(self.data[i, j])
+        return self.data[i * self.cols + j]
+
+    def __iter__(self):
+        for i in range(self.rows):
+            yield list(map(float, self.row(i)))
+
+    def tolist(self):
+        return list(self)
+
+    def __repr__(self):
+        return f"CatgirlMatrix({self.rows}x{self.cols})"
+
+class MatrixCalculator:
+    """猫娘矩阵计算器喵~ 任意大小的加法、乘法，LU 分解求行列式、逆矩阵和解方程组
+
+    有 NumPy 就直接用 BLAS/LAPACK；没有的话乘法把 B 转置后按列分块，
+    一块列常驻缓存时扫过 A 的所有行，LU 分解按整行做消元喵~
+    稀疏矩阵 (CatgirlSparseMatrix) 也能直接传进来：乘法和加法走稀疏内核，
+    解方程组走 CG/GMRES 迭代，矩阵始终不变稠密喵~
+    维度不对或者矩阵奇异时，和以前一样返回一句提示文字喵~
+    """
+    BLOCK = 64  # 纯 Python 乘法每次常驻缓存的列数喵~
+    BINARY_SUFFIXES = CatgirlDataFile.BINARY_SUFFIXES
+    SPARSE_SUFFIXES = ('.mtx', '.coo')
+    SPARSE_DENSE_LIMIT = 2000  # 稀疏矩阵求行列式/逆矩阵时，不超过这么大才转成稠密来算喵~
+
+    @staticmethod
+    def create_matrix(rows, cols):
+        """一行一行输入矩阵喵~"""
+        matrix = []
+        print(f"输入 {rows}x{cols} 矩阵喵:")
+        for i in range(rows):
+            while True:
+                try:
+                    row = input(f"第 {i+1} 行 (用空格分隔喵): ").replace(',', ' ').split()
+                    if len(row) != cols:
+                        print(color(f"需要 {cols} 个数字喵，主人输入了 {len(row)} 个喵~", T.WARNING))
+                        continue
+                    values = [get_number_from_text(x) for x in row]
+                    imaginary = [x for x, v in zip(row, values) if isinstance(v, complex)]
+                    if imaginary:
+                        print(color(f"矩阵里只能放实数喵，{', '.join(imaginary)} 是复数~ 这一行重新输入好不好喵"
+                                    f"{CatgirlEmoji.CONFUSED}", T.WARNING))
+                        continue
+                    matrix.append(values)
+                    break
+                except ValueError:
+                    print(color(f"请输入有效的数字喵~{CatgirlEmoji.SAD}", T.WARNING))
+        return CatgirlMatrix.from_rows(matrix)
+
+    @staticmethod
+    def as_matrix(m):
+        """列表套列表也收下喵~ 稀疏矩阵原样返回"""
+        return m if isinstance(m, (CatgirlMatrix, CatgirlSparseMatrix)) else CatgirlMatrix.from_rows(m)
+
+    @classmethod
+    def to_sparse(cls, m):
+        m = cls.as_matrix(m)
+        return m if isinstance(m, CatgirlSparseMatrix) else CatgirlSparseMatrix.from_dense(m)
+
+    @staticmethod
+    def to_dense(m):
+        return m.to_dense() if isinstance(m, CatgirlSparseMatrix) else m
+
+    # ---------- 文件读写 ----------
+    @classmethod
+    def load_matrix(cls, path, cols=None):
+        """从文件读矩阵喵~ 文本每行一行矩阵 (空白/逗号/分号分隔)，.npy 需要 NumPy，
+        原始 float64 二进制 (.bin/.f64) 要给出列数，不给就当成方阵；.mtx/.coo 读成稀疏矩阵"""
+        if path.lower().endswith(cls.SPARSE_SUFFIXES):
+            return cls.load_sparse(path)
+        if path.lower().endswith('.npy'):
+            if not NUMPY_AVAILABLE:
+                raise ValueError("读 .npy 文件需要 NumPy 喵~")
+            data = np.load(path, allow_pickle=False)
+            data = data.reshape(1, -1) if data.ndim == 1 else data
+            if data.ndim != 2:
+                raise ValueError(f"这个 .npy 是 {data.ndim} 维的，不是矩阵喵~")
+            return CatgirlMatrix(data.shape[0], data.shape[1], np.ascontiguousarray(data, dtype=np.float64))
+        fmt = CatgirlDataFile.detect_format(path)
+        if fmt == 'text' and cols is None:
+            cols = cls._text_columns(path)
+        parts = [values for _, _, values, _ in CatgirlDataFile.chunks(path, fmt)]
+        if NUMPY_AVAILABLE:
+            values = np.concatenate(parts) if parts else np.zeros(0)
+        else:
+            values = array('d')
+            for part in parts:
+                values.extend(part)
+        if not len(values):
+            raise ValueError("文件里没有数字喵~")
+        if cols is None:
+            cols = math.isqrt(len(values))
+            if cols * cols != len(values):
+                raise ValueError(f"{len(values)} 个数不是方阵喵，请告诉喵娘列数~")
+        if len(values) % cols:
+            raise ValueError(f"{len(values)} 个数排不成 {cols} 列喵，每行长度要一样~")
+        return CatgirlMatrix.from_flat(len(values) // cols, cols, values)
+
+    @staticmethod
+    def _text_columns(path):
+        """文本矩阵的列数 = 第一行全是数字的行里有几个数喵~ (跳过表头)"""
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                tokens = line.replace(',', ' ').replace(';', ' ').split()
+                if not tokens:
+                    continue
+                try:
+                    [float(t) for t in tokens]
+                except ValueError:
+                    continue
+                return len(tokens)
+        raise ValueError("文件里没有数字喵~")
+
+    @staticmethod
+    def load_sparse(path):
+        """读稀疏矩阵喵~ .mtx 是 Matrix Market 坐标格式 (下标从 1 开始)；
+        .coo 是每行 "行 列 值" (下标从 0 开始，大小按最大下标推出来)"""
+        offset, rows, cols, symmetry, width, base = 0, None, None, 'general', 3, 0
+        if path.lower().endswith('.mtx'):
+            with open(path, 'rb') as f:
+                header = f.readline().decode('ascii', 'replace').lower().split()
+                if len(header) < 5 or header[0] != '%%matrixmarket' or header[2] != 'coordinate':
+                    raise ValueError("只认 Matrix Market 的 coordinate 格式喵~")
+                if header[3] == 'complex':
+                    raise ValueError("复数稀疏矩阵还不支持喵~")
+                width = 2 if header[3] == 'pattern' else 3
+                symmetry, base = header[4], 1
+                line = f.readline()
+                while line.startswith(b'%') or (line and not line.strip()):
+                    line = f.readline()
+                if not line:
+                    raise ValueError("文件里没有矩阵大小喵~")
+                rows, cols = map(int, line.split()[:2])
+                offset = f.tell()
+        parts = [values for _, _, values, _ in CatgirlDataFile.chunks(path, 'text', offset=offset)]
+        if NUMPY_AVAILABLE:
+            values = np.concatenate(parts) if parts else np.zeros(0)
+            r = values[0::width].astype(np.int64) - base
+            c = values[1::width].astype(np.int64) - base
+            v = values[2::width] if width == 3 else np.ones(len(r))
+        else:
+            values = array('d')
+            for part in parts:
+                values.extend(part)
+            r = [int(x) - base for x in values[0::width]]
+            c = [int(x) - base for x in values[1::width]]
+            v = list(values[2::width]) if width == 3 else [1.0] * len(r)
+        if len(values) % width:
+            raise ValueError(f"每个非零元要有 {width} 个数喵~ 文件好像不完整")
+        if rows is None:
+            if not len(r):
+                raise ValueError("文件里没有数字喵~")
+            rows, cols = int(max(r)) + 1, int(max(c)) + 1
+        if symmetry in ('symmetric', 'skew-symmetric', 'hermitian'):
+            # 只存了下三角，补上对称的另一半喵~
+            sign = -1.0 if symmetry == 'skew-symmetric' else 1.0
+            if NUMPY_AVAILABLE:
+                off = r != c
+                r, c, v = np.concatenate((r, c[off])), np.concatenate((c, r[off])), np.concatenate((v, sign * v[off]))
+            else:
+                mirror = [(j, i, sign * x) for i, j, x in zip(r, c, v) if i != j]
+                if mirror:
+                    mr, mc, mv = zip(*mirror)
+                    r, c, v = r + list(mr), c + list(mc), v + list(mv)
+        return CatgirlSparseMatrix.from_coo(rows, cols, r, c, v)
+
+    @staticmethod
+    def save_sparse(path, m):
+        """稀疏矩阵存成 .mtx (带大小，下标从 1 开始) 或 .coo (下标从 0 开始) 喵~"""
+        mtx = path.lower().endswith('.mtx')
+        base = 1 if mtx else 0
+        r, c, v = m.coo()
+        with open(path, 'w', encoding='utf-8') as f:
+            if mtx:
+                f.write("%%MatrixMarket matrix coordinate real general\n")
+                f.write(f"{m.rows} {m.cols} {m.nnz}\n")
+            if NUMPY_AVAILABLE:
+                np.savetxt(f, np.column_stack((r + base, c + base, v)), fmt=['%d', '%d', '%.17g'])
+            else:
+                for i, j, x in zip(r, c, v):
+                    f.write(f"{i + base} {j + base} {x!r}\n")
+
+    @classmethod
+    def save_matrix(cls, path, m):
+        """把矩阵存进文件喵~ .npy 用 NumPy，二进制存 float64，.mtx/.coo 存稀疏三元组，其它存文本"""
+        m = cls.as_matrix(m)
+        lower = path.lower()
+        if lower.endswith(cls.SPARSE_SUFFIXES):
+            cls.save_sparse(path, cls.to_sparse(m))
+            return
+        m = cls.to_dense(m)
+        if lower.endswith('.npy'):
+            if not NUMPY_AVAILABLE:
+                raise ValueError("写 .npy 文件需要 NumPy 喵~")
+            np.save(path, m.data)
+        elif lower.endswith(cls.BINARY_SUFFIXES):
+            with open(path, 'wb') as f:
+                if NUMPY_AVAILABLE:
+                    f.write(np.asarray(m.flat(), dtype='<f8').tobytes())
+                else:
+                    data = array('d', m.data)
+                    if sys.byteorder == 'big':
+                        data.byteswap()
+                    data.tofile(f)
+        elif NUMPY_AVAILABLE:
+            np.savetxt(path, m.data, fmt='%.17g')
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                for i in range(m.rows):
+                    f.write(' '.join(map(repr, m.row(i))) + '\n')
+
+    # ---------- 基本运算 ----------
+    @classmethod
+    def matrix_add(cls, a, b):
+        """矩阵加法喵~"""
+        a, b = cls.as_matrix(a), cls.as_matrix(b)
+        if a.shape != b.shape:
+            return "矩阵维度不匹配喵~"
+        if isinstance(a, CatgirlSparseMatrix):
+            return a.add_sparse(b) if isinstance(b, CatgirlSparseMatrix) else a.add_dense(b)
+        if isinstance(b, CatgirlSparseMatrix):
+            return b.add_dense(a)
+        if _is_ndarray(a.data):
+            return CatgirlMatrix(a.rows, a.cols, a.data + b.data)
+        return CatgirlMatrix(a.rows, a.cols, array('d', map(operator.add, a.data, b.data)))
+
+    @classmethod
+    def matrix_multiply(cls, a, b):
+        """矩阵乘法喵~"""
+        a, b = cls.as_matrix(a), cls.as_matrix(b)
+        if a.cols != b.rows:
+            return "矩阵维度不匹配喵~ 第一个的列数要等于第二个的行数"
+        if isinstance(a, CatgirlSparseMatrix):
+            return a.multiply_sparse(b) if isinstance(b, CatgirlSparseMatrix) else a.multiply_dense(b)
+        if isinstance(b, CatgirlSparseMatrix):
+            # 稠密 × 稀疏 = (稀疏ᵀ × 稠密ᵀ)ᵀ 喵~
+            return cls.transpose(b.transpose().multiply_dense(cls.transpose(a)))
+        if _is_ndarray(a.data):
+            return CatgirlMatrix(a.rows, b.cols, a.data @ b.data)
+        return cls._blocked_multiply(a, b)
+
+    @staticmethod
+    def transpose(m):
+        """转置喵~"""
+        if isinstance(m, CatgirlSparseMatrix):
+            return m.transpose()
+        if _is_ndarray(m.data):
+            return CatgirlMatrix(m.cols, m.rows, np.ascontiguousarray(m.data.T))
+        out = array('d')
+        for j in range(m.cols):
+            out.extend(m.data[j::m.cols])
+        return CatgirlMatrix(m.cols, m.rows, out)
+
+    @classmethod
+    def _blocked_multiply(cls, a, b):
+        """纯 Python 分块乘法喵~ B 先转置成列，一次取 BLOCK 列扫过 A 的每一行，
+        每个元素是一次 sum(map(mul, 行, 列))，循环都压在 C 里面；
+        行和列先转成 float 列表，省得每次取 array 元素都要装箱喵~"""
+        n, m = a.rows, b.cols
+        a_rows = [a.row(i).tolist() for i in range(n)]
+        b_cols = [b.data[j::m].tolist() for j in range(m)]
+        out = array('d', bytes(8 * n * m))
+        mul = operator.mul
+        for j0 in range(0, m, cls.BLOCK):
+            panel = b_cols[j0:j0 + cls.BLOCK]
+            j1 = j0 + len(panel)
+            for i, row in enumerate(a_rows):
+                base = i * m
+                out[base + j0:base + j1] = array('d', [sum(map(mul, row, col)) for col in panel])
+        return CatgirlMatrix(n, m, out)
+
+    # ---------- LU 分解 ----------
+    @staticmethod
+    def lu_decompose(m):
+        """带部分主元的 LU 分解喵~ (纯 Python)
+
+        返回 (rows, perm, sign)：rows[i] 是 float 列表，对角线以下存 L (单位下三角)，
+        其余存 U；perm 是行置换，sign 是置换的符号。某一列全是 0 时照样分解完，
+        U 的对角线上会留下 0 喵~
+        """
+        n = m.rows
+        rows = [m.row(i).tolist() for i in range(n)]
+        perm = list(range(n))
+        sign = 1
+        for k in range(n):
+            p = max(range(k, n), key=lambda i: abs(rows[i][k]))
+            if p != k:
+                rows[k], rows[p] = rows[p], rows[k]
+                perm[k], perm[p] = perm[p], perm[k]
+                sign = -sign
+            pivot_row = rows[k]
+            pivot = pivot_row[k]
+            if pivot == 0:
+                continue
+            tail = pivot_row[k + 1:]
+            for i in range(k + 1, n):
+                r = rows[i]
+                f = r[k] / pivot
+                r[k] = f
+                if f:
+                    r[k + 1:] = [x - f * y for x, y in zip(r[k + 1:], tail)]
+        return rows, perm, sign
+
+    @staticmethod
+    def _lu_solve_vector(rows, perm, b):
+        """用 LU 分解解一个右端向量喵~ 先前代 Ly=Pb，再回代 Ux=y"""
+        n = len(rows)
+        mul = operator.mul
+        y = [0.0] * n
+        for i in range(n):
+            y[i] = b[perm[i]] - sum(map(mul, rows[i][:i], y[:i]))
+        x = [0.0] * n
+        for i in range(n - 1, -1, -1):
+            r = rows[i]
+            x[i] = (y[i] - sum(map(mul, r[i + 1:], x[i + 1:]))) / r[i]
+        return x
+
+    @classmethod
+    def _lu_solve(cls, a, b):
+        """纯 Python 解 AX=B 喵~ 奇异时返回 None"""
+        rows, perm, _ = cls.lu_decompose(a)
+        if any(rows[i][i] == 0 for i in range(a.rows)):
+            return None
+        n, k = b.rows, b.cols
+        out = array('d', bytes(8 * n * k))
+        for j in range(k):
+            out[j::k] = array('d', cls._lu_solve_vector(rows, perm, b.data[j::k]))
+        return CatgirlMatrix(n, k, out)
+
+    @classmethod
+    def matrix_determinant(cls, matrix):
+        """任意阶方阵的行列式喵~ LU 分解后对角线连乘"""
+        matrix = cls.as_matrix(matrix)
+        if matrix.rows != matrix.cols:
+            return "只有方阵才有行列式喵~"
+        if isinstance(matrix, CatgirlSparseMatrix):
+            if matrix.rows > cls.SPARSE_DENSE_LIMIT:
+                return f"稀疏矩阵超过 {cls.SPARSE_DENSE_LIMIT} 阶就不算行列式了喵~"
+            matrix = matrix.to_dense()
+        if _is_ndarray(matrix.data):
+            return float(np.linalg.det(matrix.data))
+        rows, _, sign = cls.lu_decompose(matrix)
+        det = float(sign)
+        for i, r in enumerate(rows):
+            det *= r[i]
+        return det or 0.0  # 奇异时别显示 -0 喵~
+
+    @classmethod
+    def matrix_solve(cls, a, b):
+        """解线性方程组 AX=B 喵~ B 可以是一列也可以是好几列"""
+        a, b = cls.as_matrix(a), cls.as_matrix(b)
+        if a.rows != a.cols:
+            return "系数矩阵要是方阵喵~"
+        if b.rows != a.rows:
+            return "右端的行数要和系数矩阵一样喵~"
+        if isinstance(a, CatgirlSparseMatrix):
+            x, iterations, residual, _ = cls.sparse_solve(a, cls.to_dense(b))
+            if x is None:
+                return f"迭代 {iterations} 次还没收敛喵~ 相对残差 {residual:.3g}"
+            return x
+        b = cls.to_dense(b)
+        if _is_ndarray(a.data):
+            try:
+                return CatgirlMatrix(b.rows, b.cols, np.linalg.solve(a.data, b.data))
+            except np.linalg.LinAlgError:
+                return "矩阵是奇异的，方程组没有唯一解喵~"
+        x = cls._lu_solve(a, b)
+        return "矩阵是奇异的，方程组没有唯一解喵~" if x is None else x
+
+    @classmethod
+    def matrix_inverse(cls, matrix):
+        """任意阶方阵的逆矩阵喵~ 等于解 AX=I"""
+        matrix = cls.as_matrix(matrix)
+        if matrix.rows != matrix.cols:
+            return "只有方阵才有逆矩阵喵~"
+        if isinstance(matrix, CatgirlSparseMatrix):
+            if matrix.rows > cls.SPARSE_DENSE_LIMIT:
+                return f"稀疏矩阵的逆一般是稠密的，超过 {cls.SPARSE_DENSE_LIMIT} 阶就不求了喵~ 解方程组请直接用解方程组"
+            matrix = matrix.to_dense()
+        if _is_ndarray(matrix.data):
+            try:
+                return CatgirlMatrix(matrix.rows, matrix.cols, np.linalg.inv(matrix.data))
+            except np.linalg.LinAlgError:
+                return "矩阵是奇异的，没有逆矩阵喵~"
+        x = cls._lu_solve(matrix, CatgirlMatrix.identity(matrix.rows))
+        return "矩阵是奇异的，没有逆矩阵喵~" if x is None else x
+
+    @staticmethod
+    @async_calculation_with_moe("迭代求解稀疏方程组喵~")
+    def sparse_solve(a, b, method=None, tol=1e-10, maxiter=None):
+        """用 CG/GMRES 解稀疏方程组 AX=B 喵~ 不指定 method 时，对称且对角线全正先试 CG，
+        不行再换 GMRES。返回 (X, 迭代次数, 最大相对残差, 方法)，没收敛时 X 是 None"""
+        solver = CatgirlIterativeSolver
+        diagonal = a.diagonal()
+        if method is None:
+            method = 'cg' if solver.positive(diagonal) and a.is_symmetric() else 'gmres'
+        n, k = b.rows, b.cols
+        columns, iterations, worst = [], 0, 0.0
+        for j in range(k):
+            rhs = b.data[:, j] if _is_ndarray(b.data) else b.data[j::k]
+            progress = lambda fraction, j=j: report_progress(int(1000 * (j + fraction)), 1000 * k)
+            if method == 'cg':
+                try:
+                    x, it, residual = solver.cg(a.matvec, rhs, tol, maxiter, diagonal, progress)
+                except ValueError:
+                    method = 'gmres'  # 对称但不正定，换 GMRES 喵~
+            if method == 'gmres':
+                x, it, residual = solver.gmres(a.matvec, rhs, tol, maxiter=maxiter, progress=progress)
+            columns.append(x)
+            iterations, worst = iterations + it, max(worst, residual)
+        if worst > tol:
+            return None, iterations, worst, method
+        if NUMPY_AVAILABLE:
+            return CatgirlMatrix(n, k, np.column_stack(columns)), iterations, worst, method
+        out = array('d', bytes(8 * n * k))
+        for j, x in enumerate(columns):
+            out[j::k] = array('d', x)
+        return CatgirlMatrix(n, k, out), iterations, worst, method
+
+# ------------------ 猫娘稀疏矩阵 ------------------
+class CatgirlSparseMatrix:
+    """CSR 稀疏矩阵喵~ 只存非零元: indptr[i]:indptr[i+1] 是第 i 行在 indices/data 里的范围
+
+    有 NumPy 时三个数组都是 ndarray，乘法先一次性取出乘积再按行 reduceat；
+    没有时是 array('q')/array('d')，按行做 sum(map(mul, ...)) 喵~
+    10^6 阶、几百万个非零元也只要几十 MB 喵~
+    """
+    __slots__ = ('rows', 'cols', 'indptr', 'indices', 'data', '_starts')
+
+    def __init__(self, rows, cols, indptr, indices, data):
+        self.rows, self.cols = rows, cols
+        self.indptr, self.indices, self.data = indptr, indices, data
+        self._starts = None
+
+    @classmethod
+    def from_coo(cls, rows, cols, r, c, v):
+        """从 (行, 列, 值) 三元组建矩阵喵~ 重复的位置会加起来，加完是 0 的就丢掉"""
+        if NUMPY_AVAILABLE:
+            r = np.asarray(r, dtype=np.int64)
+            c = np.asarray(c, dtype=np.int64)
+            v = np.asarray(v, dtype=np.float64)
+            if r.size and (r.min() < 0 or r.max() >= rows or c.min() < 0 or c.max() >= cols):
+                raise ValueError(f"有元素的下标超出了 {rows}x{cols} 喵~")
+            key = r * cols + c
+            order = np.argsort(key, kind='stable')
+            key, v = key[order], v[order]
+            if key.size:
+                first = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+                key, v = key[first], np.add.reduceat(v, first)
+            keep = v != 0
+            key, v = key[keep], v[keep]
+            r, c = np.divmod(key, cols)
+            indptr = np.zeros(rows + 1, dtype=np.int64)
+            np.cumsum(np.bincount(r, minlength=rows), out=indptr[1:])
+            return cls(rows, cols, indptr, c, v)
+        acc = {}
+        for i, j, x in zip(r, c, v):
+            i, j = int(i), int(j)
+            if not (0 <= i < rows and 0 <= j < cols):
+                raise ValueError(f"有元素的下标超出了 {rows}x{cols} 喵~")
+            acc[i, j] = acc.get((i, j), 0.0) + float(x)
+        counts = [0] * rows
+        indices, data = array('q'), array('d')
+        for (i, j), x in sorted(acc.items()):
+            if x:
+                counts[i] += 1
+                indices.append(j)
+                data.append(x)
+        return cls(rows, cols, array('q', itertools.accumulate(counts, initial=0)), indices, data)
+
+    @classmethod
+    def from_dense(cls, m):
+        """稠密矩阵转稀疏喵~"""
+        if _is_ndarray(m.data):
+            r, c = np.nonzero(m.data)
+            return cls.from_coo(m.rows, m.cols, r, c, m.data[r, c])
+        nz = [(k // m.cols, k % m.cols, x) for k, x in enumerate(m.data) if x]
+        return cls.from_coo(m.rows, m.cols, *zip(*nz)) if nz else cls.from_coo(m.rows, m.cols, (), (), ())
+
+    @classmethod
+    def identity(cls, n):
+        return cls.from_coo(n, n, range(n), range(n), [1.0] * n)
+
+    @property
+    def shape(self):
+        return self.rows, self.cols
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    @property
+    def density(self):
+        return self.nnz / (self.rows * self.cols) if self.rows and self.cols else 0.0
+
+    def row_ids(self):
+        """每个非零元所在的行喵~ (COO 的行下标)"""
+        if NUMPY_AVAILABLE:
+            return np.repeat(np.arange(self.rows, dtype=np.int64), np.diff(self.indptr))
+        ids = array('q')
+        for i in range(self.rows):
+            ids.extend([i] * (self.indptr[i + 1] - self.indptr[i]))
+        return ids
+
+    def coo(self):
+        """(行, 列, 值) 三元组喵~"""
+        return self.row_ids(), self.indices, self.data
+
+    def transpose(self):
+        r, c, v = self.coo()
+        return CatgirlSparseMatrix.from_coo(self.cols, self.rows, c, r, v)
+
+    def diagonal(self):
+        """对角线喵~ CG 的 Jacobi 预条件要用"""
+        n = min(self.rows, self.cols)
+        if not NUMPY_AVAILABLE:
+            return [self[i, i] for i in range(n)]
+        r, c, v = self.coo()
+        on = r == c
+        d = np.zeros(n)
+        d[r[on]] = v[on]
+        return d
+
+    def is_symmetric(self):
+        """是不是对称矩阵喵~"""
+        if self.rows != self.cols:
+            return False
+        t = self.transpose()
+        if NUMPY_AVAILABLE:
+            return (np.array_equal(self.indptr, t.indptr) and np.array_equal(self.indices, t.indices)
+                    and np.allclose(self.data, t.data, rtol=1e-12, atol=0))
+        return (self.indptr == t.indptr and self.indices == t.indices
+                and all(abs(x - y) <= 1e-12 * abs(x) for x, y in zip(self.data, t.data)))
+
+    def __getitem__(self, index):
+        i, j = index
+        s, e = self.indptr[i], self.indptr[i + 1]
+        k = bisect.bisect_left(self.indices, j, s, e)
+        return float(self.data[k]) if k < e and self.indices[k] == j else 0.0
+
+    def __repr__(self):
+        return f"CatgirlSparseMatrix({self.rows}x{self.cols}, 非零元 {self.nnz})"
+
+    # ---------- 乘法 ----------
+    def _sum_rows(self, products):
+        """把每个非零元的乘积按行加起来喵~ (NumPy)，空行是 0"""
+        if self._starts is None:
+            nonempty = self.indptr[:-1] != self.indptr[1:]
+            self._starts = (nonempty, self.indptr[:-1][nonempty])
+        nonempty, starts = self._starts
+        out = np.zeros((self.rows,) + products.shape[1:])
+        if len(products):
+            out[nonempty] = np.add.reduceat(products, starts, axis=0)
+        return out
+
+    def matvec(self, x):
+        """稀疏矩阵乘向量喵~ x 是 ndarray 就返回 ndarray，是列表就返回列表"""
+        if _is_ndarray(self.data):
+            return self._sum_rows(self.data * np.asarray(x, dtype=np.float64)[self.indices])
+        mul, get = operator.mul, x.__getitem__
+        ptr, idx, data = self.indptr, self.indices, self.data
+        return [sum(map(mul, data[s:e], map(get, idx[s:e]))) for s, e in zip(ptr, ptr[1:])]
+
+    def multiply_dense(self, b):
+        """稀疏 × 稠密 = 稠密喵~"""
+        if _is_ndarray(self.data):
+            return CatgirlMatrix(self.rows, b.cols, self._sum_rows(self.data[:, None] * b.data[self.indices]))
+        k = b.cols
+        out = array('d', bytes(8 * self.rows * k))
+        for j in range(k):
+            out[j::k] = array('d', self.matvec(b.data[j::k].tolist()))
+        return CatgirlMatrix(self.rows, k, out)
+
+    def multiply_sparse(self, b):
+        """稀疏 × 稀疏 = 稀疏喵~
+
+        NumPy: A 的每个非零元 a_ik 和 B 第 k 行的非零元一一配对展开成三元组，再交给 from_coo 合并；
+        纯 Python: 按行的 Gustavson 算法，每行一个字典累加喵~
+        """
+        if NUMPY_AVAILABLE:
+            counts = np.diff(b.indptr)[self.indices]
+            total = int(counts.sum())
+            offsets = np.arange(total, dtype=np.int64) - np.repeat(np.cumsum(counts) - counts, counts)
+            pos = np.repeat(b.indptr[:-1][self.indices], counts) + offsets
+            r = np.repeat(self.row_ids(), counts)
+            v = np.repeat(self.data, counts) * b.data[pos]
+            return CatgirlSparseMatrix.from_coo(self.rows, b.cols, r, b.indices[pos], v)
+        indptr, indices, data = array('q', [0]), array('q'), array('d')
+        for i in range(self.rows):
+            acc = {}
+            for p in range(self.indptr[i], self.indptr[i + 1]):
+                a, k = self.data[p], self.indices[p]
+                for q in range(b.indptr[k], b.indptr[k + 1]):
+                    j = b.indices[q]
+                    acc[j] = acc.get(j, 0.0) + a * b.data[q]
+            for j in sorted(acc):
+                if acc[j]:
+                    indices.append(j)
+                    data.append(acc[j])
+            indptr.append(len(data))
+        return CatgirlSparseMatrix(self.rows, b.cols, indptr, indices, data)
+
+    def add_sparse(self, b):
+        """稀疏 + 稀疏喵~ 把两边的三元组拼起来再合并"""
+        r1, c1, v1 = self.coo()
+        r2, c2, v2 = b.coo()
+        if NUMPY_AVAILABLE:
+            return CatgirlSparseMatrix.from_coo(self.rows, self.cols, np.concatenate((r1, r2)),
+                                                np.concatenate((c1, c2)), np.concatenate((v1, v2)))
+        return CatgirlSparseMatrix.from_coo(self.rows, self.cols, r1 + r2, c1 + c2, v1 + v2)
+
+    def add_dense(self, b):
+        """稀疏 + 稠密 = 稠密喵~"""
+        r, c, v = self.coo()
+        if _is_ndarray(b.data):
+            out = b.data.copy()
+            out[r, c] += v  # CSR 里没有重复位置，直接加就行喵~
+            return CatgirlMatrix(b.rows, b.cols, out)
+        out = array('d', b.data)
+        for i, j, x in zip(r, c, v):
+            out[i * b.cols + j] += x
+        return CatgirlMatrix(b.rows, b.cols, out)
+
+    def to_dense(self):
+        return self.add_dense(CatgirlMatrix(self.rows, self.cols))
+
+class CatgirlIterativeSolver:
+    """稀疏方程组的迭代解法喵~ 只用到矩阵乘向量，矩阵本身从来不变稠密
+
+    对称正定用 Jacobi 预条件的共轭梯度 (CG)，其它用重启的 GMRES；
+    向量有 NumPy 时是 ndarray，没有时是 float 列表。每一步都按残差下降的
+    比例汇报进度，在任务里跑时可以取消喵~
+    """
+
+    @staticmethod
+    def _dot(u, v):
+        return float(np.dot(u, v)) if _is_ndarray(u) else sum(map(operator.mul, u, v))
+
+    @classmethod
+    def _norm(cls, u):
+        return math.sqrt(cls._dot(u, u))
+
+    @staticmethod
+    def _axpy(a, x, y):
+        """a*x + y 喵~"""
+        return a * x + y if _is_ndarray(x) else [a * p + q for p, q in zip(x, y)]
+
+    @staticmethod
+    def _scale(a, x):
+        return a * x if _is_ndarray(x) else [a * p for p in x]
+
+    @staticmethod
+    def _zeros(n):
+        return np.zeros(n) if NUMPY_AVAILABLE else [0.0] * n
+
+    @staticmethod
+    def _vector(values):
+        return np.array(values, dtype=np.float64) if NUMPY_AVAILABLE else [float(x) for x in values]
+
+    @staticmethod
+    def _report(residual, tol, progress):
+        """残差从 1 降到 tol 的对数比例当作进度喵~ progress(比例) 不给就直接汇报给任务"""
+        if residual > 0:
+            fraction = min(max(math.log(residual) / math.log(tol), 0.0), 1.0)
+            if progress is None:
+                report_progress(int(1000 * fraction), 1000)
+            else:
+                progress(fraction)
+
+    @staticmethod
+    def positive(values):
+        """是不是全都大于 0 喵~"""
+        return bool((values > 0).all()) if _is_ndarray(values) else all(v > 0 for v in values)
+
+    @staticmethod
+    def default_maxiter(n):
+        return max(100, min(10 * n, 20000))
+
+    @classmethod
+    def cg(cls, matvec, b, tol=1e-10, maxiter=None, diagonal=None, progress=None):
+        """预条件共轭梯度喵~ 返回 (x, 迭代次数, 相对残差)；矩阵不正定时抛 ValueError"""
+        b = cls._vector(b)
+        n = len(b)
+        maxiter = maxiter or cls.default_maxiter(n)
+        inv_diag = None
+        if diagonal is not None:
+            if not cls.positive(diagonal):
+                raise ValueError("对角线上有非正数，矩阵不是对称正定的喵~")
+            inv_diag = 1.0 / np.asarray(diagonal) if NUMPY_AVAILABLE else [1.0 / d for d in diagonal]
+        precondition = (lambda r: r) if inv_diag is None else (
+            (lambda r: inv_diag * r) if NUMPY_AVAILABLE else (lambda r: list(map(operator.mul, inv_diag, r))))
+        bnorm = cls._norm(b) or 1.0
+        x = cls._zeros(n)
+        r = b
+        residual = cls._norm(r) / bnorm
+        if residual <= tol:
+            return x, 0, residual
+        z = precondition(r)
+        p = z
+        rz = cls._dot(r, z)
+        for it in range(1, maxiter + 1):
+            ap = matvec(p)
+            curvature = cls._dot(p, ap)
+            if curvature <= 0:
+                raise ValueError("矩阵不是对称正定的喵~ 换 GMRES 试试")
+            alpha = rz / curvature
+            x = cls._axpy(alpha, p, x)
+            r = cls._axpy(-alpha, ap, r)
+            residual = cls._norm(r) / bnorm
+            cls._report(residual, tol, progress)
+            if residual <= tol:
+                return x, it, residual
+            z = precondition(r)
+            rz_new = cls._dot(r, z)
+            p = cls._axpy(rz_new / rz, p, z)
+            rz = rz_new
+        return x, maxiter, residual
+
+    @classmethod
+    def gmres(cls, matvec, b, tol=1e-10, restart=30, maxiter=None, progress=None):
+        """重启 GMRES(m) 喵~ Arnoldi 用修正 Gram-Schmidt，最小二乘用 Givens 旋转。返回 (x, 迭代次数, 相对残差)"""
+        b = cls._vector(b)
+        n = len(b)
+        maxiter = maxiter or cls.default_maxiter(n)
+        restart = max(1, min(restart, n))
+        bnorm = cls._norm(b) or 1.0
+        x = cls._zeros(n)
+        total = 0
+        while True:
+            r = cls._axpy(-1.0, matvec(x), b)
+            beta = cls._norm(r)
+            residual = beta / bnorm
+            if residual <= tol or total >= maxiter:
+                return x, total, residual
+            basis = [cls._scale(1.0 / beta, r)]
+            columns, cs, sn, g = [], [], [], [beta]
+            for j in range(restart):
+                w = matvec(basis[j])
+                h = []
+                for v in basis:
+                    hij = cls._dot(w, v)
+                    w = cls._axpy(-hij, v, w)
+                    h.append(hij)
+                h_next = cls._norm(w)
+                h.append(h_next)
+                for i in range(j):
+                    h[i], h[i + 1] = cs[i] * h[i] + sn[i] * h[i + 1], -sn[i] * h[i] + cs[i] * h[i + 1]
+                denom = math.hypot(h[j], h[j + 1])
+                c, s = (h[j] / denom, h[j + 1] / denom) if denom else (1.0, 0.0)
+                h[j], h[j + 1] = denom, 0.0
+                cs.append(c)
+                sn.append(s)
+                g.append(-s * g[j])
+                g[j] *= c
+                columns.append(h)
+                total += 1
+                residual = abs(g[j + 1]) / bnorm
+                cls._report(residual, tol, progress)
+                if residual <= tol or h_next == 0 or total >= maxiter:
+                    break
+                basis.append(cls._scale(1.0 / h_next, w))
+            k = len(columns)
+            y = [0.0] * k
+            for i in range(k - 1, -1, -1):
+                if columns[i][i]:
+                    y[i] = (g[i] - sum(columns[m][i] * y[m] for m in range(i + 1, k))) / columns[i][i]
+            for i in range(k):
+                x = cls._axpy(y[i], basis[i], x)
+
+# ------------------ 猫娘对话系统 ------------------
+class CatgirlDialog:
+    """猫娘对话系统喵~"""
+    
+    @staticmethod
+    def greet():
+        """打招呼喵~"""
+        greetings = [
+            f"喵呜~ 欢迎来到猫娘计算器喵！{CatgirlEmoji.HAPPY}",
+            f"主人好呀~ 猫娘来帮你计算了喵！{CatgirlEmoji.EXCITED}",
+            f"喵~ 今天也要好好计算哦！{CatgirlEmoji.WINK}",
+            f"猫娘计算器启动成功喵！{CatgirlEmoji.CELEBRATING}"
+        ]
+        return random.choice(greetings)
+    
+    @staticmethod
+    def encourage():
+        """鼓励用语喵~"""
+        encouragements = [
+            f"计算得很棒喵！{CatgirlEmoji.HAPPY}",
+            f"主人真厉害喵！{CatgirlEmoji.EXCITED}",
+            f"一起加油喵！{CatgirlEmoji.DETERMINED}",
+            f"猫娘为你加油喵！{CatgirlEmoji.PRAYING}"
+        ]
+        return random.choice(encouragements)
+    
+    @staticmethod
+    def comfort():
+        """安慰用语喵~"""
+        comforts = [
+            f"没关系的喵，重新来过就好了喵~{CatgirlEmoji.COMFORT}",
+            f"猫娘相信主人一定可以的喵！{CatgirlEmoji.PRAYING}",
+            f"小小的失误不算什么喵~{CatgirlEmoji.WINK}",
+            f"猫娘会一直陪伴主人的喵~{CatgirlEmoji.LOVING}"
+        ]
+        return random.choice(comforts)
+    
+    @staticmethod
+    def sleepy():
+        """困倦用语喵~"""
+        sleepys = [
+            f"猫娘有点困了喵...{CatgirlEmoji.SLEEPY}",
+            f"喵呜~ 需要休息一会喵...{CatgirlEmoji.SLEEPY}",
+            f"计算得好累喵，让猫娘休息一下喵~{CatgirlEmoji.SLEEPY}"
+        ]
+        return random.choice(sleepys)
+
+# ------------------ 核心运算表 ------------------
+OPS = {
+    # 四则
+    '+':  ('加法', operator.add, True, False),
+    '-':  ('减法', operator.sub, True, False),
+    '*':  ('乘法', operator.mul, True, False),
+    '/':  ('除法', operator.truediv, True, False),
+    '**': ('乘方', operator.pow, True, False),
+    '%':  ('取模', operator.mod, True, False),
+    '//': ('整除', operator.floordiv, True, False),
+    # 单目
+    '√':  ('开根', lambda x: cmath.sqrt(x), False, False),
+    '!':  ('阶乘', lambda x: math.factorial(int(x)) if x>=0 and x==int(x) else math.gamma(x+1), False, False),
+    'ln': ('自然对数', cmath.log, False, False),
+    'log':('常用对数', lambda x: cmath.log10(x), False, False),
+    'log2':('二进制对数', lambda x: cmath.log2(x), False, False),
+    'sin':('正弦', lambda x,rad=True: cmath.sin(x if rad else math.radians(x)), False, True),
+    'cos':('余弦', lambda x,rad=True: cmath.cos(x if rad else math.radians(x)), False, True),
+    'tan':('正切', lambda x,rad=True: cmath.tan(x if rad else math.radians(x)), False, True),
+    'asin':('反正弦', lambda x,rad=True: (cmath.asin(x) if rad else math.degrees(cmath.asin(x))), False, True),
+    'acos':('反余弦', lambda x,rad=True: (cmath.acos(x) if rad else math.degrees(cmath.acos(x))), False, True),
+    'atan':('反正切', lambda x,rad=True: (cmath.atan(x) if rad else math.degrees(cmath.atan(x))), False, True),
+    'sinh':('双曲正弦', cmath.sinh, False, False),
+    'cosh':('双曲余弦', cmath.cosh, False, False),
+    'tanh':('双曲正切', cmath.tanh, False, False),
+    'rad':('角度→弧度', math.radians, False, False),
+    'deg':('弧度→角度', math.degrees, False, False),
+    'abs':('绝对值', abs, False, False),
+    'round':('四舍五入', round, False, False),
+    'ceil':('向上取整', math.ceil, False, False),
+    'floor':('向下取整', math.floor, False, False),
+    'sign':('符号函数', lambda x: 1 if x > 0 else -1 if x < 0 else 0, False, False),
+    # 复数函数
+    'real':('实部', lambda x: x.real if isinstance(x, complex) else x, False, False),
+    'imag':('虚部', lambda x: x.imag if isinstance(x, complex) else 0, False, False),
+    'conj':('共轭', lambda x: x.conjugate() if isinstance(x, complex) else x, False, False),
+    'arg':('辐角', lambda x: cmath.phase(x) if isinstance(x, complex) else 0, False, False),
+    # 高级数学
+    'gamma':('伽马函数', lambda x: math.gamma(x) if x > 0 else cmath.gamma(x), False, False),
+    'erf':('误差函数', math.erf, False, False),
+    'erfc':('互补误差函数', math.erfc, False, False),
+    # 常数
+    'pi': ('π', lambda: math.pi, False, False),
+    'e':  ('自然常数e', lambda: math.e, False, False),
+    'tau': ('τ', lambda: 2 * math.pi, False, False),
+    'phi': ('φ', lambda: (1 + math.sqrt(5)) / 2, False, False),  # 黄金比例
+    # 随机数
+    'rand': ('随机数', random.random, False, False),
+}
+CONSTANT_OPS = ('pi', 'e', 'tau', 'phi', 'rand')  # 不要参数的运算喵~
+IMPURE_OPS = ('rand',)                          # 每次结果都不一样，不能提前算好喵~
+CASELESS_CONSTANTS = ('pi', 'e', 'tau', 'phi')  # 只有这几个常数写成 PI、E 也认，变量和插件名区分大小写喵~
+
+# ------------------ 猫娘表达式引擎 ------------------
+class CatgirlExpressionError(ValueError):
+    """表达式看不懂或者不合法喵~"""
+
+class CatgirlExpression:
+    """编译好的表达式喵~ 按 variables 的顺序传值直接调用: expr(1.5, 2)"""
+    def __init__(self, text, variables, tree, func, rad=True):
+        self.text = text
+        self.variables = variables
+        self.tree = tree
+        self.func = func
+        self.rad = rad
+
+    def __call__(self, *values):
+        return self.func(*values)
+
+    def __repr__(self):
+        return f"CatgirlExpression({self.text!r}, variables={self.variables})"
+
+# 表达式里的运算符: (优先级, 右结合?)；OPS 里其它非字母的双目符号按乘除的优先级算喵~
+EXPRESSION_BINARY = {'+': (1, False), '-': (1, False), '*': (2, False), '/': (2, False),
+                     '%': (2, False), '//': (2, False), '**': (4, True)}
+EXPRESSION_ALIASES = {'^': '**'}
+_UNARY_PRECEDENCE = 3  # -x**2 == -(x**2)，和 Python 一样喵~
+_NATIVE_BINOPS = {operator.add: ast.Add, operator.sub: ast.Sub, operator.mul: ast.Mult,
+                  operator.truediv: ast.Div, operator.pow: ast.Pow, operator.mod: ast.Mod,
+                  operator.floordiv: ast.FloorDiv}
+
+# ------------------ 插件延迟合并 ------------------
+_PLUGINS_LOADED = False
+
+def ensure_plugins():
+    """第一次用到 OPS 时才加载插件并合并进来喵~ 之后再调用什么都不做
+
+    插件可能覆盖内置运算，合并后把按 OPS 缓存的解析、编译和整列运算结果都清掉喵~
+    """
+    global _PLUGINS_LOADED
+    if _PLUGINS_LOADED:
+        return
+    _PLUGINS_LOADED = True
+    PLUGINS.update(load_plugins())
+    if PLUGINS:
+        OPS.update(PLUGINS)
+        for cached in (parse_expression, compile_expression, vector_op):
+            cached.cache_clear()
+
+def _is_symbol(key):
+    return not key.isidentifier()
+
+@functools.lru_cache(maxsize=1)
+def _token_pattern(symbols):
+    """按 OPS 里的符号拼出分词用的正则喵~ 长的符号先匹配"""
+    ordered = sorted(set(symbols) | set(EXPRESSION_ALIASES) | {'(', ')', ','}, key=len, reverse=True)
+    return re.compile(r"\s*(?:(?P<num>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?j?)"
+                      r"|(?P<name>[^\W\d]\w*)|(?P<sym>" + '|'.join(map(re.escape, ordered)) + "))")
+
+def _tokenize(text):
+    """把表达式切成 (种类, 内容, 位置) 喵~"""
+    ensure_plugins()
+    pattern = _token_pattern(tuple(key for key in OPS if _is_symbol(key)))
+    tokens, pos, end = [], 0, len(text.rstrip())
+    while pos < end:
+        match = pattern.match(text, pos)
+        if not match:
+            pos += len(text[pos:]) - len(text[pos:].lstrip())
+            raise CatgirlExpressionError(f"第{pos + 1}个字符 {text[pos]!r} 喵娘不认识喵~")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == 'sym':
+            value = EXPRESSION_ALIASES.get(value, value)
+        elif kind == 'name' and value not in OPS and value.lower() in CASELESS_CONSTANTS:
+            value = value.lower()
+        tokens.append((kind, value, match.start(kind)))
+        pos = match.end()
+    tokens.append(('end', None, len(text)))
+    return tokens
+
+class _ExpressionParser:
+    """递归下降(优先级爬升)语法分析喵~ 产出元组形式的语法树:
+
+    ('const', 值) / ('var', 名字) / ('op', OPS的键, (参数...))，取负是 ('op', 'neg', (x,))
+    """
+    def __init__(self, text):
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.index = 0
+        self.variables = []
+
+    def peek(self):
+        return self.tokens[self.index]
+
+    def take(self):
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    def fail(self, message, token=None):
+        pos = (token or self.peek())[2]
+        raise CatgirlExpressionError(f"第{pos + 1}个字符附近: {message}喵~")
+
+    def expect(self, value):
+        token = self.take()
+        if token[1] != value or token[0] == 'name':
+            self.fail(f"这里应该是 {value!r}", token)
+
+    def parse(self):
+        tree = self.binary(0)
+        if self.peek()[0] != 'end':
+            self.fail(f"多出来了 {self.peek()[1]!r}")
+        return tree
+
+    def binary_info(self, token):
+        kind, value, _ = token
+        if kind != 'sym' or value not in OPS and value not in EXPRESSION_BINARY:
+            return None
+        if value in EXPRESSION_BINARY:
+            return EXPRESSION_BINARY[value]
+        return (2, False) if OPS[value][2] else None
+
+    def binary(self, min_precedence):
+        left = self.unary()
+        while True:
+            info = self.binary_info(self.peek())
+            if info is None or info[0] < min_precedence:
+                return left
+            precedence, right_assoc = info
+            op = self.take()[1]
+            right = self.binary(precedence if right_assoc else precedence + 1)
+            left = ('op', op, (left, right))
+
+    def unary(self):
+        kind, value, _ = self.peek()
+        if kind == 'sym' and value in ('-', '+'):
+            self.take()
+            operand = self.binary(_UNARY_PRECEDENCE)
+            return ('op', 'neg', (operand,)) if value == '-' else operand
+        if kind == 'sym' and value in OPS and not OPS[value][2] and value != '!':
+            # √ 这样的前缀单目符号喵~
+            self.take()
+            return ('op', value, (self.binary(_UNARY_PRECEDENCE),))
+        return self.postfix()
+
+    def postfix(self):
+        node = self.primary()
+        while self.peek()[:2] == ('sym', '!'):
+            self.take()
+            node = ('op', '!', (node,))
+        return node
+
+    def primary(self):
+        token = self.take()
+        kind, value, _ = token
+        if kind == 'num':
+            if value.endswith('j'):
+                return ('const', complex(value))
+            return ('const', float(value) if any(c in value for c in '.eE') else int(value))
+        if kind == 'sym' and value == '(':
+            node = self.binary(0)
+            self.expect(')')
+            return node
+        if kind == 'name':
+            if value not in OPS and value.lower() in OPS and self.peek()[:2] == ('sym', '('):
+                # 后面跟着括号就不会是变量，SIN(x) 认成 sin(x) 喵~
+                token = (kind, value.lower(), token[2])
+                value = token[1]
+            if value in OPS:
+                return self.call(token)
+            if self.peek()[:2] == ('sym', '('):
+                self.fail(f"没有叫 {value} 的函数", token)
+            if value not in self.variables:
+                self.variables.append(value)
+            return ('var', value)
+        self.fail("这里应该是数字、变量或者括号" if kind != 'end' else "表达式不完整", token)
+
+    def call(self, token):
+        name = token[1]
+        arity = 0 if name in CONSTANT_OPS else 2 if OPS[name][2] else 1
+        args = []
+        if self.peek()[:2] == ('sym', '('):
+            self.take()
+            if self.peek()[:2] != ('sym', ')'):
+                args.append(self.binary(0))
+                while self.peek()[:2] == ('sym', ','):
+                    self.take()
+                    args.append(self.binary(0))
+            self.expect(')')
+        elif arity == 1:
+            # sin x 这种不带括号的写法，只吃紧跟着的一项喵~
+            args.append(self.binary(_UNARY_PRECEDENCE))
+        if len(args) != arity:
+            self.fail(f"{name} 要 {arity} 个参数，给了 {len(args)} 个", token)
+        return ('op', name, tuple(args))
+
+def _apply_op(key, args, rad):
+    """按 OPS 的约定调用一个运算喵~"""
+    if key == 'neg':
+        return -args[0]
+    func, need_rad = OPS[key][1], OPS[key][3]
+    return func(*args, rad) if need_rad else func(*args)
+
+EXPRESSION_MAX_BITS = 1 << 22  # 常量里的整数乘方、阶乘结果超过这么多位就不算了喵~ (约 126 万位十进制)
+
+def _estimated_bits(key, values):
+    """估计内置乘方/阶乘的整数结果有多少位喵~ 算不出来或者结果不是大整数就返回 0"""
+    if key == 'neg' or key in PLUGINS:
+        return 0
+    if OPS[key][1] is operator.pow:
+        base, exponent = values
+        if isinstance(base, int) and isinstance(exponent, int) and exponent > 0 and abs(base) > 1:
+            return exponent * math.log2(abs(base))
+    elif key == '!':
+        x = values[0]
+        if isinstance(x, (int, float)) and math.isfinite(x) and x >= 2 and x == int(x):
+            return x * math.log2(x)
+    return 0
+
+def _fold_constants(node, rad):
+    """常量折叠喵~ 参数全是常量的运算提前算好；算出错的留到运行时再报
+
+    整数乘方、阶乘估计结果超过 EXPRESSION_MAX_BITS 位时直接报错: 大整数运算一直占着 GIL，
+    真去算的话 Ctrl-C 也停不下来喵~
+    """
+    if node[0] != 'op':
+        return node
+    args = tuple(_fold_constants(arg, rad) for arg in node[2])
+    node = ('op', node[1], args)
+    if node[1] in IMPURE_OPS or any(arg[0] != 'const' for arg in args):
+        return node
+    if _estimated_bits(node[1], [arg[1] for arg in args]) > EXPRESSION_MAX_BITS:
+        raise CatgirlExpressionError(f"{OPS[node[1]][0]}的结果太大了 (超过 {EXPRESSION_MAX_BITS:,} 位) 喵~")
+    try:
+        return ('const', _apply_op(node[1], [arg[1] for arg in args], rad))
+    except Exception:
+        return node
+
+def _uses_angle(node):
+    return node[0] == 'op' and (node[1] != 'neg' and OPS[node[1]][3] or any(map(_uses_angle, node[2])))
+
+@functools.lru_cache(maxsize=512)
+def parse_expression(text):
+    """解析表达式喵~ 返回 (语法树, 变量名元组，按出现顺序, 用没用到三角函数)"""
+    parser = _ExpressionParser(text)
+    tree = parser.parse()
+    return tree, tuple(parser.variables), _uses_angle(tree)
+
+def _to_python_ast(node, names, functions, rad, vector=False):
+    """元组语法树翻译成 Python 的 ast 节点喵~ 四则运算直接用 Python 运算符
+
+    vector=True 时其它运算换成 NumPy 版本 (vector_op)，整列数组一次算完喵~
+    """
+    kind = node[0]
+    if kind == 'const':
+        return ast.Constant(node[1])
+    if kind == 'var':
+        return ast.Name(names[node[1]], ast.Load())
+    key, args = node[1], [_to_python_ast(arg, names, functions, rad, vector) for arg in node[2]]
+    if key == 'neg':
+        return ast.UnaryOp(ast.USub(), args[0])
+    func, need_rad = OPS[key][1], OPS[key][3]
+    if len(args) == 2 and func in _NATIVE_BINOPS:
+        return ast.BinOp(args[0], _NATIVE_BINOPS[func](), args[1])
+    if vector:
+        func = vector_op(key)
+        if key in IMPURE_OPS and not args and names:
+            # rand 这种每次都不一样的，照着第一个变量的形状每个元素各算一次喵~
+            args.append(ast.Name(next(iter(names.values())), ast.Load()))
+    name = functions.setdefault(func, f"_op{len(functions)}")
+    if need_rad:
+        args.append(ast.Constant(rad))
+    return ast.Call(ast.Name(name, ast.Load()), args, [])
+
+@functools.lru_cache(maxsize=512)
+def compile_expression(text, variables=None, rad=True, vector=False):
+    """把表达式编译成 Python 函数喵~ 同一个式子只解析编译一次，之后按闭包的速度算
+
+    variables 给出参数顺序，不给就按变量在式子里出现的顺序；rad=False 时三角函数用角度；
+    vector=True 时参数可以是 NumPy 数组 (要装了 NumPy)。
+    """
+    tree, found, _ = parse_expression(text)
+    variables = tuple(variables) if variables is not None else found
+    unknown = [name for name in found if name not in variables]
+    if unknown:
+        raise CatgirlExpressionError(f"不认识的变量: {', '.join(unknown)} 喵~")
+    tree = _fold_constants(tree, rad)
+    # 变量在生成的代码里改名成 _v0, _v1...，关键字当变量名也没关系喵~
+    names = {name: f"_v{i}" for i, name in enumerate(variables)}
+    functions = {}
+    body = _to_python_ast(tree, names, functions, rad, vector)
+    arguments = ast.arguments(posonlyargs=[], args=[ast.arg(names[name]) for name in variables],
+                              kwonlyargs=[], kw_defaults=[], defaults=[])
+    module = ast.fix_missing_locations(ast.Expression(ast.Lambda(arguments, body)))
+    namespace = {name: func for func, name in functions.items()}
+    func = eval(compile(module, f"<表达式 {text}>", 'eval'), namespace)
+    return CatgirlExpression(text, variables, tree, func, rad)
+
+# ------------------ 猫娘批量计算 ------------------
+@functools.lru_cache(maxsize=1)
+def _numpy_ops():
+    """OPS 里内置运算对应的 NumPy 版本喵~ 参数约定和 OPS 一样，三角函数多一个 rad
+
+    开根和对数用 np.emath，负数也会像 cmath 一样得到复数喵~
+    """
+    def trig(f):
+        return lambda x, rad=True: f(x if rad else np.radians(x))
+    def inverse(f):
+        return lambda x, rad=True: f(x) if rad else np.degrees(f(x))
+    def arg(x):
+        # 和 OPS['arg'] 一样: 实数的辐角算 0 (不是 np.angle 给负数的 π) 喵~
+        return np.angle(x) if np.iscomplexobj(x) else np.zeros_like(x, dtype=np.float64)
+    return {
+        '+': np.add, '-': np.subtract, '*': np.multiply, '/': np.true_divide,
+        '**': np.power, '%': np.mod, '//': np.floor_divide,
+        '√': np.emath.sqrt, 'ln': np.emath.log, 'log': np.emath.log10, 'log2': np.emath.log2,
+        'sin': trig(np.sin), 'cos': trig(np.cos), 'tan': trig(np.tan),
+        'asin': inverse(np.emath.arcsin), 'acos': inverse(np.emath.arccos), 'atan': inverse(np.arctan),
+        'sinh': np.sinh, 'cosh': np.cosh, 'tanh': np.tanh,
+        'rad': np.radians, 'deg': np.degrees, 'abs': np.abs, 'round': np.round,
+        'ceil': np.ceil, 'floor': np.floor, 'sign': np.sign,
+        'real': np.real, 'imag': np.imag, 'conj': np.conj, 'arg': arg,
+    }
+
+def _as_numeric(values):
+    """object 数组尽量变回 float 或 complex 数组喵~ 变不了(比如超大整数)就原样留着"""
+    for dtype in (np.float64, np.complex128):
+        try:
+            return values.astype(dtype)
+        except (TypeError, ValueError, OverflowError):
+            continue
+    return values
+
+def _elementwise(func):
+    """没有对应 ufunc 的运算 (插件、伽马函数...) 逐个元素调用，结果还是数组喵~"""
+    def apply(*args):
+        if not any(_is_ndarray(arg) for arg in args):
+            return func(*args)
+        return _as_numeric(np.frompyfunc(func, len(args), 1)(*args))
+    return apply
+
+def _per_element(func, numpy_func=None):
+    """不要参数但每次结果都不一样的运算 (rand) 的整列版本喵~ 按参照数组 like 的形状每个元素各取一个"""
+    def apply(like=None):
+        if not _is_ndarray(like) or not like.ndim:
+            return func()
+        if numpy_func is not None:
+            return numpy_func(like.shape)
+        return _as_numeric(np.frompyfunc(lambda _: func(), 1, 1)(like))
+    return apply
+
+@functools.lru_cache(maxsize=None)
+def vector_op(key):
+    """OPS[key] 的整列版本喵~ 有 ufunc 用 ufunc，被插件覆盖的或者没有的就逐个元素算"""
+    if key in IMPURE_OPS:
+        builtin = key == 'rand' and key not in PLUGINS
+        return _per_element(OPS[key][1], np.random.random if builtin else None)
+    if key not in PLUGINS and key in _numpy_ops():
+        return _numpy_ops()[key]
+    return _elementwise(OPS[key][1])
+
+def batch_inputs(spec):
+    """批量计算的输入喵~ 'a:b:步长' 是含终点的等差数列，'-' 是标准输入，其它当成文件名"""
+    parts = spec.split(':')
+    if len(parts) in (2, 3) and not os.path.exists(spec):
+        try:
+            start, stop = get_number_from_text(parts[0]), get_number_from_text(parts[1])
+            step = get_number_from_text(parts[2]) if len(parts) == 3 else 1.0
+        except ValueError:
+            raise ValueError(f"看不懂这个范围喵: {spec}") from None
+        if step == 0 or (stop - start) / step < 0:
+            raise ValueError(f"范围 {spec} 一个点都没有喵~")
+        count = int(math.floor((stop - start) / step + 1e-9)) + 1
+        if NUMPY_AVAILABLE:
+            return start + step * np.arange(count, dtype=np.float64)
+        return array('d', (start + step * i for i in range(count)))
+    if spec == '-':
+        values, _ = CatgirlDataFile._parse_text(sys.stdin.buffer.read())
+        return values
+    parts = [values for _, _, values, _ in CatgirlDataFile.chunks(spec)]
+    if NUMPY_AVAILABLE:
+        return np.concatenate(parts) if parts else np.empty(0)
+    values = array('d')
+    for part in parts:
+        values.extend(part)
+    return values
+
+def batch_evaluate(target, xs, second=None, rad=True):
+    """对一整列输入算同一个运算或者表达式喵~
+
+    target 是 OPS 的键 (双目运算的第二个数用 second) 或者最多一个变量的表达式；
+    有 NumPy 时整列一次算完，没有就用编译好的闭包一个个算。
+    """
+    ensure_plugins()
+    if target in OPS:
+        name, func, need_second, need_rad = OPS[target]
+        if target in CONSTANT_OPS:
+            return [func() for _ in xs] if target in IMPURE_OPS or not NUMPY_AVAILABLE \
+                else np.full(len(xs), func())
+        if need_second and second is None:
+            raise ValueError(f"{name} 要第二个数喵~")
+        rest = ([second] if need_second else []) + ([rad] if need_rad else [])
+        if NUMPY_AVAILABLE:
+            return vector_op(target)(np.asarray(xs), *rest)
+        return [func(x, *rest) for x in xs]
+    _, variables, _ = parse_expression(target)
+    if len(variables) > 1:
+        raise CatgirlExpressionError(f"批量计算只能有一个变量喵，这里有 {', '.join(variables)}")
+    expr = compile_expression(target, variables, rad, vector=NUMPY_AVAILABLE)
+    if not variables:
+        if NUMPY_AVAILABLE and expr.tree[0] == 'const':
+            return np.full(len(xs), expr())
+        return [expr() for _ in xs]
+    if NUMPY_AVAILABLE:
+        result = expr(np.asarray(xs))
+        return result if _is_ndarray(result) else np.full(len(xs), result)
+    return [expr(x) for x in xs]
+
+def write_batch(path, xs, ys):
+    """把结果写进文件喵~ .bin/.f64 只写 y 的 float64，其它写成 "x<TAB>y" 的文本"""
+    if CatgirlDataFile.detect_format(path) == 'binary':
+        data = np.asarray(ys, dtype='<f8') if NUMPY_AVAILABLE else array('d', ys)
+        if not NUMPY_AVAILABLE and sys.byteorder == 'big':
+            data.byteswap()
+        with open(path, 'wb') as f:
+            f.write(data.tobytes())
+        return
+    if NUMPY_AVAILABLE and _is_ndarray(ys) and ys.dtype.kind == 'f':
+        np.savetxt(path, np.column_stack((xs, ys)), fmt='%.17g', delimiter='\t')
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        for x, y in zip(xs, ys):
+            f.write(f"{x!r}\t{y!r}\n")
+
+def show_batch(target, xs, ys, elapsed, rows=5):
+    """打印批量结果的开头和结尾几行喵~"""
+    n = len(xs)
+    print(color(f"{target}: {n:,} 个点，用时 {elapsed * 1000:.2f} 毫秒 {CatgirlEmoji.EXCITED}", T.OKGREEN))
+    shown = list(range(n)) if n <= 2 * rows else list(range(rows)) + [None] + list(range(n - rows, n))
+    for i in shown:
+        if i is None:
+            print("  ...")
+            continue
+        y = ys[i]
+        y = y.item() if hasattr(y, 'item') else y
+        print(f"  {fmt_num(float(xs[i]))}\t{y if isinstance(y, str) else fmt_num(y)}")
+
+def run_batch(target, spec, output=None, second=None, rad=True):
+    """批量计算一条龙喵~ 读输入、算、打印、(可选)写文件，返回结果"""
+    xs = batch_inputs(spec)
+    start = time.perf_counter()
+    ys = batch_evaluate(target, xs, second, rad)
+    elapsed = time.perf_counter() - start
+    show_batch(target, xs, ys, elapsed)
+    if output:
+        write_batch(output, xs, ys)
+        print(color(f"结果写进 {output} 了喵~", T.OKCYAN))
+    return ys
+
+# ------------------ 猫娘历史记录 ------------------
+HISTORY = []
+HISTORY_LOCK = threading.Lock()
+
+def record(expr, val):
+    with HISTORY_LOCK:
+        HISTORY.append(f"{expr} = {val}")
+        if len(HISTORY) > 50: 
+            HISTORY.pop(0)
+
+def show_history():
+    if not HISTORY:
+        print(color(f"历史记录还是空空的喵~{CatgirlEmoji.SAD}", T.WARNING))
+        return
+    print(color(f"===== 猫娘的历史记录 ===== {CatgirlEmoji.HAPPY}", T.HEADER))
+    for idx, line in enumerate(HISTORY, 1):
+        print(f"{idx:02d}. {line}")
+    print(color("======================", T.HEADER))
+
+# ------------------ 猫娘输入输出 ------------------
+PREC = 6
+PREC_LOCK = threading.Lock()
+
+def set_precision():
+    """设置精度喵~"""
+    global PREC
+    try:
+        new_prec = int(input("要保留几位小数喵？(0-15): "))
+        with PREC_LOCK:
+            PREC = new_prec
+            getcontext().prec = PREC + 2
+        print(color(f"精度已经设置为 {PREC} 位了喵！{CatgirlEmoji.HAPPY}", T.OKGREEN))
+    except ValueError:
+        print(color(f"输入的不是有效数字喵，保持默认6位喵~{CatgirlEmoji.SAD}", T.WARNING))
+
+def fmt_num(n):
+    """猫娘风格数字格式化喵~"""
+    with PREC_LOCK:
+        current_prec = PREC
+    
+    if isinstance(n, complex):
+        if abs(n.imag) < 1e-15: n = n.real
+        elif abs(n.real) < 1e-15: n = n.imag*1j
+    if isinstance(n, complex):
+        return f"{n.real:.{current_prec}f} + {n.imag:.{current_prec}f}i"
+    else:
+        return f"{n:.{current_prec}f}".rstrip('0').rstrip('.')
+
+BIG_INT_DISPLAY_BITS = 33220  # 超过约一万位的整数只显示位数和首尾喵~
+
+def _big_int_log10(x, prec):
+    """只用最高的几百个二进制位，算出正整数的高精度 log10 喵~"""
+    shift = max(x.bit_length() - 4 * prec, 0)
+    with localcontext() as ctx:
+        ctx.prec = prec + len(str(shift)) + 10
+        return Decimal(x >> shift).log10() + shift * Decimal(2).log10()
+
+def _big_int_head(x, k, prec=60):
+    """(位数, 开头k位) 喵~ 对数离边界太近时才退回精确的整数除法"""
+    x = abs(x)
+    if x.bit_length() < 4 * prec:
+        text = str(x)
+        return len(text), int(text[:k])
+    log10 = _big_int_log10(x, prec)
+    whole = int(log10)
+    with localcontext() as ctx:
+        ctx.prec = prec
+        mantissa = (10 ** (log10 - whole + k - 1))
+    eps = Decimal(10) ** (k - prec + 10)
+    if mantissa - int(mantissa) > eps and int(mantissa) + 1 - mantissa > eps \
+            and 10 ** (k - 1) + eps < mantissa < 10 ** k - eps:
+        return whole + 1, int(mantissa)
+    d = whole + 1
+    power = 10 ** d
+    while x >= power:
+        d += 1
+        power *= 10
+    while d > 1 and x < power // 10:
+        d -= 1
+        power //= 10
+    return d, x // 10 ** max(d - k, 0)
+
+def big_int_digits(x):
+    """不转字符串就数出整数的十进制位数喵~"""
+    return _big_int_head(x, 1)[0]
+
+def describe_big_int(x, k=20, trailing_zeros=None):
+    """大整数摘要喵~ 位数、开头k位和结尾k位，全程不做十进制转换"""
+    sign = '-' if x < 0 else ''
+    x = abs(x)
+    d, leading = _big_int_head(x, k)
+    if d <= 2 * k:
+        return f"{sign}{x} (共{d}位喵)"
+    trailing = f"{x % 10 ** k:0{k}d}"
+    text = f"共{d}位喵: {sign}{leading}...{trailing}"
+    if trailing_zeros is not None:
+        text += f" (末尾有{trailing_zeros}个0喵)"
+    return text
+
+def fmt_task_result(result):
+    """异步任务结果格式化喵~ 长列表只显示开头和结尾，超大整数只显示摘要"""
+    if isinstance(result, list):
+        if len(result) <= 20:
+            return str(result)
+        head = ', '.join(str(x) for x in result[:10])
+        tail = ', '.join(str(x) for x in result[-5:])
+        return f"共{len(result)}项喵: [{head}, ..., {tail}]"
+    if isinstance(result, int):
+        if result.bit_length() > BIG_INT_DISPLAY_BITS:
+            return describe_big_int(result)
+        return str(result)
+    if isinstance(result, str):
+        return result
+    return fmt_num(result)
+
+def get_number_from_text(txt):
+    """把一段文字读成数字喵~ 也认 pi、e、phi 和常量表达式"""
+    try:
+        return float(txt)
+    except ValueError:
+        try:
+            return compile_expression(txt, ())()
+        except Exception:
+            raise ValueError(txt) from None
+
+def get_number(prompt):
+    """猫娘风格获取数字喵~"""
+    while True:
+        try:
+            txt = input(color(prompt, T.OKCYAN)).strip()
+            if txt.lower() == 'pi':
+                print(f"{CatgirlEmoji.EXCITED} 哇，是π喵！")
+                return math.pi
+            if txt.lower() == 'e':
+                print(f"{CatgirlEmoji.EXCITED} 是自然常数e喵！")
+                return math.e
+            if txt.lower() == 'phi':
+                print(f"{CatgirlEmoji.EXCITED} 是黄金比例φ喵！")
+                return (1 + math.sqrt(5)) / 2
+            return float(txt)
+        except ValueError:
+            print(color(f"喵？这个不是有效数字喵，重新输入好不好喵~{CatgirlEmoji.CONFUSED}", T.WARNING))
+
+def get_op():
+    """猫娘风格获取运算符喵~ 输入的不是运算符但能解析成表达式时，原样返回表达式"""
+    ensure_plugins()
+    symbols = ' '.join(OPS.keys())
+    while True:
+        op = input(color(f"选择运算符喵 ({symbols})，或者直接输入表达式 (比如 sin(pi/6)*2、x**2+1)，"
+                         f"hist 查看历史喵: ", T.OKCYAN)).strip()
+        if op.lower() == 'hist':
+            show_history()
+            continue
+        if op not in OPS and op.lower() in OPS:
+            op = op.lower()  # SIN、Sqrt 这样敲的也认成运算符，和以前一样喵~
+        if op in OPS:
+            return op
+        try:
+            parse_expression(op)
+            return op
+        except CatgirlExpressionError as e:
+            print(color(f"喵娘看不懂这个喵: {e} {CatgirlEmoji.CONFUSED}", T.WARNING))
+
+def angle_mode():
+    """猫娘风格角度模式选择喵~"""
+    while True:
+        m = input("要选择弧度(r)还是角度(d)喵？[r/d]: ").strip().lower()
+        if m in ('r','rad','弧度'):
+            print(f"{CatgirlEmoji.HAPPY} 好的喵，用弧度喵~")
+            return True
+        if m in ('d','deg','角度','°'):
+            print(f"{CatgirlEmoji.HAPPY} 好的喵，用角度喵~")
+            return False
+        print(color(f"输入 r 或者 d 喵，主人最可爱了喵~{CatgirlEmoji.BLUSHING}", T.WARNING))
+
+# ------------------ 基础计算模式 ------------------
+def calc_expression(text):
+    """算一个表达式喵~ 有变量的话编译一次，然后一组一组地代入"""
+    _, variables, uses_angle = parse_expression(text)
+    rad = angle_mode() if uses_angle else True
+    expr = compile_expression(text, rad=rad)
+    if variables:
+        print(f"表达式里有变量 {', '.join(variables)} 喵~ 每次按顺序输入一组值(空格分隔)，空行结束:")
+    while True:
+        values = ()
+        if variables:
+            raw = input(color(f"{', '.join(variables)} = ", T.OKCYAN)).strip()
+            if not raw:
+                return
+            try:
+                values = tuple(get_number_from_text(v) for v in raw.split())
+            except ValueError:
+                print(color(f"喵？这个不是有效数字喵~{CatgirlEmoji.CONFUSED}", T.WARNING))
+                continue
+            if len(values) != len(variables):
+                print(color(f"要 {len(variables)} 个值喵，给了 {len(values)} 个~", T.WARNING))
+                continue
+        try:
+            result = expr(*values)
+        except Exception as e:
+            print(color(f"出错了喵: {e} {CatgirlEmoji.SAD}", T.FAIL))
+            print(CatgirlDialog.comfort())
+            if not variables:
+                return
+            continue
+        shown = text if not variables else f"{text} ({', '.join(f'{n}={v}' for n, v in zip(variables, values))})"
+        print(color(f"结果: {shown} = {fmt_num(result)} {CatgirlEmoji.EXCITED}", T.OKGREEN))
+        record(shown, result)
+        if not variables:
+            print(CatgirlDialog.encourage())
+            return
+
+def calc_once():
+    """单轮计算（猫娘版）喵~"""
+    op = get_op()
+    if op not in OPS:
+        calc_expression(op)
+        return
+    name, func, need_second, need_rad = OPS[op]
+    # 常数直接返回
+    if op in CONSTANT_OPS:
+        val = func()
+        print(color(f"常数 {name} = {fmt_num(val)} {CatgirlEmoji.EXCITED}", T.OKGREEN))
+        record(name, val)
+        return
+
+    a = get_number("输入第一个数字喵: ")
+    b = None
+    if need_second:
+        b = get_number("输入第二个数字喵: ")
+
+    # 三角函数额外问
+    rad = True
+    if need_rad and op in ('sin','cos','tan','asin','acos','atan'):
+        rad = angle_mode()
+
+    try:
+        result = func(a, b) if need_second else (func(a, rad) if need_rad else func(a))
+    except Exception as e:
+        print(color(f"出错了喵: {e} {CatgirlEmoji.SAD}", T.FAIL))
+        print(CatgirlDialog.comfort())
+        return
+
+    # 打印与记录
+    expr = f"{a} {op} {b}" if need_second else f"{op}{a}"
+    print(color(f"结果: {expr} = {fmt_num(result)} {CatgirlEmoji.EXCITED}", T.OKGREEN))
+    record(expr, result)
+    print(CatgirlDialog.encourage())
+
+# ------------------ 批量计算模式 ------------------
+def batch_mode():
+    """批量计算模式（猫娘版）喵~ 一个运算或者表达式算一整列输入"""
+    print(color(f"=== 猫娘批量计算模式 === {CatgirlEmoji.EXCITED}", T.HEADER))
+    print("先选运算符，或者输入只带一个变量的表达式 (比如 x**2+sin(x)) 喵~")
+    print(f"输入可以是范围 0:10:0.001 (含终点)、数据文件名，或者 - (从标准输入读到结束)"
+          f"{'' if NUMPY_AVAILABLE else '；没装 NumPy，会一个个算，慢一点喵'}")
+    target = get_op()
+    second = None
+    if target in OPS:
+        uses_angle = OPS[target][3]
+        if OPS[target][2]:
+            second = get_number("第二个数喵 (每个输入都和它算): ")
+    else:
+        _, variables, uses_angle = parse_expression(target)
+        if len(variables) > 1:
+            print(color(f"批量计算只能有一个变量喵，这里有 {', '.join(variables)} {CatgirlEmoji.CONFUSED}", T.WARNING))
+            return
+    rad = angle_mode() if uses_angle else True
+    spec = input(color("输入从哪里来喵: ", T.OKCYAN)).strip()
+    output = input(color("结果写进文件喵 (直接回车=不写，.bin 写成 float64): ", T.OKCYAN)).strip()
+    try:
+        run_batch(target, spec, output or None, second, rad)
+    except (ValueError, OSError) as e:
+        print(color(f"出错了喵: {e} {CatgirlEmoji.SAD}", T.FAIL))
+
+def batch_cli(args):
+    """命令行批量计算喵~ python CATCALCv7.0.py batch <运算或表达式> <输入> [输出文件]"""
+    if len(args) not in (2, 3):
+        print(color("用法喵: python CATCALCv7.0.py batch <运算或表达式> <范围a:b:步长|文件|-> [输出文件]", T.WARNING))
+        return 1
+    try:
+        run_batch(args[0], args[1], args[2] if len(args) == 3 else None)
+    except (ValueError, OSError) as e:
+        print(color(f"出错了喵: {e}", T.FAIL))
+        return 1
+    return 0
+
+# ------------------ 统计计算模式 ------------------
+def stats_mode():
+    """统计计算模式（猫娘版）喵~"""
+    stats_calc = CatgirlStatsCalculator()
+    print(color(f"=== 猫娘统计计算模式 === {CatgirlEmoji.EXCITED}", T.HEADER))
+    print("输入数据喵 (用空格分隔，输入空行结束；@文件名 读取数据文件，.bin/.f64 当作 float64 二进制):")
+    
+    while True:
+        data_input = input("数据喵: ").strip()
+        if not data_input:
+            break
+        if data_input.startswith('@'):
+            path = data_input[1:].strip()
+            try:
+                count, skipped = stats_calc.add_file(path)
+            except OSError as e:
+                print(color(f"读不了这个文件喵~ {e} {CatgirlEmoji.SAD}", T.WARNING))
+                continue
+            note = f"，跳过了 {skipped} 个不是数字的词" if skipped else ""
+            print(f"从 {path} 读到 {count} 个数据点喵~{note}")
+            continue
+        try:
+            values = [float(x) for x in data_input.split()]
+            stats_calc.add_data(values)
+            running = stats_calc.calculate_all()
+            if running:
+                print(f"已添加 {len(values)} 个数据点喵~ 目前 {running['数据个数']} 个，"
+                      f"平均值 {fmt_num(running['平均值'])}，中位数 {fmt_num(running['中位数'])}")
+        except ValueError:
+            print(color(f"请输入有效的数字喵~{CatgirlEmoji.CONFUSED}", T.WARNING))
+    
+    if not stats_calc.count:
+        print(color(f"没有输入数据喵~{CatgirlEmoji.SAD}", T.WARNING))
+        return
+    
+    results = stats_calc.calculate_all()
+    if results:
+        print(color(f"=== 猫娘的统计结果 === {CatgirlEmoji.HAPPY}", T.OKGREEN))
+        for key, value in results.items():
+            print(f"{key}: {value if isinstance(value, str) else fmt_num(value)}")
+
+# ------------------ 进制转换模式 ------------------
+BASE_SHOW_LIMIT = 2000  # 结果比这长就问要不要写进文件喵~
+
+def read_base_number(prompt):
+    """读一个要转换的数喵~ @文件名 表示从文件里读 (几十万位的大数不用手敲)"""
+    text = input(prompt).strip()
+    if text.startswith('@'):
+        with open(text[1:], encoding='ascii') as f:
+            text = ''.join(f.read().split())
+    return text
+
+def show_base_result(result):
+    """短的结果直接打印，太长的可以一块块写进文件喵~"""
+    if len(result) <= BASE_SHOW_LIMIT:
+        print(f"结果喵: {result}")
+        return
+    print(f"结果有 {len(result)} 位喵: {result[:40]}...{result[-40:]}")
+    path = input("写进文件喵 (直接回车=不写): ").strip()
+    if path:
+        with open(path, 'w', encoding='ascii') as f:
+            f.write(result + '\n')
+        print(color(f"已经写进 {path} 了喵~ {CatgirlEmoji.HAPPY}", T.OKGREEN))
+
+def run_base_batch(source, from_base, to_base, output=None):
+    """批量进制转换一条龙喵~ 结果写到文件时顺便报一下速度"""
+    start = time.perf_counter()
+    count = convert_base_stream(source, from_base, to_base, output)
+    elapsed = time.perf_counter() - start
+    if output:
+        print(color(f"转换了 {count} 个数，写进 {output} 了喵~ 用时 {elapsed:.2f}秒 "
+                    f"({count / max(elapsed, 1e-9):,.0f} 个/秒) {CatgirlEmoji.HAPPY}", T.OKGREEN))
+    return count
+
+def base_batch_cli(args):
+    """命令行批量进制转换喵~ python CATCALCv7.0.py base <源进制> <目标进制> <输入文件|-> [输出文件]"""
+    if len(args) not in (3, 4):
+        print(color("用法喵: python CATCALCv7.0.py base <源进制> <目标进制> <输入文件|-> [输出文件]", T.WARNING),
+              file=sys.stderr)
+        return 1
+    try:
+        run_base_batch(args[2], int(args[0]), int(args[1]), args[3] if len(args) == 4 else None)
+    except (ValueError, OSError) as e:
+        print(color(f"出错了喵: {e}", T.FAIL), file=sys.stderr)
+        return 1
+    return 0
+
+def base_convert_mode():
+    """进制转换模式（猫娘版）喵~"""
+    print(color(f"=== 猫娘进制转换模式 === {CatgirlEmoji.EXCITED}", T.HEADER))
+    print("输入数字时可以写 @文件名 从文件读喵~ 几十万位的大数也能很快转完")
+    
+    while True:
+        print("\n可以选的操作喵:")
+        print("1. 十进制 → 其他进制喵")
+        print("2. 其他进制 → 十进制喵") 
+        print("3. 任意进制互转喵")
+        print("4. 批量转换文件喵 (一行或者空白隔开一个数)")
+        print("5. 返回主菜单喵")
+        
+        choice = input("选择操作喵: ").strip()
+        
+        if choice == '5':
+            print(f"{CatgirlEmoji.WINK} 好的喵，返回主菜单喵~")
+            break
+        
+        if choice in ['1', '2', '3', '4']:
+            try:
+                if choice == '1':
+                    number = read_base_number("输入十进制数喵: ")
+                    target_base = int(input("目标进制喵 (2-36): "))
+                    result = BaseConverter.convert_number(number, 10, target_base)
+                    show_base_result(result)
+                
+                elif choice == '2':
+                    number = read_base_number("输入数字喵: ")
+                    source_base = int(input("源进制喵 (2-36): "))
+                    result = BaseConverter.convert_number(number, source_base, 10)
+                    show_base_result(result)
+                
+                elif choice == '3':
+                    number = read_base_number("输入数字喵: ")
+                    source_base = int(input("源进制喵 (2-36): "))
+                    target_base = int(input("目标进制喵 (2-36): "))
+                    result = BaseConverter.convert_number(number, source_base, target_base)
+                    show_base_result(result)
+
+                elif choice == '4':
+                    source = input("从哪个文件读喵: ").strip()
+                    source_base = int(input("源进制喵 (2-36): "))
+                    target_base = int(input("目标进制喵 (2-36): "))
+                    output = input("结果写进哪个文件喵: ").strip()
+                    if not output:
+                        print(color("批量转换要给个输出文件喵~", T.WARNING))
+                        continue
+                    run_base_batch(source, source_base, target_base, output)
+            
+            except (ValueError, OSError) as e:
+                print(color(f"输入错误了喵: {e} {CatgirlEmoji.SAD}", T.WARNING))
+        else:
+            print(color(f"喵娘不明白这个选择喵，重新选好不好喵~{CatgirlEmoji.CONFUSED}", T.WARNING))
+
+# ------------------ 单位换算模式 ------------------
+def unit_convert_mode():
+    """单位换算模式（猫娘版）喵~"""
+    print(color(f"=== 猫娘单位换算模式 === {CatgirlEmoji.EXCITED}", T.HEADER))
+    converter = UnitConverter()
+    
+    compound = "任意单位 (量纲分析)"
+    categories = list(converter.CONVERSIONS.keys()) + [compound]
+    
+    while True:
+        print("\n可以选的类别喵:")
+        for i, category in enumerate(categories, 1):
+            print(f"{i}. {category}喵")
+        print(f"{len(categories)+1}. 返回主菜单喵")
+        
+        try:
+            choice = input("选择类别喵: ").strip()
+            if choice == str(len(categories)+1):
+                print(f"{CatgirlEmoji.WINK} 好的喵，返回主菜单喵~")
+                break
+            
+            category_idx = int(choice) - 1
+            if 0 <= category_idx < len(categories):
+                category = categories[category_idx]
+                print(f"\n=== {category} 单位喵 ===")
+                
+                if category == compound:
+                    category = None
+                    print("单位可以随便组合喵: kg*m/s^2、km/h、J/(mol*K)、kWh、m²，能加 k M m µ 这些前缀，"
+                          "量纲一样就能换算喵~")
+                else:
+                    units = list(converter.CONVERSIONS[category].keys())
+                    print("可用单位喵:", ', '.join(units))
+                
+                spec = input("输入数值喵 (也可以是范围 0:100:0.5 或者数据文件名，整列一起换算): ").strip()
+                from_unit = input("从哪个单位喵？: ").strip()
+                to_unit = input("到哪个单位喵？: ").strip()
+                try:
+                    value = get_number_from_text(spec)
+                except ValueError:
+                    xs = batch_inputs(spec)
+                    start = time.perf_counter()
+                    ys = converter.convert_many(xs, from_unit, to_unit, category)
+                    show_batch(f"{from_unit} → {to_unit}", xs, ys, time.perf_counter() - start)
+                    output = input(color("结果写进文件喵 (直接回车=不写，.bin 写成 float64): ", T.OKCYAN)).strip()
+                    if output:
+                        write_batch(output, xs, ys)
+                        print(color(f"结果写进 {output} 了喵~", T.OKCYAN))
+                    continue
+                
+                result = converter.convert(value, from_unit, to_unit, category)
+                if isinstance(result, (int, float)):
+                    print(f"{value} {from_unit} = {fmt_num(result)} {to_unit} {CatgirlEmoji.HAPPY}")
+                    if category is None:
+                        print(f"  量纲喵: {format_dims(parse_unit(to_unit).dims)}")
+                else:
+                    print(color(result, T.WARNING))
+            else:
+                print(color(f"无效选择喵，重新选好不好喵~{CatgirlEmoji.CONFUSED}", T.WARNING))
+        except (ValueError, KeyError, OSError) as e:
+            print(color(f"输入错误了喵: {e} {CatgirlEmoji.SAD}", T.WARNING))
+
+# ------------------ 方程求解模式 ------------------
+def read_coefficients(prompt):
+    """读一行多项式系数喵~ 从最高次往下，用空格或逗号隔开，复数写成 1+2i"""
+    text = input(prompt).replace(',', ' ').split()
+    return [complex(c.replace('i', 'j')) for c in text]
+
+def run_root_batch(path, output=None, method='aberth', rows=5):
+    """批量求根一条龙喵~ 读文件、整批求根、打印开头结尾几个、(可选)每行一个多项式的根写进文件"""
+    polys = EquationSolver.load_polynomials(path)
+    start = time.perf_counter()
+    roots, unconverged = EquationSolver.polynomial_roots_batch(polys, method=method, return_status=True)
+    elapsed = time.perf_counter() - start
+    print(color(f"{len(polys):,} 个多项式求根，用时 {elapsed * 1000:.2f} 毫秒 {CatgirlEmoji.EXCITED}", T.OKGREEN))
+    if unconverged:
+        listed = ", ".join(f"#{i + 1}" for i in unconverged[:10]) + (" ..." if len(unconverged) > 10 else "")
+        print(color(f"有 {len(unconverged)} 个多项式迭代 {EquationSolver.ROOT_MAXITER} 次还没收敛，"
+                    f"它们的根可能不准喵: {listed} {CatgirlEmoji.SAD}", T.WARNING))
+    n = len(roots)
+    shown = list(range(n)) if n <= 2 * rows else list(range(rows)) + [None] + list(range(n - rows, n))
+    for i in shown:
+        if i is None:
+            print("  ...")
+            continue
+        preview = ", ".join(fmt_num(z) for z in roots[i][:4])
+        more = f" ... (共 {len(roots[i])} 个)" if len(roots[i]) > 4 else ""
+        print(f"  #{i + 1}\t{preview}{more}")
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            for found in roots:
+                f.write("\t".join(repr(z) for z in found) + "\n")
+    return roots
+
+def equation_mode():
+    """方程求解模式（猫娘版）喵~"""
+    print(color(f"=== 猫娘方程求解模式 === {CatgirlEmoji.EXCITED}", T.HEADER))
+    
+    while True:
+        print("\n可以选的方程类型喵:")
+        print("1. 线性方程喵 (ax + b = 0)")
+        print("2. 二次方程喵 (ax² + bx + c = 0)")
+        print("3. 任意次多项式喵 (aₙxⁿ + ... + a₁x + a₀ = 0)")
+        print("4. 批量求根喵 (从文件读多项式，一行一个)")
+        print("5. 返回主菜单喵")
+        
+        choice = input("选择方程类型喵: ").strip()
+        
+        if choice == '5':
+            print(f"{CatgirlEmoji.WINK} 好的喵，返回主菜单喵~")
+            break
+        
+        try:
+            if choice == '1':
+                a = float(input("输入 a 喵: "))
+                b = float(input("输入 b 喵: "))
+                result = EquationSolver.solve_linear(a, b)
+                print(color(result, T.OKGREEN))
+                
+            elif choice == '2':
+                a = float(input("输入 a 喵: "))
+                b = float(input("输入 b 喵: "))
+                c = float(input("输入 c 喵: "))
+                result = EquationSolver.solve_quadratic(a, b, c)
+                print(color(result, T.OKGREEN))
+
+            elif choice == '3':
+                coeffs = read_coefficients("输入系数喵 (从最高次往下，空格隔开): ")
+                start = time.perf_counter()
+                result = EquationSolver.solve_polynomial(coeffs)
+                elapsed = time.perf_counter() - start
+                print(color(result, T.OKGREEN))
+                print(f"{CatgirlEmoji.HAPPY} 用时 {elapsed * 1000:.2f} 毫秒喵~")
+
+            elif choice == '4':
+                path = input("多项式文件路径喵: ").strip()
+                method = input("方法喵 (aberth/companion，回车默认 aberth): ").strip() or 'aberth'
+                output = input("结果写到哪个文件喵 (回车不写): ").strip() or None
+                run_root_batch(path, output, method)
+                if output:
+                    print(f"{CatgirlEmoji.HAPPY} 根已经写进 {output} 喵~")
+            else:
+                print(color(f"无效选择喵，重新选好不好喵~{CatgirlEmoji.CONFUSED}", T.WARNING))
+                
+        except OSError as e:
+            print(color(f"文件读写失败喵: {e} {CatgirlEmoji.SAD}", T.FAIL))
+        except ValueError as e:
+            print(color(f"请输入有效的数字喵~ {e} {CatgirlEmoji.SAD}", T.WARNING))
+
+# ------------------ 矩阵计算模式 ------------------
+MATRIX_SHOW_LIMIT = 8  # 超过这么多行/列就只显示四个角喵~
+
+def show_matrix(m, title="结果矩阵喵:"):
+    """打印矩阵喵~ 大矩阵只显示四个角"""
+    sparse = f", 稀疏, 非零元 {m.nnz}" if isinstance(m, CatgirlSparseMatrix) else ""
+    print(color(f"{title} ({m.rows}x{m.cols}{sparse})", T.OKGREEN))
+    half = MATRIX_SHOW_LIMIT // 2
+    row_ids = range(m.rows) if m.rows <= MATRIX_SHOW_LIMIT else [*range(half), None, *range(m.rows - half, m.rows)]
+    col_ids = range(m.cols) if m.cols <= MATRIX_SHOW_LIMIT else [*range(half), None, *range(m.cols - half, m.cols)]
+    for i in row_ids:
+        if i is None:
+            print('  ...')
+            continue
+        print([('...' if j is None else fmt_num(m[i, j])) for j in col_ids])
+
+def input_matrix(name, rows=None, cols=None, ones=False):
+    """读入一个矩阵喵~ 输入文件名就从文件读 (.mtx/.coo 是稀疏矩阵)，直接回车就一行一行手动输入
+    ones=True 时输入 ones 得到一列全是 1 的右端，大方程组不用手敲喵~"""
+    hint = "，ones 用全 1 向量" if ones else ""
+    path = input(f"{name}: 输入文件名从文件读喵 (直接回车手动输入{hint}): ").strip()
+    if ones and path.lower() == 'ones':
+        return CatgirlMatrix.from_flat(rows, 1, array('d', [1.0]) * rows)
+    if path:
+        file_cols = None
+        if CatgirlDataFile.detect_format(path) == 'binary':
+            # 原始 float64 文件里没有形状，列数不知道就问一下喵~
+            file_cols = cols
+            if file_cols is None:
+                text = input(f"{name}的列数喵 (二进制文件没有记形状，直接回车当成方阵): ").strip()
+                file_cols = int(text) if text else None
+            if file_cols is not None and file_cols <= 0:
+                raise ValueError("列数要是正整数喵~")
+        m = MatrixCalculator.load_matrix(path, file_cols)
+        kind = f"稀疏矩阵 (非零元 {m.nnz} 个)" if isinstance(m, CatgirlSparseMatrix) else "矩阵"
+        print(color(f"读到了 {m.rows}x{m.cols} 的{kind}喵~ {CatgirlEmoji.HAPPY}", T.OKGREEN))
+        return m
+    if rows is None:
+        rows = int(input(f"{name}的行数喵: "))
+    if cols is None:
+        cols = int(input(f"{name}的列数喵: "))
+    if rows <= 0 or cols <= 0:
+        raise ValueError("行数和列数都要是正整数喵~")
+    return MatrixCalculator.create_matrix(rows, cols)
+
+def matrix_mode():
+    """矩阵计算模式（猫娘版）喵~"""
+    print(color(f"=== 猫娘矩阵计算模式 === {CatgirlEmoji.EXCITED}", T.HEADER))
+    backend = "NumPy" if NUMPY_AVAILABLE else "纯 Python 分块"
+    print(color(f"矩阵后端: {backend} 喵~ 矩阵可以从文本/.npy/.bin 文件读进来，"
+                f".mtx/.coo 文件读成稀疏矩阵", T.OKBLUE))
+    matrix_calc = MatrixCalculator()
+    
+    while True:
+        print("\n可以选的操作喵:")
+        print("1. 矩阵加法喵")
+        print("2. 矩阵乘法喵")
+        print("3. 计算行列式喵")
+        print("4. 求逆矩阵喵")
+        print("5. 解线性方程组 AX=B 喵")
+        print("6. 返回主菜单喵")
+        
+        choice = input("选择操作喵: ").strip()
+        
+        if choice == '6':
+            print(f"{CatgirlEmoji.WINK} 好的喵，返回主菜单喵~")
+            break
+        
+        try:
+            if choice == '1':
+                matrix1 = input_matrix("第一个矩阵")
+                matrix2 = input_matrix("第二个矩阵", matrix1.rows, matrix1.cols)
+                result = matrix_calc.matrix_add(matrix1, matrix2)
+            elif choice == '2':
+                matrix1 = input_matrix("第一个矩阵")
+                matrix2 = input_matrix("第二个矩阵", rows=matrix1.cols)
+                result = matrix_calc.matrix_multiply(matrix1, matrix2)
+            elif choice == '3':
+                matrix = input_matrix("方阵")
+                result = matrix_calc.matrix_determinant(matrix)
+                if not isinstance(result, str):
+                    print(color(f"行列式 = {fmt_num(result)} {CatgirlEmoji.HAPPY}", T.OKGREEN))
+                    continue
+            elif choice == '4':
+                matrix = input_matrix("方阵")
+                result = matrix_calc.matrix_inverse(matrix)
+            elif choice == '5':
+                matrix1 = input_matrix("系数矩阵 A")
+                matrix2 = input_matrix("右端 B", rows=matrix1.rows, cols=1, ones=True)
+                if isinstance(matrix1, CatgirlSparseMatrix) and matrix1.rows == matrix1.cols \
+                        and matrix2.rows == matrix1.rows:
+                    result, iterations, residual, method = matrix_calc.sparse_solve(
+                        matrix1, matrix_calc.to_dense(matrix2))
+                    print(color(f"{method.upper()} 迭代了 {iterations} 次，相对残差 {residual:.3g} 喵~",
+                                T.OKBLUE))
+                    if result is None:
+                        result = "还没收敛喵~ 这个方程组可能太病态了"
+                else:
+                    result = matrix_calc.matrix_solve(matrix1, matrix2)
+            else:
+                print(color(f"无效选择喵，重新选好不好喵~{CatgirlEmoji.CONFUSED}", T.WARNING))
+                continue
+            
+            if isinstance(result, str):
+                print(color(result, T.WARNING))
+                continue
+            show_matrix(result)
+            print(CatgirlDialog.encourage())
+            path = input("要把结果存进文件吗喵？(输入文件名，直接回车跳过): ").strip()
+            if path:
+                matrix_calc.save_matrix(path, result)
+                print(color(f"存好了喵~ {CatgirlEmoji.HAPPY}", T.OKGREEN))
+                
+        except (ValueError, OSError) as e:
+            print(color(f"输入错误了喵: {e} {CatgirlEmoji.SAD}", T.WARNING))
+
+# ------------------ SymPy符号计算模式 ------------------
+def sympy_catgirl_mode():
+    """SymPy 符号计算模式（猫娘版）喵~ 算过的问题会记住，再问马上回答"""
+    global SYMPY_TIMEOUT
+    if not SYMPY_AVAILABLE:
+        print(color(f"SymPy库没有安装，符号计算用不了喵... {CatgirlEmoji.SAD}", T.FAIL))
+        return
+    
+    sympy_calc = CatgirlSymPyCalculator()
+    print(color(f"=== 猫娘SymPy符号计算模式 === {CatgirlEmoji.EXCITED}", T.HEADER))
+    
+    def show(label, success, result):
+        print(color(f"{label}: {result}" if success else result, T.OKGREEN if success else T.WARNING))
+    
+    while True:
+        print("\n可以选的功能喵:")
+        print("1. 创建符号变量喵")
+        print("2. 求解方程喵")
+        print("3. 求解方程组喵")
+        print("4. 计算导数喵")
+        print("5. 计算积分喵")
+        print("6. 计算极限喵")
+        print("7. 表达式简化喵")
+        print("8. 表达式展开喵")
+        print("9. 因式分解喵")
+        print("10. 级数展开喵")
+        print("11. 绘制函数图像喵")
+        print("12. 网格求值 (数值表格) 喵")
+        print("13. 查看已定义的符号喵")
+        print("14. 缓存和超时设置喵")
+        print("15. 返回主菜单喵")
+        
+        choice = input("选择符号计算功能喵: ").strip()
+        if choice == '15':
+            print(f"{CatgirlEmoji.WINK} 好的喵，返回主菜单喵~")
+            break
+        
+        try:
+            if choice == '1':
+                names = input("输入符号名称喵 (比如: x y z): ").strip()
+                success, result = sympy_calc.create_symbols(names)
+                print(color(result, T.OKGREEN if success else T.WARNING))
+            elif choice == '2':
+                equation = input("输入方程喵 (比如: x**2 - 4 = 0): ").strip()
+                variable = input("求解哪个变量喵: ").strip()
+                show("解", *sympy_calc.solve_equation(equation, variable))
+            elif choice == '3':
+                n = int(input("有几个方程喵: "))
+                equations = [input(f"第{i+1}个方程喵: ").strip() for i in range(n)]
+                variables = input("求解哪些变量喵 (空格分隔): ").split()
+                show("解", *sympy_calc.solve_equation_system(equations, variables))
+            elif choice == '4':
+                expr = input("输入表达式喵: ").strip()
+                var = input("对哪个变量求导喵: ").strip()
+                order = int(input("求几阶导数喵 (默认1): ") or "1")
+                show("导数", *sympy_calc.calculate_derivative(expr, var, order))
+            elif choice == '5':
+                expr = input("输入表达式喵: ").strip()
+                var = input("积分变量喵: ").strip()
+                bounds = input("定积分的上下限喵 (比如: 0 pi，直接回车是不定积分): ").split()
+                definite = tuple(sympy_calc.parse_expression(b) for b in bounds) if bounds else None
+                show("积分结果", *sympy_calc.calculate_integral(expr, var, definite))
+            elif choice == '6':
+                expr = input("输入表达式喵: ").strip()
+                var = input("变量喵: ").strip()
+                point = sympy_calc.parse_expression(input("趋近于哪里喵 (比如: 0, oo, -oo): ").strip())
+                show("极限", *sympy_calc.calculate_limit(expr, var, point))
+            elif choice == '7':
+                show("简化结果", *sympy_calc.simplify_expression(input("输入表达式喵: ").strip()))
+            elif choice == '8':
+                show("展开结果", *sympy_calc.expand_expression(input("输入表达式喵: ").strip()))
+            elif choice == '9':
+                show("因式分解", *sympy_calc.factor_expression(input("输入表达式喵: ").strip()))
+            elif choice == '10':
+                expr = input("输入表达式喵: ").strip()
+                var = input("展开变量喵: ").strip()
+                point = sympy_calc.parse_expression(input("在哪一点展开喵 (默认0): ").strip() or "0")
+                n = int(input("展开到几阶喵 (默认6): ") or "6")
+                show("级数展开", *sympy_calc.series_expansion(expr, var, point, n))
+            elif choice == '11':
+                expr = input("输入函数表达式喵: ").strip()
+                var = input("变量名喵: ").strip()
+                x_min = float(input("x最小值喵 (默认-10): ") or "-10")
+                x_max = float(input("x最大值喵 (默认10): ") or "10")
+                success, result = sympy_calc.plot_function(expr, var, (x_min, x_max))
+                print(color(result, T.OKGREEN if success else T.WARNING))
+            elif choice == '12':
+                expr = input("输入表达式喵: ").strip()
+                variables = input("变量喵 (一个或两个，空格分隔): ").split()
+                specs = [input(f"{v} 的取值喵 (比如 0:10:0.01，或者文件名): ").strip() for v in variables]
+                start = time.perf_counter()
+                success, result = sympy_calc.evaluate_grid(expr, variables, specs)
+                elapsed = time.perf_counter() - start
+                if not success:
+                    print(color(result, T.WARNING))
+                    continue
+                axes, values = result
+                if len(axes) == 1:
+                    show_batch(expr, axes[0], values, elapsed)
+                    table = None
+                else:
+                    table = CatgirlMatrix(len(axes[0]), len(axes[1]), values)
+                    print(color(f"{expr}: {table.rows}x{table.cols} 个点，用时 {elapsed * 1000:.2f} 毫秒 "
+                                f"(行是 {variables[0]}，列是 {variables[1]}) {CatgirlEmoji.EXCITED}", T.OKGREEN))
+                    show_matrix(table, "数值表格喵:")
+                path = input("要把结果存进文件吗喵？(输入文件名，直接回车跳过): ").strip()
+                if path:
+                    if table is None:
+                        write_batch(path, axes[0], values)
+                    else:
+                        MatrixCalculator.save_matrix(path, table)
+                    print(color(f"存好了喵~ {CatgirlEmoji.HAPPY}", T.OKGREEN))
+            elif choice == '13':
+                names = ', '.join(sympy_calc.symbols_dict) or "还没有喵"
+                print(color(f"已经定义的符号喵: {names}", T.OKBLUE))
+            elif choice == '14':
+                hits, parsed, results = sympy_cache_info()
+                print(color(f"解析缓存 {parsed} 条 (命中 {hits} 次)，结果缓存 {results} 条，"
+                            f"超时 {SYMPY_TIMEOUT:g} 秒喵~", T.OKBLUE))
+                answer = input("新的超时秒数喵 (直接回车不改，输入 clear 清空缓存): ").strip().lower()
+                if answer == 'clear':
+                    clear_sympy_cache()
+                    print(color(f"缓存清空了喵~ {CatgirlEmoji.HAPPY}", T.OKGREEN))
+                elif answer:
+                    SYMPY_TIMEOUT = max(float(answer), 0.1)
+                    print(color(f"超时设成 {SYMPY_TIMEOUT:g} 秒了喵~ {CatgirlEmoji.HAPPY}", T.OKGREEN))
+            else:
+                print(color(f"无效选择喵，重新选好不好喵~{CatgirlEmoji.CONFUSED}", T.WARNING))
+        except (ValueError, TypeError, SyntaxError, sp.SympifyError) as e:
+            print(color(f"输入错误了喵: {e} {CatgirlEmoji.SAD}", T.WARNING))
+        except KeyboardInterrupt:
+            print(color(f"\n好的喵，这次不算了~ {CatgirlEmoji.WINK}", T.WARNING))
+
+# ------------------ 异步计算模式 ------------------
+FIB_LIST_LIMIT = 10000  # 超过这么多项就不再整列放进内存了喵~
+
+def async_calculation_mode(task_manager):
+    """异步计算模式（猫娘版）喵~"""
+    print(color(f"=== 猫娘异步计算模式 === {CatgirlEmoji.EXCITED}", T.HEADER))
+    print("可以用的异步计算喵:")
+    print("1. 大数阶乘喵")
+    print("2. 斐波那契数列喵")
+    print("3. 素数计算喵")
+    print("4. 素数个数 π(x) 喵")
+    print("5. π的近似值喵")
+    print("6. 查看任务状态喵")
+    print("7. 取消任务喵")
+    print("8. 设置任务截止时间喵")
+    print("9. 返回主菜单喵")
+    
+    while True:
+        choice = input("\n选择异步计算类型喵: ").strip()
+        
+        if choice == '9':
+            print(f"{CatgirlEmoji.WINK} 好的喵，返回主菜单喵~")
+            break
+        
+        if choice == '7':
+            try:
+                task_id = int(input("要取消的任务ID喵: ").strip())
+            except ValueError:
+                print(color(f"无效的任务ID喵~{CatgirlEmoji.CONFUSED}", T.WARNING))
+                continue
+            if task_manager.cancel_task(task_id):
+                print(color(f"已经请任务{task_id}停下来了喵~ {CatgirlEmoji.WINK}", T.OKCYAN))
+            else:
+                print(color(f"任务{task_id}不存在或者已经结束了喵~", T.WARNING))
+            continue
+        
+        if choice == '8':
+            current = task_manager.default_timeout
+            raw = input(f"新任务的截止时间(秒，0=不限时，现在是{current or '不限时'})喵: ").strip()
+            try:
+                seconds = float(raw)
+            except ValueError:
+                print(color(f"请输入有效的数字喵~{CatgirlEmoji.SAD}", T.WARNING))
+                continue
+            task_manager.default_timeout = seconds if seconds > 0 else None
+            print(color(f"之后提交的任务截止时间: {task_manager.default_timeout or '不限时'} 喵~", T.OKGREEN))
+            continue
+        
+        if choice == '6':
+            # 查看任务状态
+            task_id = input("输入任务ID喵: ").strip()
+            try:
+                task_id = int(task_id)
+                completed, result = task_manager.get_result(task_id)
+                if completed is None:
+                    progress = task_manager.get_progress(task_id)
+                    if progress:
+                        fraction, elapsed, description = progress
+                        result = f"{result} {description} {fraction:.1%}，已用 {elapsed:.1f}秒"
+                    print(color(f"任务{task_id}: {result}", T.WARNING))
+                elif completed:
+                    print(color(f"任务{task_id}结果喵: {fmt_task_result(result)} {CatgirlEmoji.HAPPY}", T.OKGREEN))
+                else:
+                    print(color(f"任务{task_id}错误喵: {result}", T.FAIL))
+            except ValueError:
+                print(color(f"无效的任务ID喵~{CatgirlEmoji.CONFUSED}", T.WARNING))
+            continue
+        
+        try:
+            if choice == '1':
+                n = float(input("输入阶乘数字喵: "))
+                digits_only = input("只要位数和首尾数字喵？(y/n): ").strip().lower() == 'y'
+                print(color("提交大数阶乘计算任务喵...", T.OKCYAN))
+                task_id = task_manager.submit_task(CatgirlHighPerformanceCalculator.large_factorial, n, digits_only)
+                print(color(f"任务已提交，ID: {task_id} {CatgirlEmoji.HAPPY}", T.OKGREEN))
+                
+            elif choice == '2':
+                n = int(input("输入斐波那契数列长度(或第几项)喵: "))
+                mode = input("要整个数列(s)、只要第n项(n)、还是写进文件(f)喵？(直接回车自动选): ").strip().lower()
+                if not mode:
+                    mode = 's' if n <= FIB_LIST_LIMIT else 'n'
+                print(color("提交斐波那契计算任务喵...", T.OKCYAN))
+                if mode == 'n':
+                    task_id = task_manager.submit_task(CatgirlHighPerformanceCalculator.fibonacci_nth, n)
+                elif mode == 'f':
+                    path = input("输出文件名喵 (直接回车=fibonacci.txt): ").strip() or "fibonacci.txt"
+                    task_id = task_manager.submit_task(CatgirlHighPerformanceCalculator.fibonacci_to_file, n, path)
+                else:
+                    task_id = task_manager.submit_task(CatgirlHighPerformanceCalculator.fibonacci_sequence, n)
+                print(color(f"任务已提交，ID: {task_id} {CatgirlEmoji.HAPPY}", T.OKGREEN))
+                
+            elif choice == '3':
+                limit = int(input("输入素数上限喵: "))
+                lower = input("输入素数下限喵 (直接回车=2): ").strip()
+                lower = int(lower) if lower else 2
+                print(color("提交素数计算任务喵...", T.OKCYAN))
+                task_id = task_manager.submit_task(CatgirlHighPerformanceCalculator.prime_numbers, limit, lower)
+                print(color(f"任务已提交，ID: {task_id} {CatgirlEmoji.HAPPY}", T.OKGREEN))
+                
+            elif choice == '4':
+                x = int(float(input("输入上限 x 喵 (可以写 1e12): ")))
+                workers = input(f"用几个进程喵 (直接回车=自动，本机{os.cpu_count()}核): ").strip()
+                workers = int(workers) if workers else None
+                print(color("提交素数计数任务喵...", T.OKCYAN))
+                task_id = task_manager.submit_task(CatgirlHighPerformanceCalculator.prime_count, x, workers)
+                print(color(f"任务已提交，ID: {task_id} {CatgirlEmoji.HAPPY}", T.OKGREEN))
+                
+            elif choice == '5':
+                precision = int(input("输入π的计算精度喵 (步数): "))
+                print(color("提交π计算任务喵...", T.OKCYAN))
+                task_id = task_manager.submit_task(CatgirlHighPerformanceCalculator.calculate_pi, precision)
+                print(color(f"任务已提交，ID: {task_id} {CatgirlEmoji.HAPPY}", T.OKGREEN))
+            else:
+                print(color(f"喵娘不明白这个选择喵，重新选好不好喵~{CatgirlEmoji.CONFUSED}", T.WARNING))
+                
+        except ValueError:
+            print(color(f"请输入有效的数字喵~{CatgirlEmoji.SAD}", T.WARNING))
+
+# ------------------ 猫娘主菜单 ------------------
+def show_main_menu():
+    """显示猫娘主菜单喵~"""
+    sympy_status = "✓" if SYMPY_AVAILABLE else "✗"
+    menu = f"""
+=== 猫娘计算器 v7.0 超萌模式 === {CatgirlEmoji.EXCITED}
+SymPy符号计算: {sympy_status} (pip install sympy喵~)
+ 1. 基础计算模式 (喵呜~)
+ 2. 统计计算模式 (多线程加速喵~)
+ 3. 进制转换模式 (喵喵~)
+ 4. 单位换算模式 (喵呜喵呜~)
+ 5. 方程求解模式 (喵~)
+ 6. 矩阵计算模式 (喵呜~)
+ 7. 异步计算模式 (超快喵~)
+ 8. SymPy符号计算 (新功能喵~)
+ 9. 设置精度 (喵呜~)
+10. 查看历史记录 (喵~)
+11. 帮助信息 (喵呜喵呜~)
+12. 批量计算模式 (一整列一起算喵~)
+ 0. 退出程序 (不要走喵~)
+===================================== {CatgirlEmoji.PRAYING}
+    """
+    print(color(menu, T.HEADER))
+
+def show_help():
+    """显示猫娘帮助信息喵~"""
+    sympy_features = f"""
+SymPy符号计算模式喵:
+- 符号变量创建和管理喵~
+- 代数方程求解（包括方程组）喵~
+- 微积分运算（导数、积分、极限）喵~
+- 表达式简化、展开、因式分解喵~
+- 泰勒级数展开喵~
+- 算过的问题都会记住，重复提问马上回答；太难的运算超时就停下来喵~
+- 函数图像绘制 (编译成数值函数后自适应采样) 和网格求值喵~""" if SYMPY_AVAILABLE else ""
+    
+    help_text = f"""
+=== 猫娘帮助信息喵~ === {CatgirlEmoji.HAPPY}
+基础计算模式喵: 支持各种数学运算、三角函数、复数运算等，也能直接输入整条表达式 (可以带变量) 喵~
+统计计算模式喵: 多线程加速计算统计值喵~
+进制转换模式喵: 支持2-36进制之间的任意转换喵~ 几十万位的大数也能秒转，@文件名 从文件读数喵~
+  整个文件批量转换: python CATCALCv7.0.py base 16 2 in.txt out.txt (输入可以是 - 标准输入)
+单位换算模式喵: 支持长度、重量、温度、面积、体积、速度换算喵~ 数值换成范围或数据文件就整列一起换算喵~
+  任意单位: 按量纲换算 kg*m/s^2 → N、km/h → m/s、kWh → MJ 这样的复合单位喵~
+方程求解模式喵: 求解线性、二次和任意次多项式方程，还能从文件批量求根喵~
+矩阵计算模式喵: 任意大小的加法、乘法、行列式、逆矩阵和解方程组喵~ 矩阵可以从文本/.npy/.bin 文件读，装了 NumPy 会更快喵~
+  .mtx/.coo 文件读成稀疏矩阵，解方程组用 CG/GMRES 迭代，百万阶也放得下喵~
+异步计算模式喵: 大数阶乘、斐波那契、素数计算、素数个数π(x)、π计算等喵~
+批量计算模式喵: 一个运算或表达式算一整列输入 (范围、文件、标准输入)，有 NumPy 时整列一起算喵~
+  命令行也可以: python CATCALCv7.0.py batch "x**2+sin(x)" 0:10:0.001 out.txt
+{sympy_features}
+
+多线程特性喵:
+- 后台异步计算，不阻塞主界面喵~
+- 实时进度条显示喵~
+- 任务状态查询喵~
+- 并行加速统计计算喵~
+
+猫娘特色喵:
+- 全程猫娘语音陪伴喵~
+- 萌系表情和语气词喵~
+- 随机卖萌和鼓励喵~
+- 猫娘专属进度条喵~
+- 秒开主菜单: SymPy、NumPy 和插件都是第一次用到才加载喵~
+
+特殊命令喵:
+  prec - 设置显示精度喵~
+  hist - 查看历史记录喵~
+  help - 显示帮助信息喵~
+====================== {CatgirlEmoji.LOVING}
+"""
+    print(color(help_text, T.OKCYAN))
+
+# ------------------ 猫娘性能测试 ------------------
+def _legacy_prime_numbers(limit):
+    """旧版试除法素数计算，只给性能测试做对比喵~"""
+    primes = []
+    for num in range(2, limit + 1):
+        is_prime = True
+        for i in range(2, int(math.sqrt(num)) + 1):
+            if num % i == 0:
+                is_prime = False
+                break
+        if is_prime:
+            primes.append(num)
+        if num % 1000 == 0:
+            time.sleep(0.001)
+    return primes
+
+def _bench_time(func, *args):
+    """计时小工具喵~ 返回 (结果, 秒数)"""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def bench_primes():
+    """分段筛 vs 试除法喵~"""
+    for limit in (10**4, 10**5, 10**6):
+        new, t_new = _bench_time(lambda n: list(CatgirlPrimeSieve.iter_primes(2, n + 1)), limit)
+        old, t_old = _bench_time(_legacy_prime_numbers, limit)
+        assert new == old
+        print(f"  上限 {limit:>9,}: 试除法 {t_old:8.3f}秒  分段筛 {t_new:8.4f}秒  快了 {t_old / t_new:7.1f} 倍喵")
+    for limit in (10**7, 10**8):
+        count, t_new = _bench_time(CatgirlPrimeSieve.count_primes, 2, limit + 1)
+        print(f"  上限 {limit:>9,}: 分段筛数出 {count:,} 个素数，用时 {t_new:.3f}秒喵")
+    lo = 10**10 - 10**6
+    count, t_new = _bench_time(CatgirlPrimeSieve.count_primes, lo, 10**10)
+    print(f"  区间 [{lo:,}, 10^10): {count:,} 个素数，用时 {t_new:.3f}秒喵")
+
+def bench_prime_count():
+    """π(x): Lucy_Hedgehog vs 分段筛数数喵~"""
+    for limit in (10**7, 10**8):
+        sieved, t_sieve = _bench_time(CatgirlPrimeSieve.count_primes, 2, limit + 1)
+        counted, t_lucy = _bench_time(CatgirlPrimeCounter.count, limit, 1)
+        assert counted == sieved
+        print(f"  π({limit:,}) = {counted:,}: 分段筛 {t_sieve:7.3f}秒  Lucy {t_lucy:7.4f}秒  快了 {t_sieve / t_lucy:6.1f} 倍喵")
+    workers = os.cpu_count() or 1
+    for limit in (10**10, 10**11):
+        one, t_one = _bench_time(CatgirlPrimeCounter.count, limit, 1)
+        many, t_many = _bench_time(CatgirlPrimeCounter.count, limit, workers)
+        assert one == many
+        print(f"  π(10^{len(str(limit)) - 1}) = {one:,}: 单进程 {t_one:7.2f}秒  {workers}个进程 {t_many:7.2f}秒喵")
+
+def _legacy_expression(text, x):
+    """每次都重新解析、编译、求值，只给性能测试做对比喵~"""
+    return compile_expression.__wrapped__(text, ('x',))(x)
+
+def bench_expression():
+    """表达式: 缓存的编译结果 vs 每次重新解析喵~"""
+    text = "sin(x)**2 + cos(x)**2 + 3*x**2 - x/7 + √2*pi"
+    xs = [i / 1000 for i in range(10**5)]
+    expr = compile_expression(text, ('x',))
+    new, t_new = _bench_time(lambda: [expr(x) for x in xs])
+    old, t_old = _bench_time(lambda: [_legacy_expression(text, x) for x in xs[:2000]])
+    assert new[:2000] == old
+    t_old *= len(xs) / 2000
+    print(f"  {text}")
+    print(f"  {len(xs):,} 个点: 每次重新解析 {t_old:7.3f}秒(估算)  编译一次 {t_new:7.4f}秒  快了 {t_old / t_new:6.1f} 倍喵")
+    hand = lambda x: cmath.sin(x) ** 2 + cmath.cos(x) ** 2 + 3 * x ** 2 - x / 7 + cmath.sqrt(2) * math.pi
+    _, t_hand = _bench_time(lambda: [hand(x) for x in xs])
+    print(f"  手写的 Python 函数 {t_hand:7.4f}秒 (编译结果是它的 {t_new / t_hand:.2f} 倍时间)")
+
+def bench_batch():
+    """批量计算: NumPy 整列 vs 一个个算喵~"""
+    if not NUMPY_AVAILABLE:
+        print("  没装 NumPy，批量计算只能一个个算喵，跳过对比~")
+        return
+    xs = batch_inputs("0:1000:0.001")
+    for target in ('sin', '√', 'x**2 + sin(x)/3 - ln(x+1)'):
+        vector, t_vector = _bench_time(batch_evaluate, target, xs)
+        if target in OPS:
+            func, rest = OPS[target][1], [True] if OPS[target][3] else []
+            scalar, t_scalar = _bench_time(lambda: [func(x, *rest) for x in xs.tolist()])
+        else:
+            expr = compile_expression(target, ('x',))
+            scalar, t_scalar = _bench_time(lambda: [expr(x) for x in xs.tolist()])
+        assert np.allclose(np.asarray(scalar), vector)
+        print(f"  {target:28s} {len(xs):,} 个点: 逐个算 {t_scalar * 1000:8.1f}毫秒  "
+              f"整列 {t_vector * 1000:7.1f}毫秒  快了 {t_scalar / t_vector:5.1f} 倍喵")
+
+def _legacy_matrix_multiply(a, b):
+    """旧版三重循环矩阵乘法，只给性能测试做对比喵~"""
+    result = []
+    for i in range(len(a)):
+        row = []
+        for j in range(len(b[0])):
+            sum_val = 0
+            for k in range(len(a[0])):
+                sum_val += a[i][k] * b[k][j]
+            row.append(sum_val)
+        result.append(row)
+    return result
+
+def bench_matrix():
+    """矩阵: 分块乘法/LU vs 三重循环，以及 NumPy 后端喵~"""
+    rng = random.Random(7)
+    for n in (100, 200):
+        a = [[rng.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+        b = [[rng.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+        flat_a = CatgirlMatrix(n, n, array('d', itertools.chain.from_iterable(a)))
+        flat_b = CatgirlMatrix(n, n, array('d', itertools.chain.from_iterable(b)))
+        old, t_old = _bench_time(_legacy_matrix_multiply, a, b)
+        new, t_new = _bench_time(MatrixCalculator._blocked_multiply, flat_a, flat_b)
+        assert all(abs(new[i, j] - old[i][j]) < 1e-9 for i in range(n) for j in range(n))
+        _, t_lu = _bench_time(MatrixCalculator.lu_decompose, flat_a)
+        print(f"  {n}x{n} 乘法: 三重循环 {t_old:7.3f}秒  分块 {t_new:7.3f}秒  "
+              f"快了 {t_old / t_new:5.1f} 倍喵 | 纯 Python LU {t_lu:6.3f}秒")
+    if not NUMPY_AVAILABLE:
+        print("  没装 NumPy，跳过 BLAS/LAPACK 后端测试喵~")
+        return
+    n = 1000
+    noise = np.random.default_rng(7).standard_normal((n, n)) / (4 * math.sqrt(n))
+    a = CatgirlMatrix(n, n, np.eye(n) + noise)  # 条件数小，行列式也不会溢出喵~
+    b = CatgirlMatrix(n, 1, np.ones((n, 1)))
+    timings = []
+    for name, func, args in (("乘法", MatrixCalculator.matrix_multiply, (a, a)),
+                             ("行列式", MatrixCalculator.matrix_determinant, (a,)),
+                             ("逆矩阵", MatrixCalculator.matrix_inverse, (a,)),
+                             ("解方程组", MatrixCalculator.matrix_solve, (a, b))):
+        _, t = _bench_time(func, *args)
+        timings.append(f"{name} {t * 1000:.1f}毫秒")
+    print(f"  {n}x{n} NumPy 后端: " + "  ".join(timings) + " 喵")
+
+def _bench_sparse_system(n, per_row, seed=7):
+    """随机的对称、严格对角占优稀疏矩阵喵~ 每行大约 per_row 个非零元"""
+    pairs = n * per_row // 2
+    if NUMPY_AVAILABLE:
+        rng = np.random.default_rng(seed)
+        i, j, v = rng.integers(0, n, pairs), rng.integers(0, n, pairs), rng.uniform(-1, 1, pairs)
+        diag = np.bincount(i, np.abs(v), n) + np.bincount(j, np.abs(v), n) + 1.0
+        idx = np.arange(n)
+        return CatgirlSparseMatrix.from_coo(n, n, np.concatenate((i, j, idx)),
+                                            np.concatenate((j, i, idx)), np.concatenate((v, v, diag)))
+    rng = random.Random(seed)
+    r, c, v, diag = [], [], [], [1.0] * n
+    for _ in range(pairs):
+        i, j, x = rng.randrange(n), rng.randrange(n), rng.uniform(-1, 1)
+        r += [i, j]
+        c += [j, i]
+        v += [x, x]
+        diag[i] += abs(x)
+        diag[j] += abs(x)
+    return CatgirlSparseMatrix.from_coo(n, n, r + list(range(n)), c + list(range(n)), v + diag)
+
+def bench_sparse():
+    """稀疏矩阵: CSR 乘向量、稀疏乘稀疏和 CG/GMRES vs 稠密 LU 喵~"""
+    n = 1000 if NUMPY_AVAILABLE else 300  # 纯 Python 的稠密 LU 是 O(n³)，别等太久喵~
+    a = _bench_sparse_system(n, 6)
+    b = CatgirlMatrix.from_flat(n, 1, array('d', [1.0]) * n)
+    dense = a.to_dense()
+    _, t_dense = _bench_time(MatrixCalculator.matrix_solve, dense, b)
+    (_, it, _, method), t_sparse = _bench_time(MatrixCalculator.sparse_solve.__wrapped__, a, b)
+    print(f"  {n} 阶方程组 (每行约 6 个非零元): 稠密 LU {t_dense:7.3f}秒  "
+          f"稀疏 {method.upper()} {it} 步 {t_sparse:7.3f}秒喵")
+    n = 10**6 if NUMPY_AVAILABLE else 20000
+    a, t_build = _bench_time(_bench_sparse_system, n, 4)
+    ones = CatgirlIterativeSolver._vector([1.0] * n)
+    _, t_matvec = _bench_time(a.matvec, ones)
+    _, t_square = _bench_time(a.multiply_sparse, a)
+    b = CatgirlMatrix.from_flat(n, 1, array('d', [1.0]) * n)
+    (_, it_cg, res_cg, _), t_cg = _bench_time(MatrixCalculator.sparse_solve.__wrapped__, a, b, 'cg')
+    (_, it_gm, res_gm, _), t_gm = _bench_time(MatrixCalculator.sparse_solve.__wrapped__, a, b, 'gmres')
+    print(f"  {n:,} 阶, 非零元 {a.nnz:,}: 建矩阵 {t_build:.2f}秒  乘向量 {t_matvec * 1000:.1f}毫秒  "
+          f"A·A {t_square:.2f}秒")
+    print(f"    CG {it_cg} 步 {t_cg:.2f}秒 (残差 {res_cg:.1e})  GMRES {it_gm} 步 {t_gm:.2f}秒 (残差 {res_gm:.1e}) 喵")
+
+def _legacy_sympy_points(expr, var, xs):
+    """旧版一个点一个点代入 SymPy 表达式求值，只给性能测试做对比喵~"""
+    out = []
+    for x in xs:
+        try:
+            out.append(float(expr.evalf(subs={var: x})))
+        except TypeError:
+            out.append(math.nan)
+    return out
+
+def bench_sympy_numeric():
+    """SymPy 数值求值: 编译成数值函数 vs 逐点代入喵~"""
+    if not SYMPY_AVAILABLE:
+        print("  没装 SymPy，跳过喵~")
+        return
+    x, y = sp.symbols('x y')
+    sp.lambdify(x, x + 1, modules='numpy' if NUMPY_AVAILABLE else 'math')  # 先把 lambdify 自己的导入做掉喵~
+    for text in ('sin(x)/x + x**2/50', 'exp(-x**2)*cos(3*x) + sqrt(x**2 + 1)'):
+        expr = parse_sympy(text, ('x',))
+        xs = [(-10 + 20 * i / 1999) for i in range(2000)]
+        old, t_old = _bench_time(_legacy_sympy_points, expr, x, xs)
+        lambdify_sympy.cache_clear()
+        new, t_new = _bench_time(sympy_values, expr, (x,), (xs,))
+        assert all(math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-12) for a, b in zip(old, new))
+        (px, _), t_plot = _bench_time(sample_sympy, expr, x, -10.0, 10.0)
+        print(f"  {text:38s} 2000 个点: 逐点代入 {t_old:7.3f}秒  编译后 {t_new * 1000:7.2f}毫秒  "
+              f"快了 {t_old / t_new:6.0f} 倍喵 (含编译) | 自适应采样 {len(px)} 点 {t_plot * 1000:.1f}毫秒")
+    axis = batch_inputs("-5:5:0.01")
+    expr = parse_sympy('sin(x)*cos(y) + x*y/10', ('x', 'y'))
+    grid = np.meshgrid(axis, axis, indexing='ij') if NUMPY_AVAILABLE else None
+    if grid is not None:
+        _, t_grid = _bench_time(sympy_values, expr, (x, y), grid)
+        print(f"  网格求值 {len(axis)}x{len(axis)}: {t_grid * 1000:.1f}毫秒喵")
+
+def _legacy_base_n(num, base):
+    """旧版一位一位往前拼的进制转换，只给性能测试做对比喵~"""
+    digits = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    if num == 0:
+        return "0"
+    result = ""
+    while num > 0:
+        result = digits[num % base] + result
+        num //= base
+    return result
+
+def bench_base():
+    """进制转换: 幂表分治 vs 一位一位除喵~"""
+    rng = random.Random(11)
+    for digits in (10000, 30000, 100000, 1000000):
+        num = rng.getrandbits(int(digits * math.log2(10)))
+        BaseConverter.clear_cache()
+        for base in (7, 36):
+            text, t_new = _bench_time(BaseConverter.to_base, num, base)
+            back, t_parse = _bench_time(BaseConverter.from_base, text, base)
+            assert back == num
+            if digits <= 30000:
+                old, t_old = _bench_time(_legacy_base_n, num, base)
+                assert old == text
+                legacy = f"一位一位除 {t_old:7.3f}秒  快了 {t_old / t_new:6.1f} 倍喵"
+            else:
+                legacy = "一位一位除太慢了，跳过喵"
+            _, t_int = _bench_time(int, text, base)
+            print(f"  {digits:8d} 位十进制 → {base:2d} 进制: 分治 {t_new:7.3f}秒  {legacy} | "
+                  f"读回来: 分治 {t_parse:7.3f}秒  内置 int() {t_int:7.3f}秒")
+
+def bench_base_batch():
+    """批量进制转换: 整块 NumPy/流式 vs 一个个转换喵~"""
+    import tempfile
+    rng = random.Random(5)
+    count = 1000000
+    with tempfile.TemporaryDirectory() as tmp:
+        source, output = os.path.join(tmp, 'in.txt'), os.path.join(tmp, 'out.txt')
+        with open(source, 'w', encoding='ascii') as f:
+            f.write('\n'.join(format(rng.getrandbits(64), 'x') for _ in range(count)) + '\n')
+        with open(source, encoding='ascii') as f:
+            sample = f.read().split()[:100000]
+        for to_base in (2, 10, 36):
+            _, t_old = _bench_time(lambda: [_legacy_base_n(int(t, 16), to_base) for t in sample])
+            t_old *= count / len(sample)
+            _, t_new = _bench_time(convert_base_stream, source, 16, to_base, output)
+            with open(output, encoding='ascii') as f:
+                head = f.read(1 << 16).split()[:1000]
+            assert all(int(a, to_base) == int(b, 16) for a, b in zip(head, sample))
+            print(f"  {count} 个 64 位十六进制 → {to_base:2d} 进制: 一个个转换 {t_old:6.2f}秒(估算)  "
+                  f"批量 {t_new:6.2f}秒 ({count / t_new:,.0f} 个/秒)  快了 {t_old / t_new:5.1f} 倍喵")
+        with open(source, 'w', encoding='ascii') as f:
+            f.write('\n'.join(format(rng.getrandbits(20000), 'x') for _ in range(2000)) + '\n')
+        _, t_long = _bench_time(convert_base_stream, source, 16, 10, output)
+        print(f"  2000 个 2万位二进制的大数 → 10 进制: {t_long:.2f}秒 (进程池 {os.cpu_count()} 个进程)")
+
+def _legacy_unit_convert(value, from_unit, to_unit, factors):
+    """旧版每次都走一遍 if/elif 的单位换算 (温度六种情况手写)，只给性能测试做对比喵~"""
+    if from_unit == 'C' and to_unit == 'F':
+        return value * 9/5 + 32
+    elif from_unit == 'F' and to_unit == 'C':
+        return (value - 32) * 5/9
+    elif from_unit == 'C' and to_unit == 'K':
+        return value + 273.15
+    elif from_unit == 'K' and to_unit == 'C':
+        return value - 273.15
+    elif from_unit == 'F' and to_unit == 'K':
+        return (value - 32) * 5/9 + 273.15
+    elif from_unit == 'K' and to_unit == 'F':
+        return (value - 273.15) * 9/5 + 32
+    if from_unit in factors and to_unit in factors:
+        return value * factors[from_unit] / factors[to_unit]
+    return f"不支持的单位转换: {from_unit} -> {to_unit}"
+
+def bench_units():
+    """单位换算: 编译好的仿射变换整列乘加 vs 逐个走 if/elif 喵~"""
+    xs = batch_inputs("0:999999:1")
+    legacy_factors = {'mm': 0.001, 'cm': 0.01, 'm': 1, 'km': 1000, 'in': 0.0254, 'ft': 0.3048, 'mile': 1609.344}
+    UnitConverter._compiled = None
+    _, t_compile = _bench_time(UnitConverter.compile)
+    print(f"  编译换算图: {t_compile * 1000:.2f}毫秒 ({sum(len(key) == 3 for key in UnitConverter._compiled)} 对单位)")
+    for src, dst in (('mile', 'km'), ('F', 'K')):
+        old, t_old = _bench_time(lambda: [_legacy_unit_convert(x, src, dst, legacy_factors) for x in xs])
+        one, t_one = _bench_time(lambda: [UnitConverter.convert(x, src, dst) for x in xs])
+        new, t_new = _bench_time(UnitConverter.convert_many, xs, src, dst)
+        assert all(math.isclose(a, b, rel_tol=1e-12, abs_tol=1e-9) for a, b in zip(old[::997], new[::997]))
+        print(f"  {len(xs):,} 个 {src} → {dst}: 逐个 if/elif {t_old:6.3f}秒  逐个查表 {t_one:6.3f}秒  "
+              f"整列乘加 {t_new * 1000:7.2f}毫秒  快了 {t_old / t_new:6.1f} 倍喵")
+
+def _uncached_transform(from_unit, to_unit):
+    """每次都重新解析的量纲换算，只给性能测试做对比喵~"""
+    a, b = _UnitParser(from_unit).parse(), _UnitParser(to_unit).parse()
+    assert a.dims == b.dims
+    return float(a.scale / b.scale), float((a.offset - b.offset) / b.scale)
+
+def bench_dimensions():
+    """量纲分析: LRU 缓存的单位解析 vs 每次重新解析喵~"""
+    pairs = [('kg*m/s^2', 'N'), ('km/h', 'm/s'), ('J/(mol*K)', 'cal/(mol*K)'), ('kWh', 'MJ'), ('°F', 'K')]
+    rounds = 20000
+    for from_unit, to_unit in pairs:
+        old, t_old = _bench_time(lambda: [_uncached_transform(from_unit, to_unit)[0] * i for i in range(rounds)])
+        unit_transform.cache_clear()
+        parse_unit.cache_clear()
+        new, t_new = _bench_time(lambda: [convert_quantity(i, from_unit, to_unit) for i in range(rounds)])
+        assert all(math.isclose(a, b, rel_tol=1e-12) for a, b in zip(old, new) if not from_unit.startswith('°'))
+        print(f"  {from_unit:>12s} → {to_unit:<12s} 换算 {rounds} 次: 每次解析 {t_old:6.3f}秒  "
+              f"缓存 {t_new * 1000:6.2f}毫秒  快了 {t_old / t_new:6.1f} 倍喵")
+    print(f"  解析缓存: {parse_unit.cache_info()}")
+
+def _root_error(coeffs, roots):
+    """相对后向误差 max |p(z)| / Σ|a_i||z|^i，求根好不好就看它喵~"""
+    worst = 0.0
+    for z in roots:
+        value = scale = 0
+        for c in coeffs:
+            value = value * z + c
+            scale = scale * abs(z) + abs(c)
+        worst = max(worst, abs(value) / scale if scale else 0.0)
+    return worst
+
+def bench_polyroots():
+    """多项式求根: 单个 50 次多项式和整批文件，Aberth (NumPy/纯 Python) vs 伴随矩阵 vs SymPy 喵~"""
+    rng = random.Random(25)
+    coeffs = [rng.gauss(0, 1) for _ in range(51)]
+    EquationSolver.polynomial_roots(coeffs[:3])  # 先把延迟加载的 NumPy 导入进来，别算进计时喵~
+    roots, t_new = _bench_time(EquationSolver.polynomial_roots, coeffs)
+    print(f"  50 次多项式 Aberth{'(NumPy)' if NUMPY_AVAILABLE else ''}: {t_new * 1000:7.2f}毫秒  "
+          f"后向误差 {_root_error(coeffs, roots):.1e}")
+    if NUMPY_AVAILABLE:
+        roots, t_eig = _bench_time(EquationSolver.polynomial_roots_batch, [coeffs], None, None, 'companion')
+        print(f"  50 次多项式 伴随矩阵: {t_eig * 1000:7.2f}毫秒  后向误差 {_root_error(coeffs, roots[0]):.1e}")
+        monic, _ = EquationSolver._normalize(coeffs)
+        (roots, _), t_py = _bench_time(EquationSolver._aberth, monic, EquationSolver.ROOT_TOL, EquationSolver.ROOT_MAXITER)
+        print(f"  50 次多项式 纯 Python Aberth: {t_py * 1000:7.2f}毫秒  后向误差 {_root_error(coeffs, roots):.1e}")
+    if SYMPY_AVAILABLE:
+        x = sp.Symbol('x')
+        poly = sp.Poly([sp.Float(c) for c in coeffs], x)
+        roots, t_sym = _bench_time(poly.nroots, 15, 200)
+        print(f"  50 次多项式 SymPy nroots: {t_sym * 1000:7.2f}毫秒  (比 Aberth 慢 {t_sym / t_new:,.0f} 倍喵)")
+    polys = [[rng.gauss(0, 1) for _ in range(51)] for _ in range(1000)]
+    polys += [[rng.gauss(0, 1) for _ in range(rng.randint(2, 30))] for _ in range(500)]
+    methods = ('aberth', 'companion') if NUMPY_AVAILABLE else ('aberth',)
+    for method in methods:
+        (found, unconverged), t_batch = _bench_time(EquationSolver.polynomial_roots_batch, polys, None, None,
+                                                    method, True)
+        worst = max(_root_error(c, r) for c, r in zip(polys, found))
+        print(f"  {len(polys)} 个多项式 (1000 个 50 次 + 500 个 1~28 次) {method:9s}: {t_batch:6.3f}秒  "
+              f"({len(polys) / t_batch:,.0f} 个/秒)  最大后向误差 {worst:.1e}  没收敛 {len(unconverged)} 个")
+
+def _legacy_load_plugins(plug_dir):
+    """旧版每次启动把插件全部 import 一遍，只给性能测试做对比喵~"""
+    found = {}
+    sys.path.insert(0, plug_dir)
+    for fname in os.listdir(plug_dir):
+        if fname.endswith(".py") and not fname.startswith("_"):
+            found.update(getattr(__import__(fname[:-3]), "FUNC", {}))
+    sys.path.remove(plug_dir)
+    return found
+
+def bench_plugins():
+    """插件加载: 索引缓存+按需 import vs 每次全部 import 喵~"""
+    import tempfile
+    for count in (10, 100, 500):
+        with tempfile.TemporaryDirectory() as plug_dir:
+            names = [f"catbench{count}_{i}" for i in range(count)]
+            for i, name in enumerate(names):
+                with open(os.path.join(plug_dir, name + ".py"), 'w', encoding='utf-8') as f:
+                    f.write(f"import math\n\ndef f{i}(x):\n    return math.sin(x) + {i}\n\n"
+                            f"FUNC = {{'p{i}': ('插件{i}', f{i}, False, True)}}\n")
+            importlib.invalidate_caches()
+
+            def forget():
+                for name in names:
+                    sys.modules.pop(name, None)
+            _legacy_load_plugins(plug_dir)  # 先把 __pycache__ 生成好，对旧版公平喵~
+            forget()
+            old, t_old = _bench_time(_legacy_load_plugins, plug_dir)
+            forget()
+            _, t_cold = _bench_time(load_plugins, plug_dir)
+            forget()
+            new, t_warm = _bench_time(load_plugins, plug_dir)
+            assert new.keys() == old.keys()
+            value, t_first = _bench_time(new['p0'][1], 0.5)
+            assert value == old['p0'][1](0.5)
+            forget()
+        print(f"  {count:4d} 个插件: 全部 import {t_old * 1000:8.2f}毫秒 | 建索引 {t_cold * 1000:8.2f}毫秒  "
+              f"读索引 {t_warm * 1000:6.2f}毫秒  快了 {t_old / t_warm:5.1f} 倍喵 | 第一次调用才加载 {t_first * 1000:.2f}毫秒")
+
+STARTUP_TARGET = 0.1  # 主菜单要在这么多秒内出来喵~
+STARTUP_LAZY = ('sympy', 'numpy', 'concurrent.futures', 'multiprocessing')
+MENU_PROMPT = "主人要选择什么功能喵"
+
+def _time_to_menu(argv, rounds=5, env=None):
+    """开新的解释器跑计算器，量到主菜单的提示出现为止喵~ 返回每一轮的秒数"""
+    import subprocess
+    marker = MENU_PROMPT.encode('utf-8')
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        proc = subprocess.Popen(argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=env)
+        seen = b''
+        while marker not in seen:
+            chunk = proc.stdout.read1(65536)
+            if not chunk:
+                break
+            seen += chunk
+        elapsed = time.perf_counter() - start
+        proc.communicate(b'0\n')
+        if marker in seen:
+            times.append(elapsed)
+    return times
+
+def bench_startup():
+    """启动时间: 从敲下命令到主菜单出来要多久喵~ 目标是 100 毫秒以内"""
+    import subprocess, tempfile, shutil
+    here = os.path.dirname(os.path.abspath(__file__))
+    launcher = os.path.join(here, 'CATCALCv7.0.py')
+    bare = min(_time_to_menu([sys.executable, '-c', f'print({MENU_PROMPT!r})']))
+    print(f"  空解释器: {bare * 1000:.1f}毫秒")
+    with tempfile.TemporaryDirectory() as tmp:
+        # 拷一份到临时目录、不写字节码，每次都要重新编译本体，相当于装好后的第一次启动喵~
+        for name in ('CATCALCv7.0.py', 'catcalc_v7.py'):
+            shutil.copy(os.path.join(here, name), tmp)
+        cold = dict(os.environ, PYTHONDONTWRITEBYTECODE='1')
+        _time_to_menu([sys.executable, launcher], rounds=1)  # 先把 __pycache__ 生成好喵~
+        cases = (("第一次启动 (编译本体)", [sys.executable, os.path.join(tmp, 'CATCALCv7.0.py')], cold),
+                 ("平时启动 (字节码缓存)", [sys.executable, launcher], None))
+        for label, argv, env in cases:
+            times = sorted(_time_to_menu(argv, env=env))
+            if not times:
+                print(color(f"  {label}: 没等到主菜单喵~", T.FAIL))
+                continue
+            median = times[len(times) // 2]
+            verdict = color("达标喵", T.OKGREEN) if median < STARTUP_TARGET else color("超时了喵", T.WARNING)
+            print(f"  {label}: 中位数 {median * 1000:.1f}毫秒  最快 {times[0] * 1000:.1f}毫秒  "
+                  f"(目标 {STARTUP_TARGET * 1000:.0f}毫秒) {verdict}")
+    probe = ("import sys, time\n"
+             "sys.path.insert(0, sys.argv[1])\n"
+             "import catcalc_v7\n"
+             "print(','.join(m for m in sys.argv[2:] if m in sys.modules))\n"
+             "start = time.perf_counter()\n"
+             "catcalc_v7.sp and catcalc_v7.sp.Symbol('x')\n"
+             "print(time.perf_counter() - start)\n")
+    out = subprocess.run([sys.executable, '-c', probe, here, *STARTUP_LAZY],
+                         capture_output=True, text=True, check=True).stdout.splitlines()
+    print(f"  启动后已经加载的重模块: {out[0] or '没有'} (检查了 {', '.join(STARTUP_LAZY)})")
+    if SYMPY_AVAILABLE:
+        print(f"  第一次进符号计算时才加载 SymPy: {float(out[1]) * 1000:.0f}毫秒喵")
+
+def _legacy_factorial(n):
+    """旧版逐项相乘的阶乘，只给性能测试做对比喵~"""
+    result = 1
+    for i in range(1, n + 1):
+        result *= i
+        if i % 1000 == 0:
+            time.sleep(0.001)
+    return result
+
+def bench_factorial():
+    """素数摆动阶乘 vs 逐项相乘喵~"""
+    for n in (10**4, 5 * 10**4, 10**5):
+        new, t_new = _bench_time(CatgirlHighPerformanceCalculator.factorial_prime_swing, n)
+        old, t_old = _bench_time(_legacy_factorial, n)
+        assert new == old
+        print(f"  {n:>7,}!: 逐项相乘 {t_old:7.3f}秒  素数摆动 {t_new:7.4f}秒  快了 {t_old / t_new:6.1f} 倍喵")
+    value, t_new = _bench_time(CatgirlHighPerformanceCalculator.factorial_prime_swing, 10**6)
+    summary, t_sum = _bench_time(describe_big_int, value)
+    print(f"  1,000,000!: 素数摆动 {t_new:.3f}秒，摘要 {t_sum:.3f}秒 -> {summary}")
+
+def _run_tasks(task_manager, jobs):
+    """提交一批任务并等它们全部做完喵~ 返回用时"""
+    start = time.perf_counter()
+    ids = [task_manager.submit_task(func, *args, timeout=None) for func, args in jobs]
+    while any(task_manager.get_task_status(tid) in ('pending', 'running') for tid in ids):
+        time.sleep(0.01)
+    assert all(task_manager.get_result(tid)[0] for tid in ids)
+    return time.perf_counter() - start
+
+def bench_tasks():
+    """4个并发素数任务: 线程池 vs 进程池喵~"""
+    job = (CatgirlHighPerformanceCalculator.prime_numbers, (2 * 10**7,))
+    print(f"  CPU核数: {os.cpu_count()}")
+    for backend in ('thread', 'process'):
+        task_manager = CatgirlTaskManager(max_workers=4, backend=backend, process_workers=4)
+        _run_tasks(task_manager, [job])  # 预热，进程池要先把子进程拉起来喵~
+        t_one = _run_tasks(task_manager, [job])
+        t_four = _run_tasks(task_manager, [job] * 4)
+        task_manager.shutdown()
+        print(f"  {backend:7s}: 1个任务 {t_one:6.2f}秒  4个并发 {t_four:6.2f}秒  (4个/1个 = {t_four / t_one:.2f})")
+
+BENCHMARKS = {
+    'primes': ("素数: 分段筛 vs 试除法", bench_primes),
+    'primecount': ("素数个数 π(x): Lucy_Hedgehog vs 分段筛", bench_prime_count),
+    'factorial': ("阶乘: 素数摆动乘积树 vs 逐项相乘", bench_factorial),
+    'expr': ("表达式: 编译缓存 vs 每次重新解析", bench_expression),
+    'sympy': ("SymPy 数值求值: 编译成数值函数 vs 逐点代入", bench_sympy_numeric),
+    'batch': ("批量计算: NumPy 整列 vs 逐个计算", bench_batch),
+    'matrix': ("矩阵: 分块乘法/LU vs 三重循环", bench_matrix),
+    'sparse': ("稀疏矩阵: CSR 乘法与 CG/GMRES vs 稠密 LU", bench_sparse),
+    'tasks': ("任务后端: 线程池 vs 进程池", bench_tasks),
+    'base': ("进制转换: 幂表分治 vs 一位一位除", bench_base),
+    'basebatch': ("批量进制转换: 整块 NumPy/流式 vs 一个个转换", bench_base_batch),
+    'units': ("单位换算: 编译好的仿射变换 vs 逐个 if/elif", bench_units),
+    'dims': ("量纲分析: LRU 缓存的单位解析 vs 每次重新解析", bench_dimensions),
+    'roots': ("多项式求根: 单个 50 次和整批文件, Aberth vs 伴随矩阵 vs SymPy", bench_polyroots),
+    'startup': ("启动时间: 延迟加载后到主菜单", bench_startup),
+    'plugins': ("插件加载: 索引缓存+按需 import vs 每次全部 import", bench_plugins),
+}
+
+def run_benchmarks(names=None):
+    """运行性能测试喵~ 用法: python CATCALCv7.0.py bench [名字...]"""
+    names = names or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print(color(f"没有叫 {name} 的性能测试喵~ 可选: {', '.join(BENCHMARKS)}", T.WARNING))
+            continue
+        title, func = BENCHMARKS[name]
+        print(color(f"=== {title} === {CatgirlEmoji.CALCULATING}", T.HEADER))
+        func()
+
+# ------------------ 猫娘主循环 ------------------
+def main():
+    # 创建猫娘任务管理器
+    task_manager = CatgirlTaskManager(max_workers=4)
+    
+    sympy_notice = f"\n🧮 SymPy符号计算已经启用喵！" if SYMPY_AVAILABLE else f"\n⚠️  SymPy没有安装，符号计算功能不可用喵..."
+    
+    print(color(rf"""
+ /\_/\  
+( o.o ) 
+ > ^ <   猫娘计算器 v7.0 超萌模式启动喵！
+ 输入 help 查看所有功能，q 退出喵~
+ 💪 支持异步计算、多线程加速、符号计算喵！{sympy_notice}
+    """, T.HEADER))
+    
+    print(color(CatgirlDialog.greet(), T.OKGREEN))
+    
+    # 定期清理已完成任务喵~
+    def cleanup_task():
+        while True:
+            time.sleep(60)  # 每分钟清理一次喵~
+            task_manager.cleanup_completed()
+    
+    cleanup_thread = threading.Thread(target=cleanup_task, daemon=True)
+    cleanup_thread.start()
+    
+    while True:
+        try:
+            show_main_menu()
+            cmd = input(color("主人要选择什么功能喵？(输入数字喵): ", T.BOLD)).strip().lower()
+            
+            if cmd in ('0', 'q','quit','exit','bye'):
+                print(color(f"猫娘要休息了喵，再见喵主人~{CatgirlEmoji.SLEEPY}", T.OKBLUE))
+                task_manager.shutdown()
+                break
+            
+            if cmd == '1' or cmd == '':
+                calc_once()
+            elif cmd == '2':
+                stats_mode()
+            elif cmd == '3':
+                base_convert_mode()
+            elif cmd == '4':
+                unit_convert_mode()
+            elif cmd == '5':
+                equation_mode()
+            elif cmd == '6':
+                matrix_mode()
+            elif cmd == '7':
+                async_calculation_mode(task_manager)
+            elif cmd == '8':
+                sympy_catgirl_mode()
+            elif cmd == '9':
+                set_precision()
+            elif cmd == '10':
+                show_history()
+            elif cmd == '11' or cmd == 'help':
+                show_help()
+            elif cmd == '12':
+                batch_mode()
+            else:
+                print(color(f"喵娘不明白主人的选择喵，重新选好不好喵~{CatgirlEmoji.CONFUSED}", T.WARNING))
+                
+        except (KeyboardInterrupt, EOFError):
+            print(color(f"\n主人强行撸猫，猫娘要休息了喵~{CatgirlEmoji.SLEEPY}", T.WARNING))
+            task_manager.shutdown()
+            break
+        except Exception as e:
+            print(color(f"喵娘遇到了未知错误喵: {e} {CatgirlEmoji.SAD}", T.FAIL))
+            print(CatgirlDialog.comfort())
+            if input("要打印详细错误信息喵？(y/n): ").lower()=='y':
+                import traceback
+                traceback.print_exc()
+
+def cli(argv=None):
+    """命令行入口喵~ bench/batch/base 子命令，什么都不给就进主菜单；返回退出码"""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == 'bench':
+        run_benchmarks(argv[1:])
+    elif argv and argv[0] == 'batch':
+        return batch_cli(argv[1:])
+    elif argv and argv[0] == 'base':
+        return base_batch_cli(argv[1:])
+    else:
+        main()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(cli())